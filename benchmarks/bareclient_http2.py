@@ -0,0 +1,189 @@
+"""Benchmark the bareClient connection pool over HTTP/1.1 and HTTP/2.
+
+A local TLS server which speaks both protocols (selected by ALPN) answers
+each request after a fixed delay, simulating a small user lookup. The same
+number of concurrent requests is then made with the pool negotiating
+HTTP/1.1 and HTTP/2.
+
+Requires the openssl command to create a self-signed certificate.
+
+    PYTHONPATH=. python benchmarks/bareclient_http2.py
+"""
+
+import asyncio
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+from typing import Tuple
+
+import h11
+import h2.config
+import h2.connection
+import h2.events
+
+from jetblack_tweeter.clients.bareclient.pool import ConnectionPool
+
+RESPONSE_DELAY = 0.005
+BODY = b'{"data": {"id": "12", "name": "jack", "username": "jack"}}'
+
+
+class Server:
+    """A TLS server which speaks HTTP/1.1 and HTTP/2"""
+
+    def __init__(self) -> None:
+        self.connections = 0
+
+    async def handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        ssl_object = writer.get_extra_info('ssl_object')
+        try:
+            if ssl_object.selected_alpn_protocol() == 'h2':
+                await self._handle_h2(reader, writer)
+            else:
+                await self._handle_h11(reader, writer)
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _handle_h11(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h11.Connection(our_role=h11.SERVER)
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.EndOfMessage):
+                await asyncio.sleep(RESPONSE_DELAY)
+                writer.write(connection.send(h11.Response(
+                    status_code=200,
+                    headers=[('content-length', str(len(BODY)))]
+                )))
+                writer.write(connection.send(h11.Data(data=BODY)))
+                writer.write(connection.send(h11.EndOfMessage()))
+                await writer.drain()
+                connection.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                break
+
+    async def _handle_h2(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(
+                client_side=False,
+                header_encoding=None
+            )
+        )
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(RESPONSE_DELAY)
+            connection.send_headers(
+                stream_id,
+                [(b':status', b'200'), (b'content-length', str(len(BODY)).encode())]
+            )
+            connection.send_data(stream_id, BODY, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    asyncio.create_task(respond(event.stream_id))
+            writer.write(connection.data_to_send())
+
+
+def make_certificate(directory: str) -> Tuple[str, str]:
+    certfile = os.path.join(directory, 'cert.pem')
+    keyfile = os.path.join(directory, 'key.pem')
+    subprocess.run(
+        [
+            'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+            '-keyout', keyfile, '-out', certfile, '-days', '1',
+            '-subj', '/CN=localhost',
+            '-addext', 'subjectAltName=DNS:localhost'
+        ],
+        check=True,
+        capture_output=True
+    )
+    return certfile, keyfile
+
+
+async def run_client(
+        port: int,
+        certfile: str,
+        http2: bool,
+        requests: int,
+        concurrency: int
+) -> float:
+    ssl_context = ssl.create_default_context(cafile=certfile)
+    ssl_context.set_alpn_protocols(['h2', 'http/1.1'] if http2 else ['http/1.1'])
+    pool = ConnectionPool(max_per_host=10, http2=http2, ssl_context=ssl_context)
+    url = f'https://localhost:{port}/2/users/12'
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def lookup() -> None:
+        async with semaphore:
+            response = await pool.request('GET', url, [], None)
+            assert response.status == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(lookup() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await pool.close()
+    return elapsed
+
+
+async def main(requests: int = 5000, concurrency: int = 200) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        certfile, keyfile = make_certificate(directory)
+        server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_context.load_cert_chain(certfile, keyfile)
+        server_context.set_alpn_protocols(['h2', 'http/1.1'])
+
+        print(
+            f'{requests} requests, {concurrency} concurrent, '
+            f'{RESPONSE_DELAY * 1000:.0f}ms server latency, '
+            'max 10 connections'
+        )
+        for http2 in (False, True):
+            handler = Server()
+            server = await asyncio.start_server(
+                handler.handle,
+                'localhost',
+                0,
+                ssl=server_context
+            )
+            port = server.sockets[0].getsockname()[1]
+            elapsed = await run_client(
+                port,
+                certfile,
+                http2,
+                requests,
+                concurrency
+            )
+            server.close()
+            await server.wait_closed()
+            print(
+                f'{"HTTP/2  " if http2 else "HTTP/1.1"}: {elapsed:.2f}s '
+                f'({requests / elapsed:.0f} req/s), '
+                f'{handler.connections} connection(s)'
+            )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""Benchmark stream line framing.
+
+Compares the LineFramer with the previous approach of concatenating each
+chunk onto the remaining buffer and splitting it with to_lines.
+
+    PYTHONPATH=. python benchmarks/line_framing.py
+"""
+
+import json
+import time
+from typing import Callable, List
+
+from jetblack_tweeter.clients.bareclient.utils import LineFramer, to_lines
+
+TOTAL_SIZE = 4 * 1024 * 1024
+CHUNK_SIZES = [1024, 64 * 1024, 1024 * 1024]
+
+
+def make_payload() -> bytes:
+    lines: List[bytes] = []
+    size = 0
+    while size < TOTAL_SIZE:
+        line = json.dumps({
+            'id_str': str(1500000000000000000 + len(lines)),
+            'text': 'a tweet about something ' * 8,
+            'user': {'screen_name': 'someone', 'followers_count': len(lines)}
+        }).encode() + b'\r\n'
+        lines.append(line)
+        size += len(line)
+    return b''.join(lines)
+
+
+def frame_with_to_lines(chunks: List[bytes]) -> int:
+    count = 0
+    buf = b''
+    for item in chunks:
+        lines, buf = to_lines(buf + item)
+        count += len(lines)
+    return count
+
+
+def frame_with_line_framer(chunks: List[bytes]) -> int:
+    count = 0
+    framer = LineFramer()
+    for item in chunks:
+        count += len(framer.feed(item))
+    return count
+
+
+def measure(frame: Callable[[List[bytes]], int], chunks: List[bytes]) -> float:
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        frame(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    payload = make_payload()
+    print(f'{len(payload) / 1024 / 1024:.0f}MB of newline delimited JSON')
+    for chunk_size in CHUNK_SIZES:
+        chunks = [
+            payload[start:start + chunk_size]
+            for start in range(0, len(payload), chunk_size)
+        ]
+        assert frame_with_to_lines(chunks) == frame_with_line_framer(chunks)
+        old = measure(frame_with_to_lines, chunks)
+        new = measure(frame_with_line_framer, chunks)
+        print(
+            f'{chunk_size // 1024:>5}KB chunks: '
+            f'to_lines {old * 1000:9.1f}ms, '
+            f'LineFramer {new * 1000:6.1f}ms '
+            f'({old / new:.0f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark track matching.
+
+Compares the TrackMatcher with checking each track term against the words
+of a tweet in turn.
+
+    PYTHONPATH=. python benchmarks/track_matching.py
+"""
+
+import random
+import re
+import time
+from typing import Callable, List
+
+from jetblack_tweeter.matching import TrackMatcher, term_words
+
+TERM_COUNTS = [10, 100, 400, 4000]
+TWEET_COUNT = 5000
+
+_WORD = re.compile(r'[#@$]?\w+')
+
+
+def make_words(count: int) -> List[str]:
+    rng = random.Random(count)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return [
+        ''.join(rng.choice(letters) for _ in range(rng.randint(3, 9)))
+        for _ in range(count)
+    ]
+
+
+def make_terms(words: List[str], count: int) -> List[str]:
+    rng = random.Random(count)
+    return [
+        ' '.join(rng.sample(words, rng.randint(1, 2)))
+        for _ in range(count)
+    ]
+
+
+def make_tweets(words: List[str]) -> List[str]:
+    rng = random.Random(0)
+    return [
+        ' '.join(rng.choice(words) for _ in range(rng.randint(10, 40)))
+        for _ in range(TWEET_COUNT)
+    ]
+
+
+def match_naively(terms: List[str], tweets: List[str]) -> int:
+    term_word_sets = [set(term_words(term)) for term in terms]
+    count = 0
+    for tweet in tweets:
+        tokens = set(_WORD.findall(tweet.casefold()))
+        tokens.update(token[1:] for token in list(tokens) if token[0] in '#@$')
+        count += sum(1 for words in term_word_sets if words <= tokens)
+    return count
+
+
+def match_compiled(terms: List[str], tweets: List[str]) -> int:
+    matcher = TrackMatcher(terms)
+    return sum(len(matcher.match(tweet)) for tweet in tweets)
+
+
+def measure(
+        match: Callable[[List[str], List[str]], int],
+        terms: List[str],
+        tweets: List[str]
+) -> float:
+    start = time.perf_counter()
+    match(terms, tweets)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    words = make_words(2000)
+    tweets = make_tweets(words)
+    for term_count in TERM_COUNTS:
+        terms = make_terms(words, term_count)
+        assert match_naively(terms, tweets) == match_compiled(
+            terms,
+            tweets
+        )
+        naive = measure(match_naively, terms, tweets)
+        compiled = measure(match_compiled, terms, tweets)
+        print(
+            f'{term_count:4d} terms: '
+            f'naive {naive * 1000:8.1f}ms, '
+            f'compiled {compiled * 1000:8.1f}ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
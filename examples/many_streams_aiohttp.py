@@ -1,13 +1,14 @@
 import asyncio
 import os
 
-from jetblack_tweeter import Tweeter
+from jetblack_tweeter import StreamMultiplexer, Subscription, Tweeter
 from jetblack_tweeter.clients.aiohttp import AiohttpTweeterSession
 
 
-async def run_stream(tweeter: Tweeter, name, track, locations) -> None:
-    async for tweet in tweeter.stream.filter(track=track, locations=locations):
-        print(f"{name}: {tweet['text']}")
+async def run_stream(name: str, subscription: Subscription) -> None:
+    async for tweet in subscription:
+        if 'text' in tweet:
+            print(f"{name}: {tweet['text']}")
 
 
 async def main():
@@ -25,12 +26,19 @@ async def main():
             ('CSHARP', ['#csharp'], [((-122.75, 36.8), (-121.75, 37.8))]),
         ]
 
-        tasks = {
-            asyncio.create_task(run_stream(tweeter, name, track, locations))
-            for name, track, locations in params
-        }
-
-        await asyncio.wait(tasks)
+        # The topics share one connection.
+        async with StreamMultiplexer(tweeter.stream) as multiplexer:
+            tasks = {
+                asyncio.create_task(
+                    run_stream(
+                        name,
+                        multiplexer.subscribe(track=track, locations=locations)
+                    )
+                )
+                for name, track, locations in params
+            }
+
+            await asyncio.wait(tasks)
 
 if __name__ == '__main__':
     asyncio.run(main())
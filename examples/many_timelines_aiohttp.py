@@ -20,9 +20,17 @@ async def main():
         'jack',
         'robblackbourn'
     ]
-    for name in params:
-        timeline = await tweeter.statuses.user_timeline(screen_name=name, include_rts=False)
-        print(f"{name}: {len(timeline)}")
+    async for item in tweeter.fan_out(
+            lambda name: tweeter.statuses.user_timeline(
+                screen_name=name,
+                include_rts=False
+            ),
+            params
+    ):
+        if item.error is not None:
+            print(f"{item.argument}: {item.error}")
+        else:
+            print(f"{item.argument}: {len(item.result)}")
 
     await tweeter.close()
 
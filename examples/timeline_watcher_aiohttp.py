@@ -0,0 +1,36 @@
+import asyncio
+import os
+
+from jetblack_tweeter import Tweeter, TimelineWatcher, TokenBucket
+from jetblack_tweeter.clients.aiohttp import AiohttpTweeterSession
+
+
+async def main():
+    tweeter = Tweeter(
+        AiohttpTweeterSession(),
+        os.environ["APP_KEY"],
+        os.environ["APP_KEY_SECRET"],
+        access_token=os.environ["ACCESS_TOKEN"],
+        access_token_secret=os.environ["ACCESS_TOKEN_SECRET"]
+    )
+
+    # The user timeline allows 900 requests in 15 minutes.
+    watcher = TimelineWatcher(
+        tweeter.statuses,
+        budget=TokenBucket(900 / (15 * 60), capacity=10),
+        include_rts=False
+    )
+    for name in ['paulg', 'evhead', 'jack', 'robblackbourn']:
+        watcher.watch(screen_name=name)
+
+    try:
+        async for update in watcher.updates():
+            if update.error is not None:
+                print(f"{update.user}: {update.error}")
+            else:
+                print(f"{update.user}: {len(update.tweets)} new tweets")
+    finally:
+        await tweeter.close()
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,9 +1,48 @@
 """jetblack-tweeter"""
 
+from .bulk import FanOutResult
+from .cache import CacheStats, ResponseCache
+from .codecs import (
+    AbstractJsonCodec,
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec
+)
 from .errors import ApiError
+from .hydration import HydrationStore
+from .matching import TrackMatcher
+from .multiplexer import StreamMultiplexer, Subscription
+from .pacing import TokenBucket
+from .pagination import MaxIdCursor, Paginator
+from .rate_limits import RateLimit, RateLimitTracker
+from .reconnect import ReconnectEvent, ReconnectPolicy
+from .retry import RetryPolicy, RetryRule
+from .timelines import TimelineUpdate, TimelineWatcher
 from .tweeter import Tweeter
 
 __all__ = [
+    'AbstractJsonCodec',
+    'JsonCodec',
+    'MsgspecCodec',
+    'OrjsonCodec',
     'ApiError',
+    'CacheStats',
+    'FanOutResult',
+    'ResponseCache',
+    'HydrationStore',
+    'MaxIdCursor',
+    'Paginator',
+    'RateLimit',
+    'RateLimitTracker',
+    'ReconnectEvent',
+    'ReconnectPolicy',
+    'RetryPolicy',
+    'RetryRule',
+    'StreamMultiplexer',
+    'Subscription',
+    'TimelineUpdate',
+    'TimelineWatcher',
+    'TokenBucket',
+    'TrackMatcher',
     'Tweeter'
 ]
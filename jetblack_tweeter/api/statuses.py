@@ -1,28 +1,62 @@
 """Support for status type messages"""
 
-from typing import Any, List, Mapping, Optional, Union, cast
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast
+)
 
+from ..batching import BatchLoader
+from ..bulk import dispatch_chunks
 from ..constants import URL_API_1_1
+from ..errors import ApiError
+from ..hydration import HydrationStore, hydrate, make_variant
 from ..types import AbstractHttpClient, Alignment, Theme, WidgetType
 from ..utils import (
     optional_bool_to_str,
     int_list_to_str,
     optional_int_list_to_str,
     bool_to_str,
-    optional_str_list_to_str
+    optional_str_list_to_str,
+    str_list_to_str
 )
 
 
 class Statuses:
     """Support for the statuses end point"""
 
-    def __init__(self, client: AbstractHttpClient) -> None:
+    def __init__(
+            self,
+            client: AbstractHttpClient,
+            store: Optional[HydrationStore] = None,
+            batch_window: Optional[float] = None
+    ) -> None:
         """Initialise the statuses end point.
 
         Args:
             client (AbstractHttpClient): THe authenticated HTTP client
+            store (Optional[HydrationStore], optional): A store of previously
+                fetched tweets. Defaults to None.
+            batch_window (Optional[float], optional): If given, calls to show
+                made within this number of seconds are combined into calls to
+                lookup. Defaults to None.
         """
         self._client = client
+        self._store = store
+        self._batch_window = batch_window
+        self._loaders: Dict[
+            Tuple[str, Optional[float]],
+            BatchLoader[int, Mapping[str, Any]]
+        ] = {}
         self._url = f'{URL_API_1_1}/statuses'
 
     async def home_timeline(
@@ -424,10 +458,92 @@ class Statuses:
             'include_card_uri': optional_bool_to_str(include_card_uri)
         }
         url = f'{self._url}/lookup.json'
-        return cast(
-            List[Mapping[str, Any]],
-            await self._client.get(url, body, timeout)
+        if self._store is None or map:
+            return cast(
+                List[Mapping[str, Any]],
+                await self._client.get(url, body, timeout)
+            )
+
+        params = {name: value for name, value in body.items() if name != 'id'}
+
+        async def fetch(missing: Sequence[str]) -> Mapping[str, Any]:
+            tweets = cast(
+                List[Mapping[str, Any]],
+                await self._client.get(
+                    url,
+                    {**params, 'id': str_list_to_str(missing)},
+                    timeout
+                )
+            )
+            return {tweet['id_str']: tweet for tweet in tweets}
+
+        tweet_ids = [str(tweet_id) for tweet_id in ids]
+        tweets = await hydrate(
+            self._store,
+            'status',
+            make_variant(params),
+            tweet_ids,
+            fetch
         )
+        return [
+            tweets[tweet_id] for tweet_id in tweet_ids if tweet_id in tweets
+        ]
+
+    async def lookup_bulk(
+            self,
+            ids: Union[Iterable[int], AsyncIterable[int]],
+            *,
+            include_entities: Optional[bool] = None,
+            trim_user: Optional[bool] = None,
+            map: Optional[bool] = None,  # pylint: disable=redefined-builtin
+            include_ext_alt_text: Optional[bool] = None,
+            include_card_uri: Optional[bool] = None,
+            timeout: Optional[float] = None,
+            concurrency: int = 4,
+            ordered: bool = True
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """Lookup any number of tweets, in chunks of up to 100.
+
+        Args:
+            ids (Union[Iterable[int], AsyncIterable[int]]): The Tweet IDs.
+            include_entities (Optional[bool], optional): As for `lookup`.
+                Defaults to None.
+            trim_user (Optional[bool], optional): As for `lookup`. Defaults to
+                None.
+            map (Optional[bool], optional): As for `lookup`. Defaults to None.
+            include_ext_alt_text (Optional[bool], optional): As for `lookup`.
+                Defaults to None.
+            include_card_uri (Optional[bool], optional): As for `lookup`.
+                Defaults to None.
+            timeout (Optional[float], optional): If specified the timeout for
+                each request. Defaults to None.
+            concurrency (int, optional): The maximum number of requests in
+                flight. Defaults to 4.
+            ordered (bool, optional): If true the chunks are yielded in the
+                order of the ids, otherwise as they complete. Defaults to
+                True.
+
+        Yields:
+            List[Mapping[str, Any]]: The tweets of each chunk.
+        """
+        async def lookup(chunk: List[int]) -> List[Mapping[str, Any]]:
+            return await self.lookup(
+                chunk,
+                include_entities=include_entities,
+                trim_user=trim_user,
+                map=map,
+                include_ext_alt_text=include_ext_alt_text,
+                include_card_uri=include_card_uri,
+                timeout=timeout
+            )
+
+        async for tweets in dispatch_chunks(
+                ids,
+                lookup,
+                concurrency=concurrency,
+                ordered=ordered
+        ):
+            yield tweets
 
     async def show(
             self,
@@ -471,6 +587,22 @@ class Statuses:
         Returns:
             Mapping[str, Any]: The tweet.
         """
+        url = f'{self._url}/show.json'
+        if self._batch_window is not None and not include_my_retweet:
+            # The lookup endpoint does not support include_my_retweet.
+            loader = self._show_loader(
+                self._batch_window,
+                trim_user,
+                include_entities,
+                include_ext_alt_text,
+                include_card_uri,
+                timeout
+            )
+            try:
+                return await loader.load(status_id)
+            except KeyError as error:
+                raise ApiError(f'{url}?id={status_id}', 404, {}) from error
+
         body = {
             'id': status_id,
             'trim_user': optional_bool_to_str(trim_user),
@@ -479,12 +611,48 @@ class Statuses:
             'include_ext_alt_text': optional_bool_to_str(include_ext_alt_text),
             'include_card_uri': optional_bool_to_str(include_card_uri)
         }
-        url = f'{self._url}/show.json'
         return cast(
             Mapping[str, Any],
             await self._client.get(url, body, timeout)
         )
 
+    def _show_loader(
+            self,
+            window: float,
+            trim_user: Optional[bool],
+            include_entities: Optional[bool],
+            include_ext_alt_text: Optional[bool],
+            include_card_uri: Optional[bool],
+            timeout: Optional[float]
+    ) -> BatchLoader[int, Mapping[str, Any]]:
+        # Only calls with the same parameters can share a lookup.
+        variant = make_variant({
+            'trim_user': trim_user,
+            'include_entities': include_entities,
+            'include_ext_alt_text': include_ext_alt_text,
+            'include_card_uri': include_card_uri
+        })
+        loader = self._loaders.get((variant, timeout))
+        if loader is not None:
+            return loader
+
+        async def load(
+                status_ids: Sequence[int]
+        ) -> Mapping[int, Mapping[str, Any]]:
+            tweets = await self.lookup(
+                list(status_ids),
+                trim_user=trim_user,
+                include_entities=include_entities,
+                include_ext_alt_text=include_ext_alt_text,
+                include_card_uri=include_card_uri,
+                timeout=timeout
+            )
+            return {int(tweet['id_str']): tweet for tweet in tweets}
+
+        loader = BatchLoader(load, window=window)
+        self._loaders[(variant, timeout)] = loader
+        return loader
+
     async def oembed(
             self,
             url: str,
@@ -2,10 +2,20 @@
 
 import asyncio
 from random import random
-from typing import Any, AsyncIterable, List, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Tuple
+)
 
 
 from ..constants import URL_STREAM_1_1
+from ..matching import TrackMatcher
+from ..reconnect import ReconnectCallback, ReconnectPolicy
 from ..types import AbstractHttpClient, BoundingBox, FilterLevel, Number
 from ..utils import (
     optional_str_list_to_str,
@@ -26,6 +36,19 @@ class Stream:
         """
         self._client = client
 
+    async def _follow(
+            self,
+            connect: Callable[[], AsyncIterator[Any]],
+            reconnect: Optional[ReconnectPolicy],
+            on_reconnect: Optional[ReconnectCallback]
+    ) -> AsyncIterator[Any]:
+        if reconnect is None:
+            async for message in connect():
+                yield message
+        else:
+            async for message in reconnect.run(connect, on_reconnect):
+                yield message
+
     async def filter(
             self,
             *,
@@ -33,8 +56,11 @@ class Stream:
             track: Optional[List[str]] = None,
             locations: Optional[List[BoundingBox]] = None,
             filter_level: FilterLevel = FilterLevel.NONE,
-            delimited: Optional[int] = None,
-            stall_warnings: bool = True
+            delimited: Optional[str] = None,
+            stall_warnings: bool = True,
+            tag_matches: bool = False,
+            reconnect: Optional[ReconnectPolicy] = None,
+            on_reconnect: Optional[ReconnectCallback] = None
     ) -> AsyncIterable[Any]:
         """Follow the statuses filtering api
 
@@ -47,11 +73,19 @@ class Stream:
                 track. Defaults to None.
             filter_level (FilterLevel, optional): Filter status update
                 frequency. Defaults to FilterLevel.NONE.
-            delimited (Optional[int], optional): Specifies whether messages should
-                be length-delimited. Defaults None.
+            delimited (Optional[str], optional): If 'length' each message is
+                preceded by its length in bytes. Defaults None.
             stall_warnings (bool, optional): Whether or not to warn the caller
                 about stalls when falling behind the twitter real time queue.
                 Defaults to True.
+            tag_matches (bool, optional): If true each tweet is given a
+                "matching_terms" list of the track terms it matches.
+                Defaults to False.
+            reconnect (Optional[ReconnectPolicy], optional): If given the
+                stream is reconnected when it fails or closes, according to
+                the policy. Defaults to None.
+            on_reconnect (Optional[ReconnectCallback], optional): A callback
+                called before each reconnection. Defaults to None.
 
         Yields:
             Any: A status response
@@ -65,19 +99,41 @@ class Stream:
             'stall_warnings': bool_to_str(stall_warnings)
         }
         url = f'{URL_STREAM_1_1}/statuses/filter.json'
-        async for message in self._client.stream(url, body):  # type: ignore
+
+        def connect() -> AsyncIterator[Any]:
+            return self._client.stream(  # type: ignore
+                url,
+                body,
+                length_delimited=delimited == 'length'
+            )
+
+        matcher = TrackMatcher(track) if tag_matches and track else None
+        async for message in self._follow(connect, reconnect, on_reconnect):
+            if (
+                    matcher is not None and
+                    isinstance(message, dict) and
+                    'id' in message
+            ):
+                message['matching_terms'] = matcher.match_message(message)
             yield message
 
     async def sample(
             self,
             *,
-            delay: Optional[Tuple[Number, Number]] = None
+            delay: Optional[Tuple[Number, Number]] = None,
+            reconnect: Optional[ReconnectPolicy] = None,
+            on_reconnect: Optional[ReconnectCallback] = None
     ) -> AsyncIterable[Any]:
         """Retrieve a sampling of public statuses
 
         Args:
             delay (Optional[Tuple[Number, Number]], optional): A random delay in
                 seconds (min,max) to apply to responses. Defaults to None.
+            reconnect (Optional[ReconnectPolicy], optional): If given the
+                stream is reconnected when it fails or closes, according to
+                the policy. Defaults to None.
+            on_reconnect (Optional[ReconnectCallback], optional): A callback
+                called before each reconnection. Defaults to None.
         Yields:
             Any: A sample status response
         """
@@ -86,7 +142,11 @@ class Stream:
         url = f'{URL_STREAM_1_1}/statuses/sample.json'
         delay_min, delay_max = delay
         delay_range = delay_max - delay_min
-        async for message in self._client.stream(url):  # type: ignore
+
+        def connect() -> AsyncIterator[Any]:
+            return self._client.stream(url)  # type: ignore
+
+        async for message in self._follow(connect, reconnect, on_reconnect):
             if delay_range > 0:
                 num = random()
                 delay_seconds = delay_min + num * delay_range
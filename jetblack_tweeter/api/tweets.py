@@ -1,9 +1,21 @@
 """Tweets"""
 
-from typing import Any, Literal, Optional, Sequence
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union
+)
 from ..types import AbstractHttpClient
 
+from ..bulk import dispatch_chunks
 from ..constants import URL_API_2
+from ..hydration import HydrationStore, hydrated_lookup
 from ..types import (
     MediaFields,
     PlaceFields,
@@ -17,13 +29,20 @@ from ..utils import optional_str_list_to_str, str_list_to_str
 class Tweets:
     """Support for the v2 tweets endpoint"""
 
-    def __init__(self, client: AbstractHttpClient) -> None:
+    def __init__(
+            self,
+            client: AbstractHttpClient,
+            store: Optional[HydrationStore] = None
+    ) -> None:
         """Initialise the users end point.
 
         Args:
             client (AbstractHttpClient): THe authenticated HTTP client
+            store (Optional[HydrationStore], optional): A store of previously
+                fetched tweets. Defaults to None.
         """
         self._client = client
+        self._store = store
         self._url = f'{URL_API_2}/tweets'
 
     async def lookup(
@@ -84,6 +103,24 @@ class Tweets:
         Returns:
             Any: The tweets.
         """
+        if self._store is not None and not expansions:
+            # Without expansions each tweet can be stored independently.
+            return await hydrated_lookup(
+                self._client,
+                self._store,
+                'tweet',
+                self._url,
+                'ids',
+                ids,
+                {
+                    'media.fields': optional_str_list_to_str(media_fields),
+                    'place.fields': optional_str_list_to_str(place_fields),
+                    'poll.fields': optional_str_list_to_str(poll_fields),
+                    'tweet.fields': optional_str_list_to_str(tweet_fields),
+                    'user.fields': optional_str_list_to_str(user_fields),
+                },
+                lambda tweet: tweet['id']
+            )
         body = {
             'ids': str_list_to_str(ids),
             'expansions': optional_str_list_to_str(expansions),
@@ -95,6 +132,73 @@ class Tweets:
         }
         return await self._client.get(self._url, body)
 
+    async def lookup_bulk(
+            self,
+            ids: Union[Iterable[str], AsyncIterable[str]],
+            *,
+            expansions: Optional[Sequence[Literal[
+                "attachments.poll_ids",
+                "attachments.media_keys",
+                "author_id",
+                "edit_history_tweet_ids",
+                "entities.mentions.username",
+                "geo.place_id",
+                "in_reply_to_user_id",
+                "referenced_tweets.id",
+                "referenced_tweets.id.author_id"
+            ]]] = None,
+            media_fields: Optional[Sequence[MediaFields]] = None,
+            place_fields: Optional[Sequence[PlaceFields]] = None,
+            poll_fields: Optional[Sequence[PollFields]] = None,
+            tweet_fields: Optional[Sequence[TweetFields]] = None,
+            user_fields: Optional[Sequence[UserFields]] = None,
+            concurrency: int = 4,
+            ordered: bool = True
+    ) -> AsyncIterator[Any]:
+        """Lookup any number of tweets, in chunks of up to 100.
+
+        Args:
+            ids (Union[Iterable[str], AsyncIterable[str]]): Tweet ids.
+            expansions (Optional[Sequence[Literal[...]]], optional): As for
+                `lookup`. Defaults to None.
+            media_fields (Optional[Sequence[MediaFields]], optional): As for
+                `lookup`. Defaults to None.
+            place_fields (Optional[Sequence[PlaceFields]], optional): As for
+                `lookup`. Defaults to None.
+            poll_fields (Optional[Sequence[PollFields]], optional): As for
+                `lookup`. Defaults to None.
+            tweet_fields (Optional[Sequence[TweetFields]], optional): As for
+                `lookup`. Defaults to None.
+            user_fields (Optional[Sequence[UserFields]], optional): As for
+                `lookup`. Defaults to None.
+            concurrency (int, optional): The maximum number of requests in
+                flight. Defaults to 4.
+            ordered (bool, optional): If true the responses are yielded in the
+                order of the ids, otherwise as they complete. Defaults to
+                True.
+
+        Yields:
+            Any: The response for each chunk.
+        """
+        async def lookup(chunk: List[str]) -> Any:
+            return await self.lookup(
+                chunk,
+                expansions=expansions,
+                media_fields=media_fields,
+                place_fields=place_fields,
+                poll_fields=poll_fields,
+                tweet_fields=tweet_fields,
+                user_fields=user_fields
+            )
+
+        async for response in dispatch_chunks(
+                ids,
+                lookup,
+                concurrency=concurrency,
+                ordered=ordered
+        ):
+            yield response
+
     async def lookup_by_id(
             self,
             id: str,  # pylint: disable=invalid-name,redefined-builtin
@@ -1,11 +1,28 @@
 """Support for the v2 users endpoint"""
 
 from datetime import datetime
-from typing import Any, Literal, Optional, Sequence
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
 
 from ..types import AbstractHttpClient
 
+from ..batching import BatchLoader
+from ..bulk import dispatch_chunks
 from ..constants import URL_API_2
+from ..hydration import HydrationStore, hydrated_lookup, make_variant
 from ..types import (
     MediaFields,
     PollFields,
@@ -20,16 +37,65 @@ from ..utils import (
 )
 
 
+def _split_lookup(
+        response: Mapping[str, Any],
+        field: str,
+        normalise: Callable[[str], str]
+) -> Dict[str, Any]:
+    """Split a bulk lookup response into single lookup responses.
+
+    Args:
+        response (Mapping[str, Any]): The bulk lookup response.
+        field (str): The user field which was looked up.
+        normalise (Callable[[str], str]): A callable to normalise the
+            looked up value.
+
+    Returns:
+        Dict[str, Any]: The single lookup responses by normalised value.
+    """
+    included_tweets = response.get('includes', {}).get('tweets', [])
+    results: Dict[str, Any] = {}
+    for user in response.get('data', []):
+        result: Dict[str, Any] = {'data': user}
+        pinned_tweets = [
+            tweet
+            for tweet in included_tweets
+            if tweet['id'] == user.get('pinned_tweet_id')
+        ]
+        if pinned_tweets:
+            result['includes'] = {'tweets': pinned_tweets}
+        results[normalise(user[field])] = result
+    for error in response.get('errors', []):
+        if error.get('resource_type', 'user') != 'user' or 'value' not in error:
+            continue
+        result = results.setdefault(normalise(str(error['value'])), {})
+        result.setdefault('errors', []).append(error)
+    return results
+
+
 class Users:
     """Support for the v2 users endpoint"""
 
-    def __init__(self, client: AbstractHttpClient) -> None:
+    def __init__(
+            self,
+            client: AbstractHttpClient,
+            store: Optional[HydrationStore] = None,
+            batch_window: Optional[float] = None
+    ) -> None:
         """Initialise the users end point.
 
         Args:
             client (AbstractHttpClient): THe authenticated HTTP client
+            store (Optional[HydrationStore], optional): A store of previously
+                fetched users. Defaults to None.
+            batch_window (Optional[float], optional): If given, single user
+                lookups made within this number of seconds are combined into
+                bulk lookups. Defaults to None.
         """
         self._client = client
+        self._store = store
+        self._batch_window = batch_window
+        self._loaders: Dict[Tuple[str, str], BatchLoader[str, Any]] = {}
         self._url = f'{URL_API_2}/users'
 
     async def liked_tweets(
@@ -141,6 +207,21 @@ class Users:
         Returns:
             Any: Information on the users.
         """
+        if self._store is not None and not expansions:
+            # Without expansions each user can be stored independently.
+            return await hydrated_lookup(
+                self._client,
+                self._store,
+                'user',
+                self._url,
+                'ids',
+                ids,
+                {
+                    'tweet.fields': optional_str_list_to_str(tweet_fields),
+                    'user.fields': optional_str_list_to_str(user_fields),
+                },
+                lambda user: user['id']
+            )
         body = {
             'ids': str_list_to_str(ids),
             'expansions': optional_str_list_to_str(expansions),
@@ -149,6 +230,54 @@ class Users:
         }
         return await self._client.get(self._url, body)
 
+    async def lookup_by_ids_bulk(
+            self,
+            ids: Union[Iterable[str], AsyncIterable[str]],
+            *,
+            expansions: Optional[Sequence[Literal[
+                "pinned_tweet_id"
+            ]]] = None,
+            tweet_fields: Optional[Sequence[TweetFields]] = None,
+            user_fields: Optional[Sequence[UserFields]] = None,
+            concurrency: int = 4,
+            ordered: bool = True
+    ) -> AsyncIterator[Any]:
+        """Lookup any number of users by their ids, in chunks of up to 100.
+
+        Args:
+            ids (Union[Iterable[str], AsyncIterable[str]]): The ids.
+            expansions (Optional[Sequence[Literal[
+                &quot;pinned_tweet_id&quot;
+                ]]], optional): As for `lookup_by_ids`. Defaults to None.
+            tweet_fields (Optional[Sequence[TweetFields]], optional): As for
+                `lookup_by_ids`. Defaults to None.
+            user_fields (Optional[Sequence[UserFields]], optional): As for
+                `lookup_by_ids`. Defaults to None.
+            concurrency (int, optional): The maximum number of requests in
+                flight. Defaults to 4.
+            ordered (bool, optional): If true the responses are yielded in the
+                order of the ids, otherwise as they complete. Defaults to
+                True.
+
+        Yields:
+            Any: The response for each chunk.
+        """
+        async def lookup(chunk: List[str]) -> Any:
+            return await self.lookup_by_ids(
+                chunk,
+                expansions=expansions,
+                tweet_fields=tweet_fields,
+                user_fields=user_fields
+            )
+
+        async for response in dispatch_chunks(
+                ids,
+                lookup,
+                concurrency=concurrency,
+                ordered=ordered
+        ):
+            yield response
+
     async def lookup_by_id(
             self,
             id: str,  # pylint: disable=invalid-name,redefined-builtin
@@ -179,6 +308,15 @@ class Users:
         Returns:
             Any: Information about the user.
         """
+        if self._batch_window is not None:
+            loader = self._batch_loader(
+                'id',
+                self._batch_window,
+                expansions,
+                tweet_fields,
+                user_fields
+            )
+            return await loader.load(id)
         body = {
             'expansions': optional_str_list_to_str(expansions),
             'tweet.fields': optional_str_list_to_str(tweet_fields),
@@ -217,15 +355,78 @@ class Users:
         Returns:
             Any: Information about the users.
         """
+        url = f'{self._url}/by'
+        if self._store is not None and not expansions:
+            # Usernames are case insensitive.
+            return await hydrated_lookup(
+                self._client,
+                self._store,
+                'username',
+                url,
+                'usernames',
+                [username.lower() for username in usernames],
+                {
+                    'tweet.fields': optional_str_list_to_str(tweet_fields),
+                    'user.fields': optional_str_list_to_str(user_fields),
+                },
+                lambda user: user['username'].lower()
+            )
         body = {
             'usernames': str_list_to_str(usernames),
             'expansions': optional_str_list_to_str(expansions),
             'tweet.fields': optional_str_list_to_str(tweet_fields),
             'user.fields': optional_str_list_to_str(user_fields),
         }
-        url = f'{self._url}/by'
         return await self._client.get(url, body)
 
+    async def lookup_by_usernames_bulk(
+            self,
+            usernames: Union[Iterable[str], AsyncIterable[str]],
+            *,
+            expansions: Optional[Sequence[Literal[
+                "pinned_tweet_id"
+            ]]] = None,
+            tweet_fields: Optional[Sequence[TweetFields]] = None,
+            user_fields: Optional[Sequence[UserFields]] = None,
+            concurrency: int = 4,
+            ordered: bool = True
+    ) -> AsyncIterator[Any]:
+        """Lookup any number of users by their usernames, in chunks of up to 100.
+
+        Args:
+            usernames (Union[Iterable[str], AsyncIterable[str]]): The usernames.
+            expansions (Optional[Sequence[Literal[
+                &quot;pinned_tweet_id&quot;
+                ]]], optional): As for `lookup_by_usernames`. Defaults to None.
+            tweet_fields (Optional[Sequence[TweetFields]], optional): As for
+                `lookup_by_usernames`. Defaults to None.
+            user_fields (Optional[Sequence[UserFields]], optional): As for
+                `lookup_by_usernames`. Defaults to None.
+            concurrency (int, optional): The maximum number of requests in
+                flight. Defaults to 4.
+            ordered (bool, optional): If true the responses are yielded in the
+                order of the usernames, otherwise as they complete. Defaults to
+                True.
+
+        Yields:
+            Any: The response for each chunk.
+        """
+        async def lookup(chunk: List[str]) -> Any:
+            return await self.lookup_by_usernames(
+                chunk,
+                expansions=expansions,
+                tweet_fields=tweet_fields,
+                user_fields=user_fields
+            )
+
+        async for response in dispatch_chunks(
+                usernames,
+                lookup,
+                concurrency=concurrency,
+                ordered=ordered
+        ):
+            yield response
+
     async def lookup_by_username(
             self,
             username: str,
@@ -256,6 +457,15 @@ class Users:
         Returns:
             Any: Information about the user.
         """
+        if self._batch_window is not None:
+            loader = self._batch_loader(
+                'username',
+                self._batch_window,
+                expansions,
+                tweet_fields,
+                user_fields
+            )
+            return await loader.load(username.lower())
         body = {
             'expansions': optional_str_list_to_str(expansions),
             'tweet.fields': optional_str_list_to_str(tweet_fields),
@@ -264,6 +474,45 @@ class Users:
         url = f'{self._url}/by/username/{username}'
         return await self._client.get(url, body)
 
+    def _batch_loader(
+            self,
+            field: str,
+            window: float,
+            expansions: Optional[Sequence[Literal["pinned_tweet_id"]]],
+            tweet_fields: Optional[Sequence[TweetFields]],
+            user_fields: Optional[Sequence[UserFields]]
+    ) -> BatchLoader[str, Any]:
+        # Only lookups with the same parameters can share a bulk lookup.
+        variant = make_variant({
+            'expansions': optional_str_list_to_str(expansions),
+            'tweet.fields': optional_str_list_to_str(tweet_fields),
+            'user.fields': optional_str_list_to_str(user_fields),
+        })
+        loader = self._loaders.get((field, variant))
+        if loader is not None:
+            return loader
+
+        async def load(values: Sequence[str]) -> Mapping[str, Any]:
+            if field == 'username':
+                response = await self.lookup_by_usernames(
+                    values,
+                    expansions=expansions,
+                    tweet_fields=tweet_fields,
+                    user_fields=user_fields
+                )
+                return _split_lookup(response, field, str.lower)
+            response = await self.lookup_by_ids(
+                values,
+                expansions=expansions,
+                tweet_fields=tweet_fields,
+                user_fields=user_fields
+            )
+            return _split_lookup(response, field, str)
+
+        loader = BatchLoader(load, window=window)
+        self._loaders[(field, variant)] = loader
+        return loader
+
     async def me(
             self,
             *,
@@ -1,16 +1,20 @@
 """An HTTP client which uses oauth1 for authentication"""
 
-import json
-from typing import Any, AsyncIterator, List, Mapping, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Tuple
 from urllib.parse import urlencode
 
 from oauthlib.oauth1 import Client as OAuth1Client
 
-from .types import AbstractHttpClient, AbstractTweeterSession
-from .utils import clean_optional_dict, clean_dict
+from .base_client import BaseHttpClient
+from .cache import ResponseCache
+from .codecs import AbstractJsonCodec
+from .oauth1 import HmacSha1Signer
+from .rate_limits import RateLimitTracker
+from .retry import RetryPolicy
+from .types import AbstractTweeterSession
 
 
-class AuthenticatedHttpClient(AbstractHttpClient):
+class AuthenticatedHttpClient(BaseHttpClient):
     """An HTTP client that generates the headers for OAuth1 authentication"""
 
     def __init__(
@@ -20,7 +24,13 @@ class AuthenticatedHttpClient(AbstractHttpClient):
             consumer_secret: str,
             *,
             access_token: Optional[str] = None,
-            access_token_secret: Optional[str] = None
+            access_token_secret: Optional[str] = None,
+            fast_signing: bool = False,
+            codec: Optional[AbstractJsonCodec] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limits: Optional[RateLimitTracker] = None,
+            coalesce_gets: bool = False,
+            cache: Optional[ResponseCache] = None
     ) -> None:
         """Initialise the authenticated HTTP client.
 
@@ -33,90 +43,64 @@ class AuthenticatedHttpClient(AbstractHttpClient):
                 token. Defaults to None.
             access_token_secret (Optional[str], optional): The Oauth1 access
                 token secret. Defaults to None.
+            fast_signing (bool, optional): If true use the cached HMAC-SHA1
+                signer rather than oauthlib. Defaults to False.
+            codec (Optional[AbstractJsonCodec], optional): The codec used to
+                encode request bodies. Defaults to None.
+            retry_policy (Optional[RetryPolicy], optional): The policy for
+                retrying failed requests. Defaults to None.
+            rate_limits (Optional[RateLimitTracker], optional): The rate
+                limit tracker. Defaults to None.
+            coalesce_gets (bool, optional): If true concurrent identical GET
+                requests share a single request. Defaults to False.
+            cache (Optional[ResponseCache], optional): A cache for GET
+                responses. Defaults to None.
         """
-        self._client = tweeter_session
+        # User access tokens are prefixed by the user id.
+        credential = (
+            f'user:{access_token.partition("-")[0]}'
+            if access_token
+            else f'app:{consumer_key}'
+        )
+        super().__init__(
+            tweeter_session,
+            codec,
+            retry_policy,
+            rate_limits,
+            credential,
+            coalesce_gets,
+            cache
+        )
         self._oauth_client = OAuth1Client(
             consumer_key,
             client_secret=consumer_secret,
             resource_owner_key=access_token,
             resource_owner_secret=access_token_secret
         )
+        self._signer = HmacSha1Signer(
+            consumer_key,
+            consumer_secret,
+            access_token=access_token,
+            access_token_secret=access_token_secret
+        ) if fast_signing else None
 
-    def stream(
-        self,
-        url: str,
-        data: Optional[Mapping[str, Any]] = None,
-        method: str = 'post'
-    ) -> AsyncIterator[Union[List[Any], Mapping[str, Any]]]:
-        url, headers, body = self._oauth_client.sign(
-            url,
-            headers={} if data is None else {
-                'content-type': 'application/x-www-form-urlencoded',
-            },
-            body=urlencode(clean_dict(data)) if data else None,
-            http_method=method.upper(),
-        )
-        return self._client.stream(  # type: ignore
-            url,
-            method,
-            headers,
-            body
-        )
-
-    async def get(
-            self,
-            url: str,
-            params: Optional[Mapping[str, Any]] = None,
-            timeout: Optional[float] = None
-    ) -> Union[List[Any], Mapping[str, Any]]:
-        data = clean_optional_dict(params)
-        url, headers, _ = self._oauth_client.sign(
-            url + (f'?{urlencode(data)}' if data else ''),
-            http_method='GET',
-        )
-        return await self._client.get(url, headers, timeout)
-
-    async def post(
-            self,
-            url: str,
-            params: Optional[Mapping[str, Any]] = None,
-            timeout: Optional[float] = None
-    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        data = clean_optional_dict(params)
-        body = None if data is None else json.dumps(data)
-        url, headers, _ = self._oauth_client.sign(
-            url + (f'?{urlencode(data)}' if data else ''),
-            http_method='POST'
-        )
-        return await self._client.post(url, headers, body, timeout)
-
-    async def put(
+    async def _authorize(
             self,
             url: str,
+            http_method: str,
             params: Optional[Mapping[str, Any]] = None,
-            timeout: Optional[float] = None
-    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        data = clean_optional_dict(params)
-        body = None if data is None else json.dumps(data)
-        url, headers, _ = self._oauth_client.sign(
-            url + (f'?{urlencode(data)}' if data else ''),
-            http_method='PUT'
-        )
-        return await self._client.put(url, headers, body, timeout)
+            form: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[str, Dict[str, str], Optional[str]]:
+        headers = {} if form is None else {
+            'content-type': 'application/x-www-form-urlencoded',
+        }
+        if self._signer is not None:
+            return self._signer.sign(url, http_method, params, form, headers)
 
-    async def delete(
-            self,
-            url: str,
-            params: Optional[Mapping[str, Any]] = None,
-            timeout: Optional[float] = None
-    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        data = clean_optional_dict(params)
-        body = None if data is None else json.dumps(data)
-        url, headers, _ = self._oauth_client.sign(
-            url + (f'?{urlencode(data)}' if data else ''),
-            http_method='DELETE'
+        url, headers, body = self._oauth_client.sign(
+            url + (f'?{urlencode(params)}' if params else ''),
+            headers=headers,
+            body=urlencode(form) if form else None,
+            http_method=http_method
         )
-        return await self._client.delete(url, headers, body, timeout)
-
-    async def close(self) -> None:
-        await self._client.close()
+        return url, headers, body
@@ -0,0 +1,265 @@
+"""The base class for authenticated HTTP clients"""
+
+from abc import abstractmethod
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union
+)
+
+from .cache import ResponseCache
+from .codecs import AbstractJsonCodec, DEFAULT_CODEC
+from .rate_limits import RateLimitTracker, endpoint_template
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
+from .types import AbstractHttpClient, AbstractTweeterSession, ResponseCallback
+from .utils import clean_optional_dict, clean_dict
+
+T = TypeVar('T')
+GetKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+class BaseHttpClient(AbstractHttpClient):
+    """A base class for HTTP clients which authorize each request before
+    passing it to the tweeter session.
+    """
+
+    def __init__(
+            self,
+            tweeter_session: AbstractTweeterSession,
+            codec: Optional[AbstractJsonCodec] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limits: Optional[RateLimitTracker] = None,
+            credential: str = '',
+            coalesce_gets: bool = False,
+            cache: Optional[ResponseCache] = None
+    ) -> None:
+        """Initialise the HTTP client.
+
+        Args:
+            tweeter_session (AbstractTweeterSession): The tweeter session
+                implementation.
+            codec (Optional[AbstractJsonCodec], optional): The codec used to
+                encode request bodies. If not given the standard library is
+                used. Defaults to None.
+            retry_policy (Optional[RetryPolicy], optional): The policy for
+                retrying failed requests. If not given requests are not
+                retried. Defaults to None.
+            rate_limits (Optional[RateLimitTracker], optional): The tracker
+                for the rate limits returned with each response, which may
+                pace the requests. Defaults to None.
+            credential (str, optional): The name of the credential the rate
+                limits apply to. Defaults to ''.
+            coalesce_gets (bool, optional): If true concurrent GET requests
+                with the same url and parameters share a single request and
+                its decoded result. Defaults to False.
+            cache (Optional[ResponseCache], optional): A cache for GET
+                responses. Defaults to None.
+        """
+        self._client = tweeter_session
+        self._codec = codec or DEFAULT_CODEC
+        self._retry_policy = retry_policy
+        self._rate_limits = rate_limits
+        self.credential = credential
+        self._in_flight: Optional[
+            SingleFlight[GetKey, Union[List[Any], Mapping[str, Any]]]
+        ] = SingleFlight() if coalesce_gets else None
+        self._cache = cache
+
+    @abstractmethod
+    async def _authorize(
+            self,
+            url: str,
+            http_method: str,
+            params: Optional[Mapping[str, Any]] = None,
+            form: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[str, Dict[str, str], Optional[str]]:
+        """Authorize a request.
+
+        Args:
+            url (str): The url without a query string.
+            http_method (str): The HTTP method.
+            params (Optional[Mapping[str, Any]], optional): The query
+                parameters. Defaults to None.
+            form (Optional[Mapping[str, Any]], optional): The form encoded
+                body parameters. Defaults to None.
+
+        Returns:
+            Tuple[str, Dict[str, str], Optional[str]]: The url with the query
+                string, the headers, and the body (if any).
+        """
+
+    async def _run(
+            self,
+            http_method: str,
+            url: str,
+            request: Callable[[Optional[ResponseCallback]], Awaitable[T]]
+    ) -> T:
+        rate_limits = self._rate_limits
+        endpoint = endpoint_template(url)
+        on_response: Optional[ResponseCallback] = None
+        if rate_limits is not None:
+            def update_rate_limit(
+                    _status: int,
+                    headers: Mapping[str, str]
+            ) -> None:
+                rate_limits.update(self.credential, endpoint, headers)
+
+            on_response = update_rate_limit
+
+        async def attempt() -> T:
+            if rate_limits is not None:
+                await rate_limits.acquire(self.credential, endpoint)
+            # The request is authorized on each attempt, so retries are
+            # signed with a fresh nonce and timestamp.
+            return await request(on_response)
+
+        if self._retry_policy is None:
+            return await attempt()
+        return await self._retry_policy.run(http_method, attempt)
+
+    async def stream(
+        self,
+        url: str,
+        data: Optional[Mapping[str, Any]] = None,
+        method: str = 'post',
+        *,
+        length_delimited: bool = False
+    ) -> AsyncIterator[Union[List[Any], Mapping[str, Any]]]:
+        url, headers, body = await self._authorize(
+            url,
+            method.upper(),
+            form=clean_dict(data) if data else None
+        )
+        async for message in self._client.stream(
+                url,
+                method,
+                headers,
+                body,
+                length_delimited=length_delimited
+        ):
+            yield message
+
+    async def get(
+            self,
+            url: str,
+            params: Optional[Mapping[str, Any]] = None,
+            timeout: Optional[float] = None
+    ) -> Union[List[Any], Mapping[str, Any]]:
+        data = clean_optional_dict(params)
+
+        async def request(
+                on_response: Optional[ResponseCallback]
+        ) -> Union[List[Any], Mapping[str, Any]]:
+            signed_url, headers, _ = await self._authorize(url, 'GET', data)
+            return await self._client.get(
+                signed_url,
+                headers,
+                timeout,
+                on_response=on_response
+            )
+
+        # Responses are specific to the credential, as they may depend on the
+        # authenticated user.
+        key = (
+            self.credential,
+            url,
+            tuple(sorted((name, str(value)) for name, value in data.items()))
+            if data else ()
+        )
+        if self._cache is not None:
+            response = self._cache.get(key)
+            if response is not None:
+                return response
+
+        async def fetch() -> Union[List[Any], Mapping[str, Any]]:
+            response = await self._run('GET', url, request)
+            if self._cache is not None:
+                self._cache.put(key, url, response)
+            return response
+
+        if self._in_flight is None:
+            return await fetch()
+
+        # The timeout of the request which started the flight applies.
+        return await self._in_flight.run(key, fetch)
+
+    async def post(
+            self,
+            url: str,
+            params: Optional[Mapping[str, Any]] = None,
+            timeout: Optional[float] = None
+    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+        data = clean_optional_dict(params)
+        body = None if data is None else self._codec.dumps(data)
+
+        async def request(
+                on_response: Optional[ResponseCallback]
+        ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+            signed_url, headers, _ = await self._authorize(url, 'POST', data)
+            return await self._client.post(
+                signed_url,
+                headers,
+                body,
+                timeout,
+                on_response=on_response
+            )
+
+        return await self._run('POST', url, request)
+
+    async def put(
+            self,
+            url: str,
+            params: Optional[Mapping[str, Any]] = None,
+            timeout: Optional[float] = None
+    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+        data = clean_optional_dict(params)
+        body = None if data is None else self._codec.dumps(data)
+
+        async def request(
+                on_response: Optional[ResponseCallback]
+        ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+            signed_url, headers, _ = await self._authorize(url, 'PUT', data)
+            return await self._client.put(
+                signed_url,
+                headers,
+                body,
+                timeout,
+                on_response=on_response
+            )
+
+        return await self._run('PUT', url, request)
+
+    async def delete(
+            self,
+            url: str,
+            params: Optional[Mapping[str, Any]] = None,
+            timeout: Optional[float] = None
+    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+        data = clean_optional_dict(params)
+        body = None if data is None else self._codec.dumps(data)
+
+        async def request(
+                on_response: Optional[ResponseCallback]
+        ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+            signed_url, headers, _ = await self._authorize(url, 'DELETE', data)
+            return await self._client.delete(
+                signed_url,
+                headers,
+                body,
+                timeout,
+                on_response=on_response
+            )
+
+        return await self._run('DELETE', url, request)
+
+    async def close(self) -> None:
+        await self._client.close()
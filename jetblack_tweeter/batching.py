@@ -0,0 +1,104 @@
+"""Batching single lookups into bulk lookups"""
+
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar
+)
+
+K = TypeVar('K', bound=Hashable)
+T = TypeVar('T')
+
+
+class BatchLoader(Generic[K, T]):
+    """Collects the keys requested within a short window into one bulk load.
+
+    Each caller awaits the result for its own key. A batch is dispatched
+    when the window ends or when it reaches the maximum size, whichever is
+    first. Callers requesting a key which is already pending share the
+    result.
+
+    If the bulk load fails every caller in the batch receives the error. A
+    key missing from the results raises a `KeyError` for its callers only.
+    """
+
+    def __init__(
+            self,
+            load: Callable[[Sequence[K]], Awaitable[Mapping[K, T]]],
+            *,
+            window: float = 0.005,
+            max_batch_size: int = 100
+    ) -> None:
+        """Initialise the batch loader.
+
+        Args:
+            load (Callable[[Sequence[K]], Awaitable[Mapping[K, T]]]): A
+                callable to load the results for a batch of keys, returning
+                them by key.
+            window (float, optional): The number of seconds to wait for
+                other keys after the first key of a batch. Defaults to 0.005.
+            max_batch_size (int, optional): The maximum number of keys in a
+                batch. Defaults to 100.
+        """
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._load = load
+        self._pending: Dict[K, 'asyncio.Future[T]'] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set['asyncio.Task[None]'] = set()
+
+    async def load(self, key: K) -> T:
+        """Load the result for a key as part of a batch.
+
+        Args:
+            key (K): The key.
+
+        Returns:
+            T: The result for the key.
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self.window, self._dispatch)
+
+        # The future is shared, so a cancelled caller must not cancel it.
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Mapping[K, 'asyncio.Future[T]']) -> None:
+        try:
+            results = await self._load(list(batch))
+        except Exception as error:  # pylint: disable=broad-except
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for key, future in batch.items():
+            if future.done():
+                continue
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(KeyError(key))
@@ -0,0 +1,130 @@
+"""An HTTP client which uses an OAuth2 app-only bearer token"""
+
+import asyncio
+import base64
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from .base_client import BaseHttpClient
+from .cache import ResponseCache
+from .codecs import AbstractJsonCodec
+from .constants import URL_OAUTH2_TOKEN
+from .rate_limits import RateLimitTracker
+from .retry import RetryPolicy
+from .types import AbstractTweeterSession
+
+
+class BearerHttpClient(BaseHttpClient):
+    """An HTTP client that authenticates with an OAuth2 app-only bearer token.
+
+    The token is fetched with the client credentials grant on the first
+    request and cached for the lifetime of the client. As there is no per
+    request signing this is cheaper than OAuth1, but only endpoints which
+    support app-only authentication may be used.
+    """
+
+    def __init__(
+            self,
+            tweeter_session: AbstractTweeterSession,
+            consumer_key: str,
+            consumer_secret: str,
+            *,
+            bearer_token: Optional[str] = None,
+            codec: Optional[AbstractJsonCodec] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limits: Optional[RateLimitTracker] = None,
+            coalesce_gets: bool = False,
+            cache: Optional[ResponseCache] = None
+    ) -> None:
+        """Initialise the bearer token HTTP client.
+
+        Args:
+            tweeter_session (AbstractTweeterSession): The tweeter session
+                implementation.
+            consumer_key (str): The consumer (API) key.
+            consumer_secret (str): The consumer (API) secret.
+            bearer_token (Optional[str], optional): A previously issued bearer
+                token. If not given one will be requested. Defaults to None.
+            codec (Optional[AbstractJsonCodec], optional): The codec used to
+                encode request bodies. Defaults to None.
+            retry_policy (Optional[RetryPolicy], optional): The policy for
+                retrying failed requests. Defaults to None.
+            rate_limits (Optional[RateLimitTracker], optional): The rate
+                limit tracker. Defaults to None.
+            coalesce_gets (bool, optional): If true concurrent identical GET
+                requests share a single request. Defaults to False.
+            cache (Optional[ResponseCache], optional): A cache for GET
+                responses. Defaults to None.
+        """
+        super().__init__(
+            tweeter_session,
+            codec,
+            retry_policy,
+            rate_limits,
+            f'app:{consumer_key}',
+            coalesce_gets,
+            cache
+        )
+        credentials = f'{quote(consumer_key)}:{quote(consumer_secret)}'
+        self._basic_authorization = 'Basic ' + base64.b64encode(
+            credentials.encode()
+        ).decode()
+        self._bearer_token = bearer_token
+        self._token_lock = asyncio.Lock()
+
+    async def bearer_token(self) -> str:
+        """Get the bearer token, requesting one if necessary.
+
+        Raises:
+            ValueError: If the response was not a bearer token.
+
+        Returns:
+            str: The bearer token.
+        """
+        if self._bearer_token is not None:
+            return self._bearer_token
+
+        async with self._token_lock:
+            # Another task may have fetched the token while we waited.
+            if self._bearer_token is not None:
+                return self._bearer_token
+
+            response = await self._client.post(
+                URL_OAUTH2_TOKEN,
+                {
+                    'Authorization': self._basic_authorization,
+                    'Content-Type': 'application/x-www-form-urlencoded;charset=UTF-8'
+                },
+                'grant_type=client_credentials',
+                None
+            )
+            if (
+                    not isinstance(response, Mapping) or
+                    response.get('token_type') != 'bearer'
+            ):
+                raise ValueError('expected a bearer token')
+            token: str = response['access_token']
+            self._bearer_token = token
+            return token
+
+    def invalidate_token(self) -> None:
+        """Discard the cached bearer token, so that a new one will be requested.
+        """
+        self._bearer_token = None
+
+    async def _authorize(
+            self,
+            url: str,
+            http_method: str,
+            params: Optional[Mapping[str, Any]] = None,
+            form: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[str, Dict[str, str], Optional[str]]:
+        headers = {
+            'Authorization': f'Bearer {await self.bearer_token()}'
+        }
+        if form is not None:
+            headers['content-type'] = 'application/x-www-form-urlencoded'
+        if params:
+            url += f'?{urlencode(params)}'
+        body = urlencode(form) if form else None
+        return url, headers, body
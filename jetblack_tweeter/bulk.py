@@ -0,0 +1,207 @@
+"""Concurrent dispatch of bulk lookups and per-item calls"""
+
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TypeVar,
+    Union
+)
+
+from .pacing import TokenBucket
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# The maximum number of ids accepted by the lookup endpoints.
+LOOKUP_LIMIT = 100
+
+
+async def _aiter(
+        items: Union[Iterable[T], AsyncIterable[T]]
+) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def chunked(
+        items: Union[Iterable[T], AsyncIterable[T]],
+        size: int
+) -> AsyncIterator[List[T]]:
+    """Split an iterable or async iterable into lists.
+
+    Args:
+        items (Union[Iterable[T], AsyncIterable[T]]): The items.
+        size (int): The maximum size of a list.
+
+    Yields:
+        List[T]: The lists of items, in order.
+    """
+    chunk: List[T] = []
+    async for item in _aiter(items):
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def bounded_map(
+        items: Union[Iterable[T], AsyncIterable[T]],
+        call: Callable[[T], Awaitable[R]],
+        *,
+        concurrency: int = 4,
+        ordered: bool = True
+) -> AsyncIterator[R]:
+    """Call an async function for each item, with a bounded number of calls
+    in flight.
+
+    Items are only read when a call can be started, so memory use does not
+    depend on the number of items. If the iteration stops early the calls
+    in flight are cancelled.
+
+    Args:
+        items (Union[Iterable[T], AsyncIterable[T]]): The items.
+        call (Callable[[T], Awaitable[R]]): The function.
+        concurrency (int, optional): The maximum number of calls in flight.
+            Defaults to 4.
+        ordered (bool, optional): If true the results are yielded in the
+            order of the items, otherwise in the order the calls complete.
+            Defaults to True.
+
+    Yields:
+        R: The result of each call.
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+
+    queue: Deque['asyncio.Future[R]'] = deque()
+    pending: Set['asyncio.Future[R]'] = set()
+    try:
+        async for item in _aiter(items):
+            if ordered:
+                if len(queue) == concurrency:
+                    yield await queue.popleft()
+                queue.append(asyncio.ensure_future(call(item)))
+            else:
+                if len(pending) == concurrency:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        yield future.result()
+                pending.add(asyncio.ensure_future(call(item)))
+
+        while queue:
+            yield await queue.popleft()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                yield future.result()
+    finally:
+        for future in (*queue, *pending):
+            future.cancel()
+
+
+def dispatch_chunks(
+        items: Union[Iterable[T], AsyncIterable[T]],
+        call: Callable[[List[T]], Awaitable[R]],
+        *,
+        size: int = LOOKUP_LIMIT,
+        concurrency: int = 4,
+        ordered: bool = True
+) -> AsyncIterator[R]:
+    """Call a bulk function for chunks of the items, with a bounded number
+    of calls in flight.
+
+    Args:
+        items (Union[Iterable[T], AsyncIterable[T]]): The items.
+        call (Callable[[List[T]], Awaitable[R]]): The bulk function.
+        size (int, optional): The maximum number of items in a chunk.
+            Defaults to LOOKUP_LIMIT.
+        concurrency (int, optional): The maximum number of calls in flight.
+            Defaults to 4.
+        ordered (bool, optional): If true the results are yielded in the
+            order of the chunks, otherwise in the order the calls complete.
+            Defaults to True.
+
+    Returns:
+        AsyncIterator[R]: The result of each call.
+    """
+    return bounded_map(
+        chunked(items, size),
+        call,
+        concurrency=concurrency,
+        ordered=ordered
+    )
+
+
+class FanOutResult(NamedTuple):
+    """The result or error of a call for an argument"""
+    argument: Any
+    result: Any
+    error: Optional[Exception]
+
+
+async def fan_out(
+        call: Callable[[T], Awaitable[R]],
+        arguments: Union[Iterable[T], AsyncIterable[T]],
+        *,
+        concurrency: int = 8,
+        pacing: Optional[TokenBucket] = None,
+        ordered: bool = False
+) -> AsyncIterator[FanOutResult]:
+    """Call an async function for each argument, with a bounded number of
+    calls in flight.
+
+    An error from a call is returned with its argument rather than raised,
+    so one failure does not stop the others.
+
+    Args:
+        call (Callable[[T], Awaitable[R]]): The function.
+        arguments (Union[Iterable[T], AsyncIterable[T]]): The arguments.
+        concurrency (int, optional): The maximum number of calls in flight.
+            Defaults to 8.
+        pacing (Optional[TokenBucket], optional): A token bucket taken from
+            before each call. Defaults to None.
+        ordered (bool, optional): If true the results are yielded in the
+            order of the arguments, otherwise in the order the calls
+            complete. Defaults to False.
+
+    Yields:
+        FanOutResult: The result or error for each argument.
+    """
+    async def call_one(argument: T) -> FanOutResult:
+        try:
+            if pacing is not None:
+                await pacing.acquire()
+            return FanOutResult(argument, await call(argument), None)
+        except Exception as error:  # pylint: disable=broad-except
+            return FanOutResult(argument, None, error)
+
+    async for result in bounded_map(
+            arguments,
+            call_one,
+            concurrency=concurrency,
+            ordered=ordered
+    ):
+        yield result
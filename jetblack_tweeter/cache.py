@@ -0,0 +1,160 @@
+"""Caching responses"""
+
+from collections import OrderedDict
+import time
+from typing import (
+    Any,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union
+)
+
+from .rate_limits import endpoint_template
+
+Response = Union[List[Any], Mapping[str, Any]]
+CacheEntry = Tuple[float, str, str, Response]
+
+
+class CacheStats:
+    """The cache metrics"""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f'CacheStats(hits={self.hits}, misses={self.misses}, '
+            f'evictions={self.evictions}, expirations={self.expirations}, '
+            f'invalidations={self.invalidations})'
+        )
+
+
+class ResponseCache:
+    """A size bounded least recently used cache of GET responses.
+
+    The time to live of a response depends on its endpoint template (see
+    `endpoint_template`), so slowly changing data can be kept longer than
+    timelines. For example:
+
+    ```python
+    cache = ResponseCache(
+        ttls={
+            '/2/users/by/username/:username': 3600,
+            '/1.1/statuses/home_timeline.json': 15
+        }
+    )
+    ```
+
+    Cached responses are shared between callers, and should not be
+    modified.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_size: int = 1024,
+            default_ttl: float = 60.0,
+            ttls: Optional[Mapping[str, float]] = None
+    ) -> None:
+        """Initialise the response cache.
+
+        Args:
+            max_size (int, optional): The maximum number of responses.
+                Defaults to 1024.
+            default_ttl (float, optional): The number of seconds a response
+                is kept for endpoints without a specific time to live, where
+                zero disables caching. Defaults to 60.0.
+            ttls (Optional[Mapping[str, float]], optional): The time to live
+                in seconds by endpoint template, where zero disables
+                caching. Defaults to None.
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Response]:
+        """Get a response.
+
+        Args:
+            key (Hashable): The request key.
+
+        Returns:
+            Optional[Response]: The response if cached and not expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires, _url, _endpoint, response = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return response
+
+    def put(self, key: Hashable, url: str, response: Response) -> None:
+        """Add a response.
+
+        Args:
+            key (Hashable): The request key.
+            url (str): The url without the query string.
+            response (Response): The decoded response.
+        """
+        endpoint = endpoint_template(url)
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, url, endpoint, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(
+            self,
+            *,
+            url: Optional[str] = None,
+            endpoint: Optional[str] = None
+    ) -> int:
+        """Remove the responses for a url or an endpoint template, or all the
+        responses if neither is given.
+
+        Args:
+            url (Optional[str], optional): The url without the query string.
+                Defaults to None.
+            endpoint (Optional[str], optional): The endpoint template.
+                Defaults to None.
+
+        Returns:
+            int: The number of responses removed.
+        """
+        keys = [
+            key
+            for key, (_expires, entry_url, entry_endpoint, _response)
+            in self._entries.items()
+            if (url is None or entry_url == url) and
+            (endpoint is None or entry_endpoint == endpoint)
+        ]
+        for key in keys:
+            del self._entries[key]
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all the responses"""
+        self.invalidate()
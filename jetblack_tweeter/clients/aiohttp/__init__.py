@@ -1,7 +1,9 @@
 """Support for aiohttp"""
 
+from .connection_policy import ConnectionPolicy
 from .session import AiohttpTweeterSession
 
 __all__ = [
+    'ConnectionPolicy',
     'AiohttpTweeterSession'
 ]
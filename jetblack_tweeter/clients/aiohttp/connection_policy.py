@@ -0,0 +1,110 @@
+"""Connection policy for aiohttp"""
+
+import inspect
+from ssl import SSLContext
+from typing import Any, Dict, Optional, Union
+
+from aiohttp import Fingerprint, TCPConnector
+
+DEFAULT_HAPPY_EYEBALLS_DELAY = 0.25
+
+# The happy eyeballs settings were introduced in aiohttp 3.10.
+HAS_HAPPY_EYEBALLS = (
+    'happy_eyeballs_delay' in inspect.signature(TCPConnector).parameters
+)
+
+
+class ConnectionPolicy:
+    """The connection settings used for the aiohttp `TCPConnector`.
+
+    The defaults are those of aiohttp.
+    """
+
+    def __init__(
+            self,
+            *,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            use_dns_cache: bool = True,
+            ttl_dns_cache: Optional[int] = 10,
+            keepalive_timeout: Optional[float] = None,
+            force_close: bool = False,
+            enable_cleanup_closed: bool = False,
+            happy_eyeballs: bool = True,
+            happy_eyeballs_delay: float = DEFAULT_HAPPY_EYEBALLS_DELAY
+    ) -> None:
+        """Initialise the connection policy.
+
+        Args:
+            limit (int, optional): The total number of simultaneous
+                connections, where 0 is unlimited. Defaults to 100.
+            limit_per_host (int, optional): The number of simultaneous
+                connections to the same endpoint, where 0 is unlimited.
+                Defaults to 0.
+            use_dns_cache (bool, optional): If true cache DNS lookups.
+                Defaults to True.
+            ttl_dns_cache (Optional[int], optional): The number of seconds to
+                cache DNS lookups, where None caches forever. Defaults to 10.
+            keepalive_timeout (Optional[float], optional): The number of
+                seconds to keep an idle connection alive, where None uses
+                the aiohttp default. Defaults to None.
+            force_close (bool, optional): If true close connections after
+                each request. Defaults to False.
+            enable_cleanup_closed (bool, optional): If true abort SSL
+                connections which were not shut down cleanly. Defaults to
+                False.
+            happy_eyeballs (bool, optional): If true attempt IPv4 and IPv6
+                connections concurrently (RFC 8305). Versions of aiohttp
+                before 3.10 always connect to one address at a time, and
+                ignore this and the delay. Defaults to True.
+            happy_eyeballs_delay (float, optional): The number of seconds to
+                wait before starting the next connection attempt. Defaults to
+                0.25.
+        """
+        if force_close and keepalive_timeout is not None:
+            raise ValueError(
+                'keepalive_timeout cannot be set when force_close is true'
+            )
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.use_dns_cache = use_dns_cache
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.force_close = force_close
+        self.enable_cleanup_closed = enable_cleanup_closed
+        self.happy_eyeballs = happy_eyeballs
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+
+    def make_connector(
+            self,
+            ssl: Optional[Union[SSLContext, bool, Fingerprint]] = None
+    ) -> TCPConnector:
+        """Make a connector using the policy.
+
+        Args:
+            ssl (Optional[Union[SSLContext, bool, Fingerprint]], optional):
+                The ssl settings. Defaults to None.
+
+        Returns:
+            TCPConnector: The connector.
+        """
+        kwargs: Dict[str, Any] = {
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'use_dns_cache': self.use_dns_cache,
+            'ttl_dns_cache': self.ttl_dns_cache,
+            'force_close': self.force_close,
+            'enable_cleanup_closed': self.enable_cleanup_closed
+        }
+        if ssl is not None:
+            kwargs['ssl'] = ssl
+        if self.keepalive_timeout is not None:
+            kwargs['keepalive_timeout'] = self.keepalive_timeout
+        # Happy eyeballs settings are only passed when they differ from the
+        # default, and the installed aiohttp supports them.
+        if HAS_HAPPY_EYEBALLS:
+            if not self.happy_eyeballs:
+                kwargs['happy_eyeballs_delay'] = None
+            elif self.happy_eyeballs_delay != DEFAULT_HAPPY_EYEBALLS_DELAY:
+                kwargs['happy_eyeballs_delay'] = self.happy_eyeballs_delay
+        return TCPConnector(**kwargs)
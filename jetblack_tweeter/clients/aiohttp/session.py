@@ -1,13 +1,22 @@
 """An aiohttp session"""
 
-import json
+import asyncio
 from ssl import SSLContext
 from typing import Any, AsyncIterator, List, Mapping, Optional, Union
 
-from aiohttp import ClientSession, Fingerprint, ClientTimeout
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientSession,
+    ClientTimeout,
+    Fingerprint
+)
 
-from ...errors import ApiError
-from ...types import AbstractTweeterSession
+from ...codecs import AbstractJsonCodec, DEFAULT_CODEC
+from ...errors import ApiError, StreamError
+from ...types import AbstractTweeterSession, ResponseCallback
+
+from .connection_policy import ConnectionPolicy
 
 
 def _make_timeout(timeout: Optional[float]) -> Optional[ClientTimeout]:
@@ -23,105 +32,201 @@ class AiohttpTweeterSession(AbstractTweeterSession):
     def __init__(
             self,
             *,
-            ssl: Optional[Union[SSLContext, bool, Fingerprint]] = None
+            ssl: Optional[Union[SSLContext, bool, Fingerprint]] = None,
+            connection_policy: Optional[ConnectionPolicy] = None,
+            compress_streams: bool = True,
+            codec: Optional[AbstractJsonCodec] = None
     ) -> None:
+        """Initialise the aiohttp session.
+
+        Args:
+            ssl (Optional[Union[SSLContext, bool, Fingerprint]], optional): The
+                ssl settings. Defaults to None.
+            connection_policy (Optional[ConnectionPolicy], optional): The
+                connection limits, DNS caching and keep-alive settings. If
+                not given the aiohttp defaults are used. Defaults to None.
+            compress_streams (bool, optional): If true request gzip
+                compression for streams, which are decompressed as they are
+                read. Defaults to True.
+            codec (Optional[AbstractJsonCodec], optional): The codec used to
+                decode responses. If not given the standard library is used.
+                Defaults to None.
+        """
+        self._codec = codec or DEFAULT_CODEC
         self._ssl = ssl
-        self._client = ClientSession()
+        self._stream_encoding = 'gzip' if compress_streams else 'identity'
+        self._client = ClientSession(
+            connector=connection_policy.make_connector()
+            if connection_policy is not None
+            else None
+        )
 
     async def stream(
             self,
             url: str,
             method: str,
             headers: Mapping[str, str],
-            body: Optional[str]
+            body: Optional[str],
+            *,
+            length_delimited: bool = False
     ) -> AsyncIterator[Union[List[Any], Mapping[str, Any]]]:
-        async with self._client.request(
-                method.upper(),
-                url,
-                headers=headers,
-                data=body,
-                timeout=None,
-                ssl=self._ssl
-        ) as response:
-            response.raise_for_status()
-            async for line in response.content:
-                if not line.strip():
-                    continue
-                yield json.loads(line)
+        try:
+            async with self._client.request(
+                    method.upper(),
+                    url,
+                    headers={
+                        **headers,
+                        'Accept-Encoding': self._stream_encoding
+                    },
+                    data=body,
+                    timeout=None,
+                    ssl=self._ssl
+            ) as response:
+                if not 200 <= response.status < 300:
+                    raise StreamError(
+                        url,
+                        response.status,
+                        {
+                            name.lower(): value
+                            for name, value in response.headers.items()
+                        }
+                    )
+                if length_delimited:
+                    while True:
+                        length_line = await response.content.readline()
+                        if not length_line:
+                            break
+                        if not length_line.strip():
+                            # A keep-alive blank line.
+                            continue
+                        yield self._codec.loads(
+                            await response.content.readexactly(
+                                int(length_line)
+                            )
+                        )
+                else:
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        yield self._codec.loads(line)
+        except (
+                ClientConnectionError,
+                ClientPayloadError,
+                asyncio.IncompleteReadError
+        ) as error:
+            # Raise the builtin error so reconnection does not depend on
+            # aiohttp.
+            raise ConnectionError(str(error)) from error
+
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            headers: Mapping[str, str],
+            body: Optional[str],
+            timeout: Optional[float],
+            on_response: Optional[ResponseCallback]
+    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
+        try:
+            async with self._client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=body.encode() if body else None,
+                    ssl=self._ssl,
+                    timeout=_make_timeout(timeout)
+            ) as response:
+                response_headers = {
+                    name.lower(): value
+                    for name, value in response.headers.items()
+                }
+                if on_response is not None:
+                    on_response(response.status, response_headers)
+                if not 200 <= response.status < 300:
+                    raise ApiError(url, response.status, response_headers)
+                content = await response.read()
+        except (ClientConnectionError, ClientPayloadError) as error:
+            # Raise the builtin error so retries do not depend on aiohttp.
+            raise ConnectionError(str(error)) from error
+
+        if not content.strip():
+            return None
+
+        return self._codec.loads(content)
 
     async def get(
             self,
             url: str,
             headers: Mapping[str, str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Union[List[Any], Mapping[str, Any]]:
-        client_timeout = _make_timeout(timeout)
-        async with self._client.get(
-                url,
-                headers=headers,
-                ssl=self._ssl,
-                timeout=client_timeout
-        ) as response:
-            if 400 <= response.status:
-                raise ApiError(url, response.status, headers)
-            return await response.json()
+        response = await self._request(
+            'GET',
+            url,
+            headers,
+            None,
+            timeout,
+            on_response
+        )
+        if response is None:
+            raise ValueError('no data')
+        return response
 
     async def post(
             self,
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        client_timeout = _make_timeout(timeout)
-        data = body.encode() if body else None
-        async with self._client.post(
-                url,
-                headers=headers,
-                data=data,
-                ssl=self._ssl,
-                timeout=client_timeout
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
+        return await self._request(
+            'POST',
+            url,
+            headers,
+            body,
+            timeout,
+            on_response
+        )
 
     async def put(
             self,
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        client_timeout = _make_timeout(timeout)
-        data = body.encode() if body else None
-        async with self._client.put(
-                url,
-                headers=headers,
-                data=data,
-                ssl=self._ssl,
-                timeout=client_timeout
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
+        return await self._request(
+            'PUT',
+            url,
+            headers,
+            body,
+            timeout,
+            on_response
+        )
 
     async def delete(
             self,
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        client_timeout = _make_timeout(timeout)
-        data = body.encode() if body else None
-        async with self._client.delete(
-                url,
-                headers=headers,
-                data=data,
-                ssl=self._ssl,
-                timeout=client_timeout
-        ) as response:
-            response.raise_for_status()
-            return await response.json()
+        return await self._request(
+            'DELETE',
+            url,
+            headers,
+            body,
+            timeout,
+            on_response
+        )
 
     async def close(self) -> None:
         await self._client.close()
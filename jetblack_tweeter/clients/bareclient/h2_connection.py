@@ -0,0 +1,277 @@
+"""A multiplexed HTTP/2 connection"""
+
+import asyncio
+import ssl
+import time
+from typing import Dict, List, Optional
+
+import h2.config
+import h2.connection
+import h2.errors
+import h2.events
+import h2.exceptions
+
+from .utils import Header, PooledResponse
+
+
+class StreamResetError(ConnectionError):
+    """Raised when the server reset a stream. Only the request on the stream
+    failed, and the connection may still be used.
+    """
+
+
+class RefusedStreamError(StreamResetError):
+    """Raised when the server did not process a stream, so the request can
+    safely be retried on another connection.
+    """
+
+
+class _Stream:
+
+    def __init__(self) -> None:
+        self.status = 0
+        self.headers: List[Header] = []
+        self.chunks: List[bytes] = []
+        self.ended: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.window_updated = asyncio.Event()
+
+
+class H2Connection:
+    """An HTTP/2 connection which multiplexes concurrent requests."""
+
+    MAX_CONCURRENT_STREAMS = 100
+    READ_NUM_BYTES = 65536
+
+    def __init__(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            scheme: str,
+            authority: str
+    ) -> None:
+        """Initialise the connection and start reading from the server.
+
+        Args:
+            reader (asyncio.StreamReader): The stream reader.
+            writer (asyncio.StreamWriter): The stream writer.
+            scheme (str): The url scheme.
+            authority (str): The host and optional port.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._scheme = scheme.encode('ascii')
+        self._authority = authority.encode('ascii')
+        self._state = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(
+                client_side=True,
+                header_encoding=None
+            )
+        )
+        self._streams: Dict[int, _Stream] = {}
+        self._is_closed = False
+        self.last_used = time.monotonic()
+        self.has_received_data = False
+
+        self._state.initiate_connection()
+        self._writer.write(self._state.data_to_send())
+        self._read_task = asyncio.create_task(self._read_loop())
+
+    @property
+    def capacity(self) -> int:
+        """The number of requests which may be in flight at once.
+
+        Returns:
+            int: The number of concurrent streams.
+        """
+        return min(
+            self.MAX_CONCURRENT_STREAMS,
+            self._state.remote_settings.max_concurrent_streams
+        )
+
+    @property
+    def is_reusable(self) -> bool:
+        """True if new requests may be sent on the connection.
+
+        Returns:
+            bool: True if the connection is open.
+        """
+        return not self._is_closed
+
+    async def request(
+            self,
+            method: str,
+            target: str,
+            headers: List[Header],
+            body: Optional[bytes]
+    ) -> PooledResponse:
+        """Send a request on a new stream and read the entire response.
+
+        Args:
+            method (str): The HTTP method.
+            target (str): The path and query string.
+            headers (List[Header]): The request headers.
+            body (Optional[bytes]): The request body.
+
+        Raises:
+            RefusedStreamError: If the server refused the stream.
+            StreamResetError: If the server reset the stream.
+            ConnectionError: If the connection failed.
+
+        Returns:
+            PooledResponse: The response.
+        """
+        if self._is_closed:
+            raise RefusedStreamError('connection closed')
+
+        stream_id = self._state.get_next_available_stream_id()
+        stream = self._streams[stream_id] = _Stream()
+        try:
+            self._state.send_headers(
+                stream_id,
+                [
+                    (b':method', method.encode('ascii')),
+                    (b':authority', self._authority),
+                    (b':scheme', self._scheme),
+                    (b':path', target.encode('ascii')),
+                ] + [
+                    (name, value)
+                    for name, value in headers
+                    if name not in (b'host', b'connection', b'transfer-encoding')
+                ],
+                end_stream=not body
+            )
+            self._writer.write(self._state.data_to_send())
+            if body:
+                await self._send_body(stream_id, stream, body)
+            await self._writer.drain()
+
+            await stream.ended
+            self.last_used = time.monotonic()
+            return PooledResponse(
+                stream.status,
+                stream.headers,
+                b''.join(stream.chunks)
+            )
+        except asyncio.CancelledError:
+            if not self._is_closed and not stream.ended.done():
+                try:
+                    self._state.reset_stream(
+                        stream_id,
+                        h2.errors.ErrorCodes.CANCEL
+                    )
+                    self._writer.write(self._state.data_to_send())
+                except h2.exceptions.ProtocolError:
+                    pass
+            raise
+        finally:
+            del self._streams[stream_id]
+
+    async def _send_body(
+            self,
+            stream_id: int,
+            stream: _Stream,
+            body: bytes
+    ) -> None:
+        view = memoryview(body)
+        while view:
+            size = min(
+                len(view),
+                self._state.local_flow_control_window(stream_id),
+                self._state.max_outbound_frame_size
+            )
+            if size == 0:
+                stream.window_updated.clear()
+                await stream.window_updated.wait()
+                continue
+            self._state.send_data(
+                stream_id,
+                view[:size].tobytes(),
+                end_stream=size == len(view)
+            )
+            self._writer.write(self._state.data_to_send())
+            view = view[size:]
+
+    async def _read_loop(self) -> None:
+        error: Exception = ConnectionError('server closed the connection')
+        try:
+            while not self._is_closed:
+                data = await self._reader.read(self.READ_NUM_BYTES)
+                if not data:
+                    break
+                self.has_received_data = True
+                for event in self._state.receive_data(data):
+                    self._handle_event(event)
+                self._writer.write(self._state.data_to_send())
+        except (ConnectionError, ssl.SSLError, h2.exceptions.ProtocolError) as read_error:
+            error = ConnectionError(str(read_error))
+        except asyncio.CancelledError:
+            pass
+        self._is_closed = True
+        self._fail_streams(error, 0)
+
+    def _handle_event(self, event: h2.events.Event) -> None:
+        if isinstance(event, h2.events.ResponseReceived):
+            stream = self._streams.get(event.stream_id)
+            if stream is not None:
+                for name, value in event.headers:
+                    if name == b':status':
+                        stream.status = int(value)
+                    elif not name.startswith(b':'):
+                        stream.headers.append((name, value))
+        elif isinstance(event, h2.events.DataReceived):
+            self._state.acknowledge_received_data(
+                event.flow_controlled_length,
+                event.stream_id
+            )
+            stream = self._streams.get(event.stream_id)
+            if stream is not None:
+                stream.chunks.append(event.data)
+        elif isinstance(event, h2.events.StreamEnded):
+            stream = self._streams.get(event.stream_id)
+            if stream is not None and not stream.ended.done():
+                stream.ended.set_result(None)
+        elif isinstance(event, h2.events.StreamReset):
+            stream = self._streams.get(event.stream_id)
+            if stream is not None and not stream.ended.done():
+                error_class = (
+                    RefusedStreamError
+                    if event.error_code == h2.errors.ErrorCodes.REFUSED_STREAM
+                    else StreamResetError
+                )
+                stream.ended.set_exception(
+                    error_class(f'stream reset: {event.error_code!r}')
+                )
+        elif isinstance(event, h2.events.WindowUpdated):
+            if event.stream_id == 0:
+                for stream in self._streams.values():
+                    stream.window_updated.set()
+            elif event.stream_id in self._streams:
+                self._streams[event.stream_id].window_updated.set()
+        elif isinstance(event, h2.events.ConnectionTerminated):
+            self._is_closed = True
+            # Streams above the last stream id were not processed.
+            self._fail_streams(
+                RefusedStreamError('connection terminated'),
+                event.last_stream_id or 0
+            )
+
+    def _fail_streams(self, error: Exception, last_stream_id: int) -> None:
+        for stream_id, stream in self._streams.items():
+            if stream_id > last_stream_id and not stream.ended.done():
+                stream.ended.set_exception(error)
+
+    async def close(self) -> None:
+        """Close the connection"""
+        if not self._is_closed:
+            self._is_closed = True
+            try:
+                self._state.close_connection()
+                self._writer.write(self._state.data_to_send())
+            except h2.exceptions.ProtocolError:
+                pass
+        self._read_task.cancel()
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, ssl.SSLError):
+            pass
@@ -0,0 +1,398 @@
+"""A keep-alive connection pool"""
+
+import asyncio
+import ssl
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from urllib.parse import urlsplit
+
+import h11
+
+from .h2_connection import H2Connection, RefusedStreamError, StreamResetError
+from .utils import Header, PooledResponse
+
+HostKey = Tuple[str, str, int]
+
+# The methods which can safely be sent again if the server may have seen
+# them.
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'))
+
+
+class H11Connection:
+    """A persistent HTTP/1.1 connection"""
+
+    def __init__(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+            bufsiz: int = 65536
+    ) -> None:
+        """Initialise the connection.
+
+        Args:
+            reader (asyncio.StreamReader): The stream reader.
+            writer (asyncio.StreamWriter): The stream writer.
+            bufsiz (int, optional): The read buffer size. Defaults to 65536.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._bufsiz = bufsiz
+        self._state = h11.Connection(our_role=h11.CLIENT)
+        self.last_used = time.monotonic()
+        self.has_received_data = False
+
+    @property
+    def capacity(self) -> int:
+        """The number of requests which may be in flight at once.
+
+        Returns:
+            int: Always one, as HTTP/1.1 requests are not pipelined.
+        """
+        return 1
+
+    @property
+    def is_reusable(self) -> bool:
+        """True if another request can be sent on the connection.
+
+        Returns:
+            bool: True if the connection is reusable.
+        """
+        return (
+            self._state.our_state is h11.IDLE and
+            self._state.their_state is h11.IDLE and
+            not self._reader.at_eof()
+        )
+
+    async def request(
+            self,
+            method: str,
+            target: str,
+            headers: List[Header],
+            body: Optional[bytes]
+    ) -> PooledResponse:
+        """Send a request and read the entire response.
+
+        Args:
+            method (str): The HTTP method.
+            target (str): The path and query string.
+            headers (List[Header]): The request headers.
+            body (Optional[bytes]): The request body.
+
+        Raises:
+            ConnectionError: If the server closed the connection.
+
+        Returns:
+            PooledResponse: The response.
+        """
+        self.has_received_data = False
+        data = self._state.send(
+            h11.Request(method=method, target=target, headers=headers)
+        )
+        if body:
+            data += self._state.send(h11.Data(data=body))
+        data += self._state.send(h11.EndOfMessage())
+        self._writer.write(data)
+        await self._writer.drain()
+
+        status = 0
+        response_headers: List[Header] = []
+        chunks: List[bytes] = []
+        while True:
+            event = self._state.next_event()
+            if event is h11.NEED_DATA:
+                buf = await self._reader.read(self._bufsiz)
+                if buf:
+                    self.has_received_data = True
+                self._state.receive_data(buf)
+            elif isinstance(event, h11.Response):
+                status = event.status_code
+                response_headers = list(event.headers)
+            elif isinstance(event, h11.Data):
+                chunks.append(bytes(event.data))
+            elif isinstance(event, h11.EndOfMessage):
+                break
+            elif isinstance(event, h11.ConnectionClosed):
+                raise ConnectionError('server closed the connection')
+
+        if self._state.our_state is h11.DONE and self._state.their_state is h11.DONE:
+            self._state.start_next_cycle()
+        self.last_used = time.monotonic()
+
+        return PooledResponse(status, response_headers, b''.join(chunks))
+
+    async def close(self) -> None:
+        """Close the connection"""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, ssl.SSLError):
+            pass
+
+
+Connection = Union[H11Connection, H2Connection]
+
+
+class _HostPool:
+
+    def __init__(self) -> None:
+        self.condition = asyncio.Condition()
+        self.connections: List[Connection] = []
+        self.active: Dict[Connection, int] = {}
+        self.connecting = 0
+
+
+class ConnectionPool:
+    """A pool of keep-alive connections keyed by host.
+
+    Idle HTTP/1.1 connections are reused most recently used first. When
+    HTTP/2 is enabled and negotiated with ALPN, concurrent requests are
+    multiplexed over a single connection, with further connections only
+    opened when its stream limit is reached. Connections are discarded once
+    they have been idle for longer than the idle timeout.
+    """
+
+    MAX_REFUSED_ATTEMPTS = 3
+
+    def __init__(
+            self,
+            *,
+            max_per_host: int = 10,
+            idle_timeout: float = 30.0,
+            connect_timeout: Optional[float] = None,
+            ssl_context: Optional[ssl.SSLContext] = None,
+            http2: bool = False
+    ) -> None:
+        """Initialise the connection pool.
+
+        Args:
+            max_per_host (int, optional): The maximum number of connections
+                to a single host. Defaults to 10.
+            idle_timeout (float, optional): The number of seconds after which
+                an idle connection is closed. Defaults to 30.0.
+            connect_timeout (Optional[float], optional): The number of seconds
+                to wait for a connection. Defaults to None.
+            ssl_context (Optional[ssl.SSLContext], optional): The ssl context
+                for https connections. Defaults to None.
+            http2 (bool, optional): If true offer HTTP/2 when negotiating
+                https connections, falling back to HTTP/1.1 if the server
+                does not select it. Defaults to False.
+        """
+        self._max_per_host = max_per_host
+        self._idle_timeout = idle_timeout
+        self._connect_timeout = connect_timeout
+        self._ssl_context = ssl_context
+        self._http2 = http2
+        self._hosts: Dict[HostKey, _HostPool] = {}
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            # NPN is deprecated and unavailable with recent OpenSSL builds,
+            # so only ALPN is configured.
+            self._ssl_context = ssl.create_default_context(
+                ssl.Purpose.SERVER_AUTH
+            )
+            self._ssl_context.set_alpn_protocols(
+                ['h2', 'http/1.1'] if self._http2 else ['http/1.1']
+            )
+        return self._ssl_context
+
+    async def _connect(self, key: HostKey, authority: str) -> Connection:
+        scheme, hostname, port = key
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                hostname,
+                port,
+                ssl=self._get_ssl_context() if scheme == 'https' else None
+            ),
+            timeout=self._connect_timeout
+        )
+        ssl_object = writer.get_extra_info('ssl_object')
+        if (
+                ssl_object is not None and
+                ssl_object.selected_alpn_protocol() == 'h2'
+        ):
+            return H2Connection(reader, writer, scheme, authority)
+        return H11Connection(reader, writer)
+
+    def _find_available(self, host_pool: _HostPool) -> Optional[Connection]:
+        available: Optional[Connection] = None
+        for connection in host_pool.connections:
+            if (
+                    connection.is_reusable and
+                    host_pool.active[connection] < connection.capacity and
+                    (available is None or connection.last_used > available.last_used)
+            ):
+                available = connection
+        return available
+
+    def _remove_expired(self, host_pool: _HostPool) -> List[Connection]:
+        expires = time.monotonic() - self._idle_timeout
+        expired = [
+            connection
+            for connection in host_pool.connections
+            if host_pool.active[connection] == 0 and (
+                connection.last_used < expires or not connection.is_reusable
+            )
+        ]
+        for connection in expired:
+            host_pool.connections.remove(connection)
+            del host_pool.active[connection]
+        return expired
+
+    async def _acquire(
+            self,
+            key: HostKey,
+            authority: str,
+            host_pool: _HostPool
+    ) -> Tuple[Connection, bool]:
+        async with host_pool.condition:
+            while True:
+                for expired in self._remove_expired(host_pool):
+                    await expired.close()
+
+                available = self._find_available(host_pool)
+                if available is not None:
+                    host_pool.active[available] += 1
+                    return available, True
+
+                total = len(host_pool.connections) + host_pool.connecting
+                # When HTTP/2 may be negotiated wait for a pending connection,
+                # as it may be able to take this request.
+                if total < self._max_per_host and not (
+                        self._http2 and host_pool.connecting
+                ):
+                    host_pool.connecting += 1
+                    break
+
+                await host_pool.condition.wait()
+
+        connection: Optional[Connection] = None
+        try:
+            connection = await self._connect(key, authority)
+            return connection, False
+        finally:
+            async with host_pool.condition:
+                host_pool.connecting -= 1
+                if connection is not None:
+                    host_pool.connections.append(connection)
+                    host_pool.active[connection] = 1
+                host_pool.condition.notify_all()
+
+    async def _release(
+            self,
+            host_pool: _HostPool,
+            connection: Connection
+    ) -> None:
+        async with host_pool.condition:
+            host_pool.active[connection] -= 1
+            if (
+                    host_pool.active[connection] == 0 and
+                    not connection.is_reusable
+            ):
+                host_pool.connections.remove(connection)
+                del host_pool.active[connection]
+                await connection.close()
+            host_pool.condition.notify_all()
+
+    async def request(
+            self,
+            method: str,
+            url: str,
+            headers: List[Header],
+            body: Optional[bytes],
+            timeout: Optional[float] = None
+    ) -> PooledResponse:
+        """Make a request using a pooled connection.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The url.
+            headers (List[Header]): The request headers.
+            body (Optional[bytes]): The request body.
+            timeout (Optional[float], optional): The number of seconds to wait
+                for the response. Defaults to None.
+
+        Raises:
+            ValueError: If the url has no hostname.
+
+        Returns:
+            PooledResponse: The response.
+        """
+        parts = urlsplit(url)
+        if parts.hostname is None:
+            raise ValueError(f'no hostname in url: {url}')
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+
+        request_headers = [(b'host', parts.netloc.encode('ascii'))] + headers
+        if body and not any(name == b'content-length' for name, _ in headers):
+            request_headers.append(
+                (b'content-length', str(len(body)).encode())
+            )
+
+        host_pool = self._hosts.get(key)
+        if host_pool is None:
+            host_pool = self._hosts[key] = _HostPool()
+
+        refused = 0
+        while True:
+            connection, is_reused = await self._acquire(
+                key,
+                parts.netloc,
+                host_pool
+            )
+            try:
+                return await asyncio.wait_for(
+                    connection.request(
+                        method,
+                        target,
+                        request_headers,
+                        body
+                    ),
+                    timeout=timeout
+                )
+            except RefusedStreamError:
+                # The server did not process the request, so it can be sent
+                # again, but not forever.
+                refused += 1
+                if refused >= self.MAX_REFUSED_ATTEMPTS:
+                    raise
+                continue
+            except StreamResetError:
+                # Only this request failed, so the connection is kept for the
+                # other requests multiplexed on it.
+                raise
+            except (ConnectionError, h11.RemoteProtocolError):
+                await connection.close()
+                # The server may have closed an idle connection before it saw
+                # the request; in which case try another one. As it may have
+                # seen it, only idempotent requests are sent again.
+                if (
+                        is_reused and
+                        not connection.has_received_data and
+                        method.upper() in IDEMPOTENT_METHODS
+                ):
+                    continue
+                raise
+            except BaseException:
+                if isinstance(connection, H11Connection):
+                    await connection.close()
+                raise
+            finally:
+                await self._release(host_pool, connection)
+
+    async def close(self) -> None:
+        """Close all connections"""
+        for host_pool in self._hosts.values():
+            for connection in host_pool.connections:
+                await connection.close()
+        self._hosts.clear()
@@ -1,39 +1,87 @@
 """A bareClient implementation of TweeterSession"""
 
-import json
+import ssl
 from typing import Any, AsyncIterator, List, Mapping, Optional, Union
 
+from h11 import RemoteProtocolError
 from bareclient import (
     HttpClient,
     HttpClientMiddlewareCallback as Middleware
 )
-from bareclient.middlewares import SessionMiddleware
-from bareutils import (
-    text_reader,
-    bytes_writer
-)
+from bareclient.middlewares import compression_middleware
+from bareutils import bytes_writer
 
 
+from ...codecs import AbstractJsonCodec, DEFAULT_CODEC
 from ...errors import ApiError, StreamError
-from ...types import AbstractTweeterSession
+from ...types import AbstractTweeterSession, ResponseCallback
+
+from .pool import ConnectionPool
+from .utils import LengthFramer, LineFramer, make_headers
 
-from .utils import to_lines, make_headers
+USER_AGENT = b'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36'
 
 
 class BareTweeterSession(AbstractTweeterSession):
     """A tweeter session using bareClient."""
 
-    def __init__(self) -> None:
-        self._middleware: List[Middleware] = []  # [SessionMiddleware()]
+    def __init__(
+            self,
+            *,
+            max_connections_per_host: int = 10,
+            idle_timeout: float = 30.0,
+            connect_timeout: Optional[float] = None,
+            http2: bool = False,
+            compress_streams: bool = True,
+            codec: Optional[AbstractJsonCodec] = None
+    ) -> None:
+        """Initialise the bareClient session.
+
+        REST requests are made over keep-alive connections which are pooled
+        by host. Streams use a dedicated HTTP/1.1 connection.
+
+        Args:
+            max_connections_per_host (int, optional): The maximum number of
+                pooled connections to each host. Defaults to 10.
+            idle_timeout (float, optional): The number of seconds after which
+                an idle pooled connection is closed. Defaults to 30.0.
+            connect_timeout (Optional[float], optional): The number of seconds
+                to wait for a connection. Defaults to None.
+            http2 (bool, optional): If true negotiate HTTP/2 for REST requests
+                and multiplex concurrent requests to the same host over a
+                single connection, falling back to HTTP/1.1 if the server
+                does not support it. Defaults to False.
+            compress_streams (bool, optional): If true request gzip
+                compression for streams, which are decompressed as they are
+                read. Defaults to True.
+            codec (Optional[AbstractJsonCodec], optional): The codec used to
+                decode responses. If not given the standard library is used.
+                Defaults to None.
+        """
+        self._codec = codec or DEFAULT_CODEC
+        self._compress_streams = compress_streams
+        self._middleware: List[Middleware] = []
+        if compress_streams:
+            self._middleware.append(compression_middleware)
+        self._pool = ConnectionPool(
+            max_per_host=max_connections_per_host,
+            idle_timeout=idle_timeout,
+            connect_timeout=connect_timeout,
+            http2=http2
+        )
 
     async def stream(
             self,
             url: str,
             method: str,
             headers: Mapping[str, str],
-            body: Optional[str]
+            body: Optional[str],
+            *,
+            length_delimited: bool = False
     ) -> AsyncIterator[Union[List[Any], Mapping[str, Any]]]:
         bare_headers = make_headers(headers)
+        if self._compress_streams:
+            bare_headers.append((b'accept-encoding', b'gzip'))
         buf = body.encode() if body else None
         content = bytes_writer(buf) if buf else None
         if buf:
@@ -41,161 +89,147 @@ class BareTweeterSession(AbstractTweeterSession):
                 (b'content-length', str(len(buf)).encode())
             )
 
-        async with HttpClient(
-                url,
-                method=method.upper(),
-                headers=bare_headers,
-                body=content,
-                middleware=self._middleware,
-                protocols=('http/1.1')
-        ) as response:
-            if not response.ok:
-                raise StreamError(url, response.status, headers)
-
-            if response.body is not None:
-                buf = b''
-                async for item in response.body:
-                    lines, buf = to_lines(buf + item)
-                    for line in lines:
-                        yield json.loads(line.decode())
+        try:
+            async with HttpClient(
+                    url,
+                    method=method.upper(),
+                    headers=bare_headers,
+                    body=content,
+                    middleware=self._middleware,
+                    protocols=('http/1.1',)
+            ) as response:
+                if not response.ok:
+                    raise StreamError(
+                        url,
+                        response.status,
+                        {
+                            name.decode(): value.decode()
+                            for name, value in response.headers
+                        }
+                    )
 
-    async def get(
+                if response.body is not None:
+                    framer: Union[LengthFramer, LineFramer] = (
+                        LengthFramer() if length_delimited else LineFramer()
+                    )
+                    async for item in response.body:
+                        for message in framer.feed(item):
+                            # Skip the keep-alive blank lines.
+                            if message:
+                                yield self._codec.loads(message)
+        except (StreamError, ConnectionError, ssl.SSLCertVerificationError):
+            raise
+        except (OSError, RemoteProtocolError) as error:
+            # Raise the builtin error so reconnection does not depend on
+            # bareclient.
+            raise ConnectionError(str(error)) from error
+
+    async def _request(
             self,
+            method: str,
             url: str,
             headers: Mapping[str, str],
-            timeout: Optional[float]
-    ) -> Union[List[Any], Mapping[str, Any]]:
+            body: Optional[str],
+            timeout: Optional[float],
+            on_response: Optional[ResponseCallback]
+    ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
         bare_headers = make_headers(headers) + [
-            (b'user-agent', b'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36')
+            (b'user-agent', USER_AGENT)
         ]
-        async with HttpClient(
-                url,
-                headers=bare_headers,
-                middleware=self._middleware,
-                protocols=('http/1.1')
-        ) as response:
-            if not response.ok:
-                if response.body is not None:
-                    text = await text_reader(response.body)
-                    print(text)
-                raise ApiError(url, response.status, headers)
+        response = await self._pool.request(
+            method,
+            url,
+            bare_headers,
+            body.encode() if body else None,
+            timeout
+        )
+        response_headers = {
+            name.decode(): value.decode()
+            for name, value in response.headers
+        }
+        if on_response is not None:
+            on_response(response.status, response_headers)
+        if not 200 <= response.status < 300:
+            raise ApiError(url, response.status, response_headers)
+
+        if not response.body:
+            return None
+
+        return self._codec.loads(response.body)
 
-            if response.body is None:
-                raise ValueError('no data')
-
-            content = await text_reader(response.body)
-            return json.loads(content)
+    async def get(
+            self,
+            url: str,
+            headers: Mapping[str, str],
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
+    ) -> Union[List[Any], Mapping[str, Any]]:
+        response = await self._request(
+            'GET',
+            url,
+            headers,
+            None,
+            timeout,
+            on_response
+        )
+        if response is None:
+            raise ValueError('no data')
+        return response
 
     async def post(
             self,
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        bare_headers = make_headers(headers) + [
-            (b'user-agent', b'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36')
-        ]
-        buf = body.encode() if body else None
-        content = bytes_writer(buf) if buf else None
-        if buf:
-            bare_headers.append(
-                (b'content-length', str(len(buf)).encode())
-            )
-
-        response_content: Optional[Union[List[Any], Mapping[str, Any]]] = None
-        async with HttpClient(
-                url,
-                method='POST',
-                headers=bare_headers,
-                body=content,
-                middleware=self._middleware,
-                protocols=('http/1.1')
-        ) as response:
-            if not response.ok:
-                raise ApiError(url, response.status, headers)
-
-            if response.body is None:
-                return None
-
-            body = await text_reader(response.body)
-            response_content = json.loads(body)
-
-        return response_content
+        return await self._request(
+            'POST',
+            url,
+            headers,
+            body,
+            timeout,
+            on_response
+        )
 
     async def put(
             self,
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        bare_headers = make_headers(headers) + [
-            (b'user-agent', b'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36')
-        ]
-        buf = body.encode() if body else None
-        content = bytes_writer(buf) if buf else None
-        if buf:
-            bare_headers.append(
-                (b'content-length', str(len(buf)).encode())
-            )
-
-        response_content: Optional[Union[List[Any], Mapping[str, Any]]] = None
-        async with HttpClient(
-                url,
-                method='PUT',
-                headers=bare_headers,
-                body=content,
-                middleware=self._middleware,
-                protocols=('http/1.1')
-        ) as response:
-            if not response.ok:
-                raise ApiError(url, response.status, headers)
-
-            if response.body is None:
-                return None
-
-            body = await text_reader(response.body)
-            response_content = json.loads(body)
-
-        return response_content
+        return await self._request(
+            'PUT',
+            url,
+            headers,
+            body,
+            timeout,
+            on_response
+        )
 
     async def delete(
             self,
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
-        bare_headers = make_headers(headers) + [
-            (b'user-agent', b'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.80 Safari/537.36')
-        ]
-        buf = body.encode() if body else None
-        content = bytes_writer(buf) if buf else None
-        if buf:
-            bare_headers.append(
-                (b'content-length', str(len(buf)).encode())
-            )
-
-        response_content: Optional[Union[List[Any], Mapping[str, Any]]] = None
-        async with HttpClient(
-                url,
-                method='DELETE',
-                headers=bare_headers,
-                body=content,
-                middleware=self._middleware,
-                protocols=('http/1.1')
-        ) as response:
-            if not response.ok:
-                raise ApiError(url, response.status, headers)
-
-            if response.body is None:
-                return None
-
-            body = await text_reader(response.body)
-            response_content = json.loads(body)
-
-        return response_content
+        return await self._request(
+            'DELETE',
+            url,
+            headers,
+            body,
+            timeout,
+            on_response
+        )
 
     async def close(self) -> None:
-        pass
+        await self._pool.close()
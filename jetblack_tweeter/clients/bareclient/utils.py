@@ -1,10 +1,17 @@
 """Utilities for sessions"""
 
-from typing import List, Mapping, Tuple
+from typing import List, Mapping, NamedTuple, Optional, Tuple
 
 Header = Tuple[bytes, bytes]
 
 
+class PooledResponse(NamedTuple):
+    """A response read from a pooled connection"""
+    status: int
+    headers: List[Header]
+    body: bytes
+
+
 def to_lines(buf) -> Tuple[List[bytes], bytes]:
     lines: List[bytes] = []
     sep = b'\r\n'
@@ -16,6 +23,145 @@ def to_lines(buf) -> Tuple[List[bytes], bytes]:
     return lines, buf
 
 
+class LineFramer:
+    """An incremental line framer.
+
+    Lines are found with a single scan of each chunk and returned as
+    memoryview slices of the chunk, so only a line which spans chunks is
+    copied.
+    """
+
+    def __init__(self, separator: bytes = b'\r\n') -> None:
+        """Initialise the line framer.
+
+        Args:
+            separator (bytes, optional): The line separator. Defaults to
+                b'\r\n'.
+        """
+        self._separator = separator
+        # The ways the separator can be split across two chunks.
+        self._splits = [
+            (len(separator) - split, separator[:split], separator[split:])
+            for split in range(1, len(separator))
+        ]
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[memoryview]:
+        """Add a chunk of data and return the completed lines.
+
+        The returned views refer to the chunk, or to a buffer of its own for
+        a line which spans chunks, and remain valid after further calls.
+
+        Args:
+            data (bytes): The chunk.
+
+        Returns:
+            List[memoryview]: The lines without the separators.
+        """
+        lines: List[memoryview] = []
+        separator = self._separator
+        separator_len = len(separator)
+        view = memoryview(data)
+        start = 0
+
+        if self._buffer:
+            # Complete the pending line. The buffer is handed over with the
+            # line, so it is never resized while a view of it exists.
+            line = self._buffer
+            for start, prefix, suffix in self._splits:
+                # The separator may span the previous chunk and this one.
+                if line.endswith(prefix) and data.startswith(suffix):
+                    del line[-len(prefix):]
+                    break
+            else:
+                index = data.find(separator)
+                if index == -1:
+                    line += view
+                    return lines
+                line += view[:index]
+                start = index + separator_len
+            self._buffer = bytearray()
+            lines.append(memoryview(line))
+
+        while True:
+            index = data.find(separator, start)
+            if index == -1:
+                break
+            lines.append(view[start:index])
+            start = index + separator_len
+
+        if start < len(data):
+            self._buffer += view[start:]
+
+        return lines
+
+
+class LengthFramer:
+    """An incremental framer for length delimited messages.
+
+    Each message is preceded by a line holding its length in bytes. Once the
+    length is known the message is taken without scanning it, as a
+    memoryview slice of the chunk if it is complete, or otherwise copied
+    into a buffer of exactly that size.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the length framer"""
+        self._length_line = bytearray()
+        self._message: Optional[bytearray] = None
+        self._filled = 0
+
+    def feed(self, data: bytes) -> List[memoryview]:
+        """Add a chunk of data and return the completed messages.
+
+        Args:
+            data (bytes): The chunk.
+
+        Raises:
+            ValueError: If a length could not be parsed.
+
+        Returns:
+            List[memoryview]: The messages.
+        """
+        messages: List[memoryview] = []
+        view = memoryview(data)
+        start, end = 0, len(data)
+
+        while start < end:
+            if self._message is not None:
+                count = min(len(self._message) - self._filled, end - start)
+                self._message[self._filled:self._filled + count] = \
+                    view[start:start + count]
+                self._filled += count
+                start += count
+                if self._filled == len(self._message):
+                    messages.append(memoryview(self._message))
+                    self._message = None
+                continue
+
+            index = data.find(b'\n', start)
+            if index == -1:
+                self._length_line += view[start:]
+                break
+            self._length_line += view[start:index]
+            start = index + 1
+            length_line = self._length_line.strip()
+            self._length_line.clear()
+            if not length_line:
+                # A keep-alive blank line.
+                continue
+
+            length = int(length_line)
+            if end - start >= length:
+                messages.append(view[start:start + length])
+                start += length
+            else:
+                self._message = bytearray(length)
+                self._filled = 0
+
+        return messages
+
+
 def make_headers(headers: Mapping[str, str]) -> List[Header]:
     return [
         (name.lower().encode(), value.encode())
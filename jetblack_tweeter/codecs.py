@@ -0,0 +1,90 @@
+"""JSON codecs"""
+
+from abc import ABCMeta, abstractmethod
+import json
+from typing import Any, Union
+
+JsonData = Union[bytes, bytearray, memoryview, str]
+
+
+class AbstractJsonCodec(metaclass=ABCMeta):
+    """The abstract class for JSON codecs.
+
+    Implement this class to use the JSON library of your choice.
+    """
+
+    @abstractmethod
+    def loads(self, data: JsonData) -> Any:
+        """Decode JSON.
+
+        Args:
+            data (JsonData): The encoded JSON.
+
+        Returns:
+            Any: The decoded value.
+        """
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        """Encode a value as JSON.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            str: The encoded JSON.
+        """
+
+
+class JsonCodec(AbstractJsonCodec):
+    """A JSON codec using the standard library."""
+
+    def loads(self, data: JsonData) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value)
+
+
+class OrjsonCodec(AbstractJsonCodec):
+    """A JSON codec using orjson."""
+
+    def __init__(self) -> None:
+        """Initialise the codec.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        import orjson  # pylint: disable=import-outside-toplevel
+        self._orjson = orjson
+
+    def loads(self, data: JsonData) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> str:
+        return self._orjson.dumps(value).decode()
+
+
+class MsgspecCodec(AbstractJsonCodec):
+    """A JSON codec using msgspec."""
+
+    def __init__(self) -> None:
+        """Initialise the codec.
+
+        Raises:
+            ImportError: If msgspec is not installed.
+        """
+        import msgspec  # pylint: disable=import-outside-toplevel
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: JsonData) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> str:
+        return self._encoder.encode(value).decode()
+
+
+DEFAULT_CODEC: AbstractJsonCodec = JsonCodec()
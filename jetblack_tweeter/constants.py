@@ -3,3 +3,4 @@
 URL_STREAM_1_1 = 'https://stream.twitter.com/1.1'
 URL_API_1_1 = 'https://api.twitter.com/1.1'
 URL_API_2 = 'https://api.twitter.com/2'
+URL_OAUTH2_TOKEN = 'https://api.twitter.com/oauth2/token'
@@ -0,0 +1,254 @@
+"""A persistent store of hydrated users and tweets"""
+
+import json
+import sqlite3
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    cast
+)
+
+from .types import AbstractHttpClient
+from .utils import clean_dict, str_list_to_str
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hydrated (
+    kind TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    id TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, variant, id)
+) WITHOUT ROWID
+"""
+
+# SQLite limits the number of parameters in a statement.
+_BATCH_SIZE = 500
+
+
+class HydrationStore:
+    """A SQLite store of hydrated objects.
+
+    Objects are kept by their kind (for example "user" or "tweet"), the
+    variant of the request which fetched them (the fields requested), and
+    their id, with the time they were fetched. Objects older than the
+    maximum age are ignored, and replaced when they are fetched again.
+
+    The database is accessed synchronously, as reads by primary key are
+    fast compared to a network request.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            *,
+            max_age: Optional[float] = 86400.0
+    ) -> None:
+        """Initialise the store.
+
+        Args:
+            path (str): The path of the database file, or ":memory:".
+            max_age (Optional[float], optional): The number of seconds after
+                which an object is stale, or None if objects never become
+                stale. Defaults to 86400.0.
+        """
+        self.max_age = max_age
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def get_many(
+            self,
+            kind: str,
+            variant: str,
+            ids: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Get the fresh objects with the given ids.
+
+        Args:
+            kind (str): The kind of object.
+            variant (str): The request variant.
+            ids (Iterable[str]): The ids.
+
+        Returns:
+            Dict[str, Any]: The objects which were found, by id.
+        """
+        oldest = 0.0 if self.max_age is None else time.time() - self.max_age
+        unique_ids = list(dict.fromkeys(ids))
+        objects: Dict[str, Any] = {}
+        for start in range(0, len(unique_ids), _BATCH_SIZE):
+            batch = unique_ids[start:start + _BATCH_SIZE]
+            cursor = self._connection.execute(
+                f"""
+                SELECT id, data
+                FROM hydrated
+                WHERE kind = ? AND variant = ? AND fetched_at >= ?
+                AND id IN ({', '.join('?' * len(batch))})
+                """,
+                (kind, variant, oldest, *batch)
+            )
+            for object_id, data in cursor:
+                objects[object_id] = json.loads(data)
+        return objects
+
+    def put_many(
+            self,
+            kind: str,
+            variant: str,
+            objects: Mapping[str, Any]
+    ) -> None:
+        """Store objects.
+
+        Args:
+            kind (str): The kind of object.
+            variant (str): The request variant.
+            objects (Mapping[str, Any]): The objects by id.
+        """
+        fetched_at = time.time()
+        with self._connection:
+            self._connection.executemany(
+                """
+                INSERT OR REPLACE INTO hydrated (kind, variant, id, fetched_at, data)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (kind, variant, object_id, fetched_at, json.dumps(value))
+                    for object_id, value in objects.items()
+                ]
+            )
+
+    def invalidate(
+            self,
+            kind: str,
+            ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """Remove objects of a kind, for all variants.
+
+        Args:
+            kind (str): The kind of object.
+            ids (Optional[Iterable[str]], optional): The ids of the objects
+                to remove, or None to remove them all. Defaults to None.
+        """
+        with self._connection:
+            if ids is None:
+                self._connection.execute(
+                    'DELETE FROM hydrated WHERE kind = ?',
+                    (kind,)
+                )
+            else:
+                self._connection.executemany(
+                    'DELETE FROM hydrated WHERE kind = ? AND id = ?',
+                    [(kind, object_id) for object_id in ids]
+                )
+
+    def close(self) -> None:
+        """Close the database"""
+        self._connection.close()
+
+
+def make_variant(params: Mapping[str, Any]) -> str:
+    """Make the variant of a request from the parameters which shape the
+    returned objects.
+
+    Args:
+        params (Mapping[str, Any]): The parameters, excluding the ids.
+
+    Returns:
+        str: The variant.
+    """
+    return '&'.join(
+        f'{name}={value}'
+        for name, value in sorted(clean_dict(params).items())
+    )
+
+
+async def hydrate(
+        store: HydrationStore,
+        kind: str,
+        variant: str,
+        ids: Sequence[str],
+        fetch: Callable[[Sequence[str]], Awaitable[Mapping[str, Any]]]
+) -> Dict[str, Any]:
+    """Get objects from the store, fetching those which are missing or
+    stale.
+
+    Args:
+        store (HydrationStore): The store.
+        kind (str): The kind of object.
+        variant (str): The request variant.
+        ids (Sequence[str]): The ids.
+        fetch (Callable[[Sequence[str]], Awaitable[Mapping[str, Any]]]): A
+            callable to fetch the objects with the given ids, returning them
+            by id.
+
+    Returns:
+        Dict[str, Any]: The objects which were found, by id.
+    """
+    objects = store.get_many(kind, variant, ids)
+    missing = [
+        object_id
+        for object_id in dict.fromkeys(ids)
+        if object_id not in objects
+    ]
+    if missing:
+        fetched = await fetch(missing)
+        store.put_many(kind, variant, fetched)
+        objects.update(fetched)
+    return objects
+
+
+async def hydrated_lookup(
+        client: AbstractHttpClient,
+        store: HydrationStore,
+        kind: str,
+        url: str,
+        ids_name: str,
+        ids: Sequence[str],
+        params: Mapping[str, Any],
+        id_of: Callable[[Mapping[str, Any]], str]
+) -> Mapping[str, Any]:
+    """Lookup objects with a v2 endpoint, using the store for those which
+    have been fetched before.
+
+    Args:
+        client (AbstractHttpClient): The HTTP client.
+        store (HydrationStore): The store.
+        kind (str): The kind of object.
+        url (str): The lookup url.
+        ids_name (str): The name of the ids parameter.
+        ids (Sequence[str]): The ids.
+        params (Mapping[str, Any]): The other parameters.
+        id_of (Callable[[Mapping[str, Any]], str]): A callable to get the id
+            of a returned object.
+
+    Returns:
+        Mapping[str, Any]: The response, with the objects in the order of
+            the ids, and the errors for the ids which were fetched.
+    """
+    errors: List[Any] = []
+
+    async def fetch(missing: Sequence[str]) -> Mapping[str, Any]:
+        response = cast(
+            Mapping[str, Any],
+            await client.get(url, {**params, ids_name: str_list_to_str(missing)})
+        )
+        errors.extend(response.get('errors', []))
+        return {id_of(value): value for value in response.get('data', [])}
+
+    objects = await hydrate(store, kind, make_variant(params), ids, fetch)
+    response: Dict[str, Any] = {}
+    data = [objects[object_id] for object_id in ids if object_id in objects]
+    if data:
+        response['data'] = data
+    if errors:
+        response['errors'] = errors
+    return response
@@ -0,0 +1,136 @@
+"""Matching track terms"""
+
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Set
+)
+
+_TOKEN = re.compile(r'[#@$]?\w+')
+
+
+def _tweet_text(tweet: Mapping[str, Any]) -> str:
+    extended = tweet.get('extended_tweet') or tweet
+    entities = extended.get('entities') or {}
+    urls = [
+        url
+        for entity in (*entities.get('urls', []), *entities.get('media', []))
+        for url in (entity.get('expanded_url'), entity.get('display_url'))
+        if url
+    ]
+    text = extended.get('full_text') or tweet.get('text') or ''
+    return ' '.join((text, *urls))
+
+
+def message_text(message: Mapping[str, Any]) -> str:
+    """Get the text a track term is matched against: the full text of the
+    tweet and the urls of its links and media, and the same for the tweets
+    it retweets or quotes, as the filter stream matches them too.
+
+    Args:
+        message (Mapping[str, Any]): The tweet.
+
+    Returns:
+        str: The text.
+    """
+    retweeted = message.get('retweeted_status')
+    tweets = [
+        message,
+        retweeted,
+        message.get('quoted_status'),
+        retweeted and retweeted.get('quoted_status')
+    ]
+    return ' '.join(_tweet_text(tweet) for tweet in tweets if tweet)
+
+
+def term_words(term: str) -> List[str]:
+    """Split a track term into the words which must all match.
+
+    Args:
+        term (str): The term.
+
+    Returns:
+        List[str]: The case folded words, which may start with "#", "@" or
+            "$".
+    """
+    return _TOKEN.findall(term.casefold())
+
+
+class TrackMatcher:
+    """Finds the track terms which match a text, in one pass over the text.
+
+    The matching follows the track parameter of a filter stream:
+
+    * Matching is case insensitive.
+    * A term with several words, such as "rust lang", matches when every
+      word is in the text, in any order.
+    * Words match whole words only. A plain word also matches a hashtag,
+      mention or cashtag of the same word, but a hashtag term such as
+      "#python" only matches the hashtag.
+
+    The words of all the terms are compiled into one table, and the text is
+    split into words once, so the cost of matching depends on the length of
+    the text and the number of words found rather than the number of terms.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        """Compile the track terms.
+
+        Args:
+            terms (Iterable[str]): The track terms.
+        """
+        self.terms = tuple(terms)
+
+        # The terms containing each word, and the number of distinct words
+        # of each term.
+        self._word_terms: Dict[str, List[int]] = {}
+        self._term_sizes: List[int] = []
+        for term_id, term in enumerate(self.terms):
+            words = set(term_words(term))
+            self._term_sizes.append(len(words))
+            for word in words:
+                self._word_terms.setdefault(word, []).append(term_id)
+
+    def _find_words(self, text: str) -> Set[str]:
+        found: Set[str] = set()
+        for token in _TOKEN.findall(text.casefold()):
+            if token in self._word_terms:
+                found.add(token)
+            # A hashtag, mention or cashtag also matches the plain word.
+            if token[0] in '#@$' and token[1:] in self._word_terms:
+                found.add(token[1:])
+        return found
+
+    def match(self, text: str) -> List[str]:
+        """Find the terms which match a text.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            List[str]: The matching terms, in the order they were given.
+        """
+        counts: Dict[int, int] = {}
+        for word in self._find_words(text):
+            for term_id in self._word_terms[word]:
+                counts[term_id] = counts.get(term_id, 0) + 1
+        return [
+            self.terms[term_id]
+            for term_id in sorted(counts)
+            if counts[term_id] == self._term_sizes[term_id]
+        ]
+
+    def match_message(self, message: Mapping[str, Any]) -> List[str]:
+        """Find the terms which match a tweet.
+
+        Args:
+            message (Mapping[str, Any]): The tweet.
+
+        Returns:
+            List[str]: The matching terms, in the order they were given.
+        """
+        return self.match(message_text(message))
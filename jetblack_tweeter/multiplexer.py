@@ -0,0 +1,455 @@
+"""Sharing one filter stream between many subscriptions"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union
+)
+
+from .api import Stream
+from .matching import TrackMatcher
+from .reconnect import ReconnectPolicy
+from .types import BoundingBox
+
+LOGGER = logging.getLogger(__name__)
+
+TException = TypeVar('TException', bound=BaseException)
+
+# The limits of a filter stream.
+MAX_TRACK = 400
+MAX_FOLLOW = 5000
+MAX_LOCATIONS = 25
+
+StreamConfig = Tuple[
+    Tuple[str, ...],
+    Tuple[int, ...],
+    Tuple[BoundingBox, ...]
+]
+
+
+def normalise_term(term: str) -> str:
+    """Normalise a track term, so equivalent terms can be merged.
+
+    Args:
+        term (str): The term.
+
+    Returns:
+        str: The normalised term.
+    """
+    return ' '.join(term.casefold().split())
+
+
+def _in_box(longitude: float, latitude: float, box: BoundingBox) -> bool:
+    (west, south), (east, north) = box
+    return west <= longitude <= east and south <= latitude <= north
+
+
+def _place_overlaps(place: Mapping[str, Any], box: BoundingBox) -> bool:
+    try:
+        corners = place['bounding_box']['coordinates'][0]
+    except (KeyError, IndexError, TypeError):
+        return False
+    longitudes = [corner[0] for corner in corners]
+    latitudes = [corner[1] for corner in corners]
+    (west, south), (east, north) = box
+    return (
+        min(longitudes) <= east and max(longitudes) >= west and
+        min(latitudes) <= north and max(latitudes) >= south
+    )
+
+
+class _End:
+    """Marks the end of a subscription"""
+
+
+class _Failed:
+    """Carries the error which ended the upstream stream"""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class Subscription:
+    """A logical subscription to a shared filter stream.
+
+    Messages which match any of the track terms, followed users or
+    locations are queued for the subscriber. Messages which are not tweets,
+    such as limit notices and warnings, are sent to every subscription.
+    If the subscriber falls more than `max_queue` messages behind, new
+    messages are dropped and counted in `dropped`.
+    """
+
+    def __init__(
+            self,
+            multiplexer: StreamMultiplexer,
+            track: Sequence[str],
+            follow: Sequence[int],
+            locations: Sequence[BoundingBox],
+            max_queue: int
+    ) -> None:
+        self.track = tuple(track)
+        self.follow = frozenset(follow)
+        self.locations = tuple(locations)
+        self.max_queue = max_queue
+        self.dropped = 0
+        self._terms = frozenset(normalise_term(term) for term in self.track)
+        self._multiplexer = multiplexer
+        self._queue: 'asyncio.Queue[Union[Any, _End, _Failed]]' = (
+            asyncio.Queue()
+        )
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._messages()
+
+    async def _messages(self) -> AsyncIterator[Any]:
+        while True:
+            item = await self._queue.get()
+            if isinstance(item, _End):
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+
+    def matches(
+            self,
+            message: Mapping[str, Any],
+            matching_terms: Set[str]
+    ) -> bool:
+        """Check if a tweet matches the subscription.
+
+        Args:
+            message (Mapping[str, Any]): The tweet.
+            matching_terms (Set[str]): The normalised track terms which
+                match the tweet.
+
+        Returns:
+            bool: True if the tweet matches.
+        """
+        if not self._terms.isdisjoint(matching_terms):
+            return True
+
+        if self.follow:
+            retweeted = message.get('retweeted_status') or {}
+            user_ids = (
+                message.get('user', {}).get('id'),
+                retweeted.get('user', {}).get('id'),
+                message.get('in_reply_to_user_id')
+            )
+            if any(user_id in self.follow for user_id in user_ids):
+                return True
+
+        if self.locations:
+            coordinates = (message.get('coordinates') or {}).get('coordinates')
+            place = message.get('place')
+            for box in self.locations:
+                if coordinates is not None:
+                    if _in_box(coordinates[0], coordinates[1], box):
+                        return True
+                elif place and _place_overlaps(place, box):
+                    return True
+
+        return False
+
+    def deliver(self, message: Any) -> None:
+        """Queue a message for the subscriber.
+
+        Args:
+            message (Any): The message.
+        """
+        if self._queue.qsize() >= self.max_queue:
+            self.dropped += 1
+        else:
+            self._queue.put_nowait(message)
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """End the subscription, after the queued messages.
+
+        Args:
+            error (Optional[BaseException], optional): An error to raise to
+                the subscriber. Defaults to None.
+        """
+        self._queue.put_nowait(_End() if error is None else _Failed(error))
+
+    def close(self) -> None:
+        """Unsubscribe"""
+        self._multiplexer.unsubscribe(self)
+
+
+class StreamMultiplexer:
+    """Shares one filter stream between many subscriptions.
+
+    The track terms, followed users and locations of the subscriptions are
+    merged into one upstream filter stream, and each message is routed to
+    the subscriptions it matches. When subscriptions are added or removed
+    the upstream stream is reopened, once the subscriptions have been
+    unchanged for the debounce period. If the upstream stream fails, the
+    subscriptions it was opened for end with the error, and any added
+    since are given a new stream. For example:
+
+    ```python
+    async with StreamMultiplexer(tweeter.stream) as multiplexer:
+        python = multiplexer.subscribe(track=['#python'])
+        java = multiplexer.subscribe(track=['#java'])
+        async for tweet in python:
+            print(tweet['text'])
+    ```
+    """
+
+    def __init__(
+            self,
+            stream: Stream,
+            *,
+            debounce: float = 1.0,
+            reconnect: Optional[ReconnectPolicy] = None,
+            max_queue: int = 10000,
+            **kwargs: Any
+    ) -> None:
+        """Initialise the stream multiplexer.
+
+        Args:
+            stream (Stream): The stream end point.
+            debounce (float, optional): The number of seconds the
+                subscriptions must be unchanged before the upstream stream
+                is reopened. Defaults to 1.0.
+            reconnect (Optional[ReconnectPolicy], optional): The policy for
+                reconnecting the upstream stream. If not given a default
+                policy is used. Defaults to None.
+            max_queue (int, optional): The default maximum number of queued
+                messages for each subscription. Defaults to 10000.
+            **kwargs (Any): Other keyword arguments to `Stream.filter`.
+
+        Raises:
+            ValueError: If the maximum queue size is less than 1.
+        """
+        if max_queue < 1:
+            raise ValueError('max_queue must be at least 1')
+        self.debounce = debounce
+        self.reconnect = reconnect or ReconnectPolicy()
+        self.max_queue = max_queue
+        self.config: StreamConfig = ((), (), ())
+        self._matcher = TrackMatcher(())
+        self._stream = stream
+        self._kwargs = kwargs
+        self._subscriptions: List[Subscription] = []
+        self._changed: Optional[asyncio.Event] = None
+        self._manager: Optional['asyncio.Task[None]'] = None
+        self._upstream: Optional['asyncio.Task[None]'] = None
+
+    @property
+    def subscriptions(self) -> Sequence[Subscription]:
+        """The current subscriptions.
+
+        Returns:
+            Sequence[Subscription]: The subscriptions.
+        """
+        return self._subscriptions
+
+    def subscribe(
+            self,
+            *,
+            track: Optional[Sequence[str]] = None,
+            follow: Optional[Sequence[int]] = None,
+            locations: Optional[Sequence[BoundingBox]] = None,
+            max_queue: Optional[int] = None
+    ) -> Subscription:
+        """Add a subscription. This must be called from a running event
+        loop.
+
+        Args:
+            track (Optional[Sequence[str]], optional): The keywords or
+                phrases to track. Defaults to None.
+            follow (Optional[Sequence[int]], optional): The ids of the users
+                to follow. Defaults to None.
+            locations (Optional[Sequence[BoundingBox]], optional): The
+                bounding boxes to track. Defaults to None.
+            max_queue (Optional[int], optional): The maximum number of
+                queued messages, if not the default. Defaults to None.
+
+        Raises:
+            ValueError: If the maximum queue size is less than 1, or the
+                merged subscriptions would exceed the limits of a filter
+                stream.
+
+        Returns:
+            Subscription: The subscription, which is iterated for its
+                messages.
+        """
+        if max_queue is None:
+            max_queue = self.max_queue
+        elif max_queue < 1:
+            raise ValueError('max_queue must be at least 1')
+        subscription = Subscription(
+            self,
+            track or (),
+            follow or (),
+            locations or (),
+            max_queue
+        )
+        track_terms, follow_ids, boxes = self._merge(
+            [*self._subscriptions, subscription]
+        )
+        if (
+                len(track_terms) > MAX_TRACK or
+                len(follow_ids) > MAX_FOLLOW or
+                len(boxes) > MAX_LOCATIONS
+        ):
+            raise ValueError('the filter stream limits would be exceeded')
+        self._subscriptions.append(subscription)
+        self._notify()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription, ending its iteration.
+
+        Args:
+            subscription (Subscription): The subscription.
+        """
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            subscription.end()
+            self._notify()
+
+    async def close(self) -> None:
+        """Close the upstream stream and end the subscriptions"""
+        for task in (self._manager, self._upstream):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._manager = self._upstream = self._changed = None
+        self.config = ((), (), ())
+        for subscription in self._subscriptions:
+            subscription.end()
+        self._subscriptions.clear()
+
+    async def __aenter__(self) -> StreamMultiplexer:
+        return self
+
+    async def __aexit__(
+            self,
+            exec_type: Optional[Type[TException]],
+            exec_value: Optional[TException],
+            traceback: Optional[TracebackType]
+    ) -> Optional[bool]:
+        await self.close()
+        return None
+
+    @classmethod
+    def _merge(cls, subscriptions: Iterable[Subscription]) -> StreamConfig:
+        track_terms = {
+            normalise_term(term): None
+            for subscription in subscriptions
+            for term in subscription.track
+        }
+        follow_ids = {
+            user_id
+            for subscription in subscriptions
+            for user_id in subscription.follow
+        }
+        boxes = {
+            box: None
+            for subscription in subscriptions
+            for box in subscription.locations
+        }
+        return (
+            tuple(sorted(track_terms)),
+            tuple(sorted(follow_ids)),
+            tuple(boxes)
+        )
+
+    def _notify(self) -> None:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+            self._manager = asyncio.ensure_future(self._manage(self._changed))
+        self._changed.set()
+
+    async def _manage(self, changed: asyncio.Event) -> None:
+        while True:
+            await changed.wait()
+            # Wait for the subscriptions to settle.
+            while True:
+                changed.clear()
+                try:
+                    await asyncio.wait_for(changed.wait(), self.debounce)
+                except asyncio.TimeoutError:
+                    break
+
+            config = self._merge(self._subscriptions)
+            if config == self.config:
+                continue
+
+            if self._upstream is not None:
+                self._upstream.cancel()
+                try:
+                    await self._upstream
+                except asyncio.CancelledError:
+                    pass
+                self._upstream = None
+
+            self.config = config
+            self._matcher = TrackMatcher(config[0])
+            if any(config):
+                LOGGER.debug('Reopening the filter stream with %s', config)
+                self._upstream = asyncio.ensure_future(
+                    self._follow(config, list(self._subscriptions))
+                )
+
+    async def _follow(
+            self,
+            config: StreamConfig,
+            subscriptions: List[Subscription]
+    ) -> None:
+        track_terms, follow_ids, boxes = config
+        try:
+            async for message in self._stream.filter(
+                    track=list(track_terms) or None,
+                    follow=list(follow_ids) or None,
+                    locations=list(boxes) or None,
+                    reconnect=self.reconnect,
+                    **self._kwargs
+            ):
+                self.route(message)
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.warning('The filter stream failed: %s', error)
+            for subscription in subscriptions:
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+                    subscription.end(error)
+            self.config = ((), (), ())
+            if self._subscriptions:
+                # The subscriptions added since the stream was opened were
+                # not part of it.
+                self._notify()
+
+    def route(self, message: Any) -> None:
+        """Send a message to the subscriptions it matches.
+
+        Args:
+            message (Any): The message.
+        """
+        if not isinstance(message, Mapping) or 'id' not in message:
+            # Notices, such as limits and warnings, are for everyone.
+            for subscription in self._subscriptions:
+                subscription.deliver(message)
+            return
+
+        matching_terms = set(self._matcher.match_message(message))
+        for subscription in self._subscriptions:
+            if subscription.matches(message, matching_terms):
+                subscription.deliver(message)
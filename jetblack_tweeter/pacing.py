@@ -0,0 +1,65 @@
+"""Pacing requests"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """A token bucket for pacing requests to an average rate.
+
+    Tokens are added at a fixed rate up to the capacity of the bucket, and
+    each request takes a token, waiting if the bucket is empty. The
+    capacity allows short bursts above the rate. Waiters are served in
+    turn.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: float = 1.0
+    ) -> None:
+        """Initialise the token bucket.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (float, optional): The maximum number of tokens.
+                Defaults to 1.0.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens available now.
+
+        Returns:
+            float: The number of tokens.
+        """
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Take tokens, waiting until they are available.
+
+        Args:
+            tokens (float, optional): The number of tokens. Defaults to 1.0.
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
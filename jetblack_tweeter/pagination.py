@@ -0,0 +1,406 @@
+"""Following pagination tokens"""
+
+import asyncio
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union
+)
+
+from .utils import datetime_to_snowflake
+
+T = TypeVar('T')
+
+
+class _End:
+    """Marks the end of a prefetched iterator"""
+
+
+class _Failed:
+    """Carries an error from a prefetched iterator"""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+async def prefetch(
+        iterator: AsyncIterator[T],
+        depth: int
+) -> AsyncGenerator[T, None]:
+    """Read ahead of the consumer of an async iterator.
+
+    The items are read by a background task, at most `depth` items ahead
+    of the consumer, so the wait for the next item overlaps with the
+    processing of the current one. The task is cancelled when the
+    iteration stops.
+
+    Args:
+        iterator (AsyncIterator[T]): The iterator.
+        depth (int): The maximum number of items read ahead.
+
+    Yields:
+        T: The items of the iterator.
+    """
+    queue: 'asyncio.Queue[Union[T, _End, _Failed]]' = asyncio.Queue()
+    # A slot is taken for each item read and returned when it is consumed.
+    slots = asyncio.Semaphore(depth)
+
+    async def read() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                queue.put_nowait(item)
+            queue.put_nowait(_End())
+        except Exception as error:  # pylint: disable=broad-except
+            queue.put_nowait(_Failed(error))
+
+    task = asyncio.ensure_future(read())
+    try:
+        while True:
+            item = await queue.get()
+            slots.release()
+            if isinstance(item, _End):
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+    finally:
+        task.cancel()
+
+
+class Paginator:
+    """Follows the pagination tokens of a v2 endpoint.
+
+    The endpoint method is called with its arguments and the pagination
+    token of each page in turn, until there are no more pages or a limit is
+    reached. For example:
+
+    ```python
+    paginator = Paginator(
+        tweeter.users.followers,
+        user_id,
+        max_results=1000,
+        max_items=5000
+    )
+    async for user in paginator:
+        print(user['username'])
+    ```
+
+    Only one page is held at a time, unless pages are prefetched, when the
+    next pages are requested while the current page is processed. The
+    token of the page after the last page yielded is available as
+    `next_token`, so a crawl can be checkpointed and resumed by passing it
+    as `pagination_token` to a new paginator. If `items` stops part way
+    through a page, `next_token` is the token of that page and
+    `page_offset` the number of its items already yielded, to be passed to
+    the new paginator too. If a request fails the token is unchanged, so
+    the failed page is requested again on resumption.
+    """
+
+    def __init__(
+            self,
+            fetch: Callable[..., Awaitable[Any]],
+            *args: Any,
+            max_pages: Optional[int] = None,
+            max_items: Optional[int] = None,
+            pagination_token: Optional[str] = None,
+            page_offset: int = 0,
+            prefetch_depth: int = 0,
+            **kwargs: Any
+    ) -> None:
+        """Initialise the paginator.
+
+        Args:
+            fetch (Callable[..., Awaitable[Any]]): The endpoint method, which
+                must take a `pagination_token` keyword argument.
+            *args (Any): The positional arguments of the endpoint method.
+            max_pages (Optional[int], optional): The maximum number of pages
+                to fetch. Defaults to None.
+            max_items (Optional[int], optional): The maximum number of items
+                to yield from `items`. Defaults to None.
+            pagination_token (Optional[str], optional): The token of the
+                first page, to resume a previous crawl. Defaults to None.
+            page_offset (int, optional): The number of items of the first
+                page to skip in `items`, to resume a previous crawl.
+                Defaults to 0.
+            prefetch_depth (int, optional): The number of pages to request
+                ahead of the consumer, or zero to request each page when it
+                is needed. Defaults to 0.
+            **kwargs (Any): The keyword arguments of the endpoint method.
+        """
+        self.max_pages = max_pages
+        self.max_items = max_items
+        self.next_token = pagination_token
+        self.page_offset = page_offset
+        self.prefetch_depth = prefetch_depth
+        self.page_count = 0
+        self.item_count = 0
+        self.exhausted = False
+        self._page_token = pagination_token
+        self._fetch = fetch
+        self._args = args
+        self._kwargs = kwargs
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.items()
+
+    async def _fetch_pages(
+            self
+    ) -> AsyncGenerator[
+        Tuple[Mapping[str, Any], Optional[str], Optional[str]],
+        None
+    ]:
+        if self.exhausted:
+            return
+        token = self.next_token
+        page_count = self.page_count
+        while self.max_pages is None or page_count < self.max_pages:
+            page = await self._fetch(
+                *self._args,
+                pagination_token=token,
+                **self._kwargs
+            )
+            page_count += 1
+            next_token = page.get('meta', {}).get('next_token')
+            yield page, token, next_token
+            if next_token is None:
+                return
+            token = next_token
+
+    async def pages(self) -> AsyncGenerator[Mapping[str, Any], None]:
+        """Iterate over the pages.
+
+        Yields:
+            Mapping[str, Any]: The response for each page.
+        """
+        pages = self._fetch_pages()
+        if self.prefetch_depth > 0:
+            pages = prefetch(pages, self.prefetch_depth)
+        try:
+            async for page, token, next_token in pages:
+                self.page_count += 1
+                self._page_token = token
+                self.next_token = next_token
+                self.exhausted = next_token is None
+                yield page
+        finally:
+            await pages.aclose()
+
+    async def items(self) -> AsyncIterator[Any]:
+        """Iterate over the items in the "data" of each page.
+
+        Yields:
+            Any: Each item.
+        """
+        if self.max_items is not None and self.item_count >= self.max_items:
+            return
+        skip, self.page_offset = self.page_offset, 0
+        # The checkpoint to restore if the iteration stops within a page.
+        rewind: Optional[Tuple[Optional[str], int]] = None
+        pages = self.pages()
+        try:
+            async for page in pages:
+                data = page.get('data', [])
+                for index in range(skip, len(data)):
+                    self.item_count += 1
+                    rewind = (
+                        (self._page_token, index + 1)
+                        if index + 1 < len(data)
+                        else None
+                    )
+                    yield data[index]
+                    if (
+                            self.max_items is not None and
+                            self.item_count >= self.max_items
+                    ):
+                        return
+                skip = 0
+        finally:
+            if rewind is not None:
+                self.next_token, self.page_offset = rewind
+                self.exhausted = False
+            await pages.aclose()
+
+
+class MaxIdCursor:
+    """Walks backwards through a v1.1 timeline or search with max_id.
+
+    Each request asks for the tweets older than the oldest tweet of the
+    previous page, until there are no more tweets or the floor is reached.
+    For example:
+
+    ```python
+    cursor = MaxIdCursor(
+        tweeter.statuses.user_timeline,
+        screen_name='jack',
+        count=200,
+        since=datetime(2022, 1, 1, tzinfo=timezone.utc)
+    )
+    async for tweet in cursor:
+        print(tweet['text'])
+    ```
+
+    The endpoint method must take `max_id` and `since_id` keyword
+    arguments, and return a list of tweets or a search response with
+    "statuses". Ids are compared as the integer "id" of each tweet, and
+    tweets outside the window of a page are dropped, so pages with
+    overlapping edges do not yield duplicates.
+
+    The `max_id` of the next page is available for checkpointing. If
+    `items` stops part way through a page it is the id below the last
+    tweet yielded, so no tweets are skipped on resumption. Iteration
+    stops at an empty page, which is how the endpoints report the end of
+    the timeline.
+    """
+
+    def __init__(
+            self,
+            fetch: Callable[..., Awaitable[Any]],
+            *args: Any,
+            max_id: Optional[int] = None,
+            since_id: Optional[int] = None,
+            since: Optional[datetime] = None,
+            max_pages: Optional[int] = None,
+            max_items: Optional[int] = None,
+            prefetch_depth: int = 0,
+            **kwargs: Any
+    ) -> None:
+        """Initialise the cursor.
+
+        Args:
+            fetch (Callable[..., Awaitable[Any]]): The endpoint method.
+            *args (Any): The positional arguments of the endpoint method.
+            max_id (Optional[int], optional): The id of the newest tweet to
+                return, to resume a previous walk. Defaults to None.
+            since_id (Optional[int], optional): Only tweets with a greater id
+                are returned. Defaults to None.
+            since (Optional[datetime], optional): Only tweets created at or
+                after this time are returned. Defaults to None.
+            max_pages (Optional[int], optional): The maximum number of pages
+                to fetch. Defaults to None.
+            max_items (Optional[int], optional): The maximum number of tweets
+                to yield from `items`. Defaults to None.
+            prefetch_depth (int, optional): The number of pages to request
+                ahead of the consumer. Defaults to 0.
+            **kwargs (Any): The keyword arguments of the endpoint method.
+        """
+        self.max_id = max_id
+        self.floor_id = max(
+            since_id or 0,
+            datetime_to_snowflake(since) - 1 if since is not None else 0
+        )
+        self.max_pages = max_pages
+        self.max_items = max_items
+        self.prefetch_depth = prefetch_depth
+        self.page_count = 0
+        self.item_count = 0
+        self.exhausted = False
+        self._fetch = fetch
+        self._args = args
+        self._kwargs = kwargs
+
+    def __aiter__(self) -> AsyncIterator[Mapping[str, Any]]:
+        return self.items()
+
+    async def _fetch_pages(
+            self
+    ) -> AsyncGenerator[Tuple[List[Mapping[str, Any]], Optional[int]], None]:
+        if self.exhausted:
+            return
+        max_id = self.max_id
+        page_count = self.page_count
+        while self.max_pages is None or page_count < self.max_pages:
+            response = await self._fetch(
+                *self._args,
+                max_id=max_id,
+                since_id=self.floor_id or None,
+                **self._kwargs
+            )
+            page_count += 1
+            tweets: List[Mapping[str, Any]] = (
+                response['statuses'] if isinstance(response, Mapping)
+                else response
+            )
+            if not tweets:
+                yield [], None
+                return
+            next_max_id = min(tweet['id'] for tweet in tweets) - 1
+            page = [
+                tweet
+                for tweet in tweets
+                if self.floor_id < tweet['id'] and (
+                    max_id is None or tweet['id'] <= max_id
+                )
+            ]
+            if next_max_id <= self.floor_id or (
+                    max_id is not None and next_max_id >= max_id
+            ):
+                # The floor was reached, or the endpoint made no progress.
+                yield page, None
+                return
+            yield page, next_max_id
+            max_id = next_max_id
+
+    async def pages(self) -> AsyncGenerator[List[Mapping[str, Any]], None]:
+        """Iterate over the pages, skipping pages with no new tweets.
+
+        Yields:
+            List[Mapping[str, Any]]: The tweets of each page, newest first.
+        """
+        pages = self._fetch_pages()
+        if self.prefetch_depth > 0:
+            pages = prefetch(pages, self.prefetch_depth)
+        try:
+            async for page, next_max_id in pages:
+                self.page_count += 1
+                if next_max_id is None:
+                    self.exhausted = True
+                else:
+                    self.max_id = next_max_id
+                if page:
+                    yield page
+        finally:
+            await pages.aclose()
+
+    async def items(self) -> AsyncIterator[Mapping[str, Any]]:
+        """Iterate over the tweets, newest first.
+
+        Yields:
+            Mapping[str, Any]: Each tweet.
+        """
+        if self.max_items is not None and self.item_count >= self.max_items:
+            return
+        # The checkpoint to restore if the iteration stops within a page.
+        rewind: Optional[int] = None
+        pages = self.pages()
+        try:
+            async for page in pages:
+                for index, tweet in enumerate(page):
+                    self.item_count += 1
+                    rewind = (
+                        tweet['id'] - 1 if index + 1 < len(page) else None
+                    )
+                    yield tweet
+                    if (
+                            self.max_items is not None and
+                            self.item_count >= self.max_items
+                    ):
+                        return
+        finally:
+            if rewind is not None:
+                self.max_id = rewind
+                self.exhausted = False
+            await pages.aclose()
@@ -0,0 +1,158 @@
+"""Tracking rate limits"""
+
+import asyncio
+import time
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+RateLimitKey = Tuple[str, str]
+
+
+class RateLimit(NamedTuple):
+    """The rate limit state of an endpoint"""
+    limit: int
+    remaining: int
+    reset: float
+
+
+def endpoint_template(url: str) -> str:
+    """Make the endpoint template for a url.
+
+    Rate limits apply to an endpoint rather than a url, so ids and usernames
+    in the path are replaced by placeholders.
+
+    Args:
+        url (str): The url.
+
+    Returns:
+        str: The path with ":id" and ":username" placeholders.
+    """
+    segments = urlsplit(url).path.split('/')
+    # The first segment is the api version.
+    for index in range(2, len(segments)):
+        stem, dot, extension = segments[index].partition('.')
+        if segments[index - 1] == 'username':
+            segments[index] = ':username' + dot + extension
+        elif stem.isdigit():
+            segments[index] = ':id' + dot + extension
+    return '/'.join(segments)
+
+
+class RateLimitTracker:
+    """Tracks the rate limits returned in the response headers.
+
+    The limits are kept for each credential and endpoint template. When
+    pacing is enabled, a request for an endpoint with no remaining calls
+    waits until the limit resets, rather than failing with a 429. When the
+    limit resets one request is let through to find the new limit, and the
+    others wait for its response, or for `PROBE_TIMEOUT` seconds if it
+    brings no rate limit headers.
+    """
+
+    PROBE_TIMEOUT = 10.0
+
+    def __init__(
+            self,
+            *,
+            pace: bool = True,
+            reset_margin: float = 1.0
+    ) -> None:
+        """Initialise the rate limit tracker.
+
+        Args:
+            pace (bool, optional): If true wait for exhausted limits to reset
+                before making a request. Defaults to True.
+            reset_margin (float, optional): The number of seconds to wait
+                after the reset time, to allow for clock differences.
+                Defaults to 1.0.
+        """
+        self.pace = pace
+        self.reset_margin = reset_margin
+        self._limits: Dict[RateLimitKey, RateLimit] = {}
+        self._updated: Optional[asyncio.Event] = None
+
+    @property
+    def limits(self) -> Mapping[RateLimitKey, RateLimit]:
+        """The rate limits by credential and endpoint template.
+
+        Returns:
+            Mapping[RateLimitKey, RateLimit]: The rate limits.
+        """
+        return self._limits
+
+    def get(self, credential: str, endpoint: str) -> Optional[RateLimit]:
+        """Get the rate limit of an endpoint.
+
+        Args:
+            credential (str): The credential.
+            endpoint (str): The endpoint template.
+
+        Returns:
+            Optional[RateLimit]: The rate limit if known.
+        """
+        return self._limits.get((credential, endpoint))
+
+    def update(
+            self,
+            credential: str,
+            endpoint: str,
+            headers: Mapping[str, str]
+    ) -> None:
+        """Update the rate limit of an endpoint from the response headers.
+
+        Args:
+            credential (str): The credential.
+            endpoint (str): The endpoint template.
+            headers (Mapping[str, str]): The response headers with lower
+                case names.
+        """
+        try:
+            self._limits[(credential, endpoint)] = RateLimit(
+                int(headers['x-rate-limit-limit']),
+                int(headers['x-rate-limit-remaining']),
+                float(headers['x-rate-limit-reset'])
+            )
+        except (KeyError, ValueError):
+            return
+        if self._updated is not None:
+            self._updated.set()
+            self._updated = None
+
+    async def acquire(self, credential: str, endpoint: str) -> None:
+        """Take a call from the limit of an endpoint, waiting for the limit
+        to reset if none remain.
+
+        Args:
+            credential (str): The credential.
+            endpoint (str): The endpoint template.
+        """
+        key = (credential, endpoint)
+        while self.pace:
+            rate_limit = self._limits.get(key)
+            if rate_limit is None:
+                return
+            now = time.time()
+            if rate_limit.reset + self.reset_margin <= now:
+                # The window has reset, so the state is unknown until the next
+                # response. Let this call through to find it, and hold the
+                # others back until then.
+                self._limits[key] = RateLimit(
+                    rate_limit.limit,
+                    0,
+                    now + self.PROBE_TIMEOUT - self.reset_margin
+                )
+                return
+            if rate_limit.remaining > 0:
+                self._limits[key] = rate_limit._replace(
+                    remaining=rate_limit.remaining - 1
+                )
+                return
+            if self._updated is None:
+                self._updated = asyncio.Event()
+            try:
+                await asyncio.wait_for(
+                    self._updated.wait(),
+                    rate_limit.reset + self.reset_margin - now
+                )
+            except asyncio.TimeoutError:
+                pass
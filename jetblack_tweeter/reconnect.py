@@ -0,0 +1,181 @@
+"""Reconnecting streams"""
+
+import asyncio
+import logging
+import ssl
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    NamedTuple,
+    Optional
+)
+
+from .errors import TweeterHttpError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ReconnectEvent(NamedTuple):
+    """A reconnection of a stream"""
+    attempt: int
+    delay: float
+    error: Optional[BaseException]
+
+
+ReconnectCallback = Callable[[ReconnectEvent], None]
+
+
+class ReconnectPolicy:
+    """A policy for reconnecting streams, following the backoff the
+    streaming api asks clients to use.
+
+    * Network errors, which are any `OSError` including DNS and SSL
+      failures, and streams closed by the server, back off linearly (by
+      default 250ms per attempt, up to 16s). Certificate verification
+      failures are not network errors, and are raised.
+    * HTTP errors back off exponentially (by default from 5s, up to 320s).
+    * Rate limit errors (420 and 429) back off exponentially from a longer
+      floor (by default from 60s, up to 960s).
+
+    HTTP errors which will not be fixed by retrying, such as authentication
+    failures, are raised. The backoff is reset once a message is received,
+    or when the type of failure changes, so each backoff starts from its
+    own floor.
+    """
+
+    def __init__(
+            self,
+            *,
+            network_step: float = 0.25,
+            network_max: float = 16.0,
+            http_base: float = 5.0,
+            http_max: float = 320.0,
+            rate_limit_base: float = 60.0,
+            rate_limit_max: float = 960.0,
+            fatal_status_codes: Collection[int] = (
+                400, 401, 403, 404, 406, 413, 416
+            ),
+            max_attempts: Optional[int] = None
+    ) -> None:
+        """Initialise the reconnect policy.
+
+        Args:
+            network_step (float, optional): The increase in seconds of the
+                delay after each network error. Defaults to 0.25.
+            network_max (float, optional): The maximum delay in seconds after
+                a network error. Defaults to 16.0.
+            http_base (float, optional): The delay in seconds after the first
+                HTTP error. Defaults to 5.0.
+            http_max (float, optional): The maximum delay in seconds after an
+                HTTP error. Defaults to 320.0.
+            rate_limit_base (float, optional): The delay in seconds after the
+                first rate limit error. Defaults to 60.0.
+            rate_limit_max (float, optional): The maximum delay in seconds
+                after a rate limit error. Defaults to 960.0.
+            fatal_status_codes (Collection[int], optional): The HTTP status
+                codes which are raised rather than retried. Defaults to
+                (400, 401, 403, 404, 406, 413, 416).
+            max_attempts (Optional[int], optional): The maximum number of
+                consecutive reconnection attempts, or None for no limit.
+                Defaults to None.
+        """
+        self.network_step = network_step
+        self.network_max = network_max
+        self.http_base = http_base
+        self.http_max = http_max
+        self.rate_limit_base = rate_limit_base
+        self.rate_limit_max = rate_limit_max
+        self.fatal_status_codes = frozenset(fatal_status_codes)
+        self.max_attempts = max_attempts
+
+    def delay(
+            self,
+            error: Optional[BaseException],
+            attempt: int
+    ) -> Optional[float]:
+        """Calculate the delay before reconnecting.
+
+        Args:
+            error (Optional[BaseException]): The error, or None if the stream
+                was closed by the server.
+            attempt (int): The number of consecutive attempts, starting at 1.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None if the error should
+                be raised.
+        """
+        if isinstance(error, TweeterHttpError):
+            if error.code in self.fatal_status_codes:
+                return None
+            if error.code in (420, 429):
+                return min(
+                    self.rate_limit_max,
+                    self.rate_limit_base * 2 ** (attempt - 1)
+                )
+            return min(self.http_max, self.http_base * 2 ** (attempt - 1))
+        if isinstance(error, ssl.SSLCertVerificationError):
+            return None
+        if error is None or isinstance(
+                error,
+                (OSError, asyncio.TimeoutError)
+        ):
+            return min(self.network_max, self.network_step * attempt)
+        return None
+
+    @classmethod
+    def _failure_type(cls, error: Optional[BaseException]) -> str:
+        if isinstance(error, TweeterHttpError):
+            return 'rate_limit' if error.code in (420, 429) else 'http'
+        return 'network'
+
+    async def run(
+            self,
+            connect: Callable[[], AsyncIterator[Any]],
+            on_reconnect: Optional[ReconnectCallback] = None
+    ) -> AsyncIterator[Any]:
+        """Follow a stream, reconnecting when it fails or closes.
+
+        Args:
+            connect (Callable[[], AsyncIterator[Any]]): A callable which
+                opens the stream.
+            on_reconnect (Optional[ReconnectCallback], optional): A callback
+                called before each reconnection. Defaults to None.
+
+        Yields:
+            Any: The messages of the stream.
+        """
+        attempt = 0
+        failure_type: Optional[str] = None
+        while True:
+            error: Optional[BaseException] = None
+            try:
+                async for message in connect():
+                    attempt = 0
+                    yield message
+            except Exception as stream_error:  # pylint: disable=broad-except
+                error = stream_error
+
+            if self._failure_type(error) != failure_type:
+                failure_type = self._failure_type(error)
+                attempt = 0
+            attempt += 1
+            delay = self.delay(error, attempt)
+            if delay is None or (
+                    self.max_attempts is not None and
+                    attempt > self.max_attempts
+            ):
+                if error is None:
+                    return
+                raise error
+
+            LOGGER.debug(
+                'Reconnecting stream after %s in %.2fs (attempt %d)',
+                error or 'close',
+                delay,
+                attempt
+            )
+            if on_reconnect is not None:
+                on_reconnect(ReconnectEvent(attempt, delay, error))
+            await asyncio.sleep(delay)
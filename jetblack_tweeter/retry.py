@@ -0,0 +1,195 @@
+"""Retrying failed requests"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar
+)
+
+from .errors import TweeterHttpError
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RetryRule:
+    """A rule for retrying requests which failed with a matching error.
+
+    Retries are delayed with "full jitter" exponential backoff: a random
+    time between zero and the capped exponential delay. This spreads the
+    retries of clients which failed together.
+    """
+
+    def __init__(
+            self,
+            *,
+            exceptions: Tuple[Type[BaseException], ...] = (),
+            status_codes: Collection[int] = (),
+            max_attempts: int = 5,
+            base_delay: float = 0.5,
+            max_delay: float = 30.0
+    ) -> None:
+        """Initialise the retry rule.
+
+        Args:
+            exceptions (Tuple[Type[BaseException], ...], optional): The
+                exception classes to retry. Defaults to ().
+            status_codes (Collection[int], optional): The HTTP status codes to
+                retry. Defaults to ().
+            max_attempts (int, optional): The maximum number of attempts,
+                including the first. Defaults to 5.
+            base_delay (float, optional): The delay in seconds before
+                applying the exponential backoff. Defaults to 0.5.
+            max_delay (float, optional): The maximum delay in seconds.
+                Defaults to 30.0.
+        """
+        self.exceptions = exceptions
+        self.status_codes = frozenset(status_codes)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def matches(self, error: BaseException) -> bool:
+        """Check if the rule applies to an error.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            bool: True if the error should be retried by this rule.
+        """
+        if isinstance(error, TweeterHttpError):
+            return error.code in self.status_codes
+        return isinstance(error, self.exceptions)
+
+    def delay(self, attempt: int) -> float:
+        """Calculate the delay before the next attempt.
+
+        Args:
+            attempt (int): The number of attempts which have failed.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+DEFAULT_RULES: Sequence[RetryRule] = (
+    RetryRule(
+        exceptions=(ConnectionError, TimeoutError, asyncio.TimeoutError),
+        max_attempts=5,
+        base_delay=0.5,
+        max_delay=30.0
+    ),
+    RetryRule(
+        status_codes=(500, 502, 503, 504),
+        max_attempts=5,
+        base_delay=1.0,
+        max_delay=60.0
+    ),
+)
+
+
+class RetryPolicy:
+    """A policy for retrying failed requests.
+
+    Only idempotent methods are retried by default, as a request which
+    failed may still have been processed.
+    """
+
+    def __init__(
+            self,
+            *,
+            rules: Sequence[RetryRule] = DEFAULT_RULES,
+            max_elapsed: Optional[float] = 120.0,
+            methods: Collection[str] = ('GET', 'PUT', 'DELETE')
+    ) -> None:
+        """Initialise the retry policy.
+
+        Args:
+            rules (Sequence[RetryRule], optional): The rules, where the first
+                which matches an error is used. Defaults to DEFAULT_RULES.
+            max_elapsed (Optional[float], optional): The number of seconds
+                after the first attempt beyond which no retry will start,
+                or None for no limit. Defaults to 120.0.
+            methods (Collection[str], optional): The HTTP methods which may be
+                retried. Defaults to ('GET', 'PUT', 'DELETE').
+        """
+        self.rules = rules
+        self.max_elapsed = max_elapsed
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def find_rule(self, error: BaseException) -> Optional[RetryRule]:
+        """Find the rule for an error.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            Optional[RetryRule]: The first matching rule, if any.
+        """
+        for rule in self.rules:
+            if rule.matches(error):
+                return rule
+        return None
+
+    async def run(
+            self,
+            http_method: str,
+            request: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Make a request, retrying it according to the policy.
+
+        The request callable is called for each attempt, so the request can
+        be signed again.
+
+        Args:
+            http_method (str): The HTTP method.
+            request (Callable[[], Awaitable[T]]): A callable which makes the
+                request.
+
+        Returns:
+            T: The response.
+        """
+        if http_method.upper() not in self.methods:
+            return await request()
+
+        start = time.monotonic()
+        attempts: Dict[RetryRule, int] = {}
+        while True:
+            try:
+                return await request()
+            except Exception as error:  # pylint: disable=broad-except
+                rule = self.find_rule(error)
+                if rule is None:
+                    raise
+                attempt = attempts[rule] = attempts.get(rule, 0) + 1
+                if attempt >= rule.max_attempts:
+                    raise
+                delay = rule.delay(attempt)
+                elapsed = time.monotonic() - start
+                if (
+                        self.max_elapsed is not None and
+                        elapsed + delay > self.max_elapsed
+                ):
+                    raise
+                LOGGER.debug(
+                    'Retrying %s after %s in %.3fs (attempt %d)',
+                    http_method,
+                    error,
+                    delay,
+                    attempt
+                )
+                await asyncio.sleep(delay)
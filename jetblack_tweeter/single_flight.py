@@ -0,0 +1,55 @@
+"""Coalescing concurrent calls"""
+
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    TypeVar
+)
+
+K = TypeVar('K', bound=Hashable)
+T = TypeVar('T')
+
+
+class SingleFlight(Generic[K, T]):
+    """Shares the result of an in-flight call between concurrent callers
+    with the same key.
+
+    The call runs as a task which is shielded from the cancellation of
+    individual callers. Once it completes the key is forgotten, so later
+    calls are made afresh.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the single flight group"""
+        self._calls: Dict[K, 'asyncio.Future[T]'] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: K, call: Callable[[], Awaitable[T]]) -> T:
+        """Run the call, or join an in-flight call with the same key.
+
+        Args:
+            key (K): The key identifying the call.
+            call (Callable[[], Awaitable[T]]): The callable to run if no call
+                with the key is in flight.
+
+        Returns:
+            T: The result of the call, which is shared by all the callers.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+
+            def forget(done: 'asyncio.Future[T]') -> None:
+                if self._calls.get(key) is done:
+                    del self._calls[key]
+
+            future.add_done_callback(forget)
+
+        return await asyncio.shield(future)
@@ -0,0 +1,337 @@
+"""Watching user timelines"""
+
+import asyncio
+import heapq
+import logging
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    cast
+)
+
+from .api import Statuses
+from .pacing import TokenBucket
+from .pagination import MaxIdCursor
+from .utils import snowflake_to_datetime
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TimelineUpdate(NamedTuple):
+    """The new tweets of a watched user, or the error from polling them"""
+    user: str
+    tweets: List[Mapping[str, Any]]
+    error: Optional[Exception] = None
+
+
+class WatchedUser:
+    """The polling state of a watched user"""
+
+    def __init__(
+            self,
+            screen_name: Optional[str],
+            user_id: Optional[str],
+            since_id: Optional[int],
+            interval: float
+    ) -> None:
+        self.screen_name = screen_name
+        self.user_id = user_id
+        self.since_id = since_id
+        self.interval = interval
+        self.rate: Optional[float] = None
+        self.last_polled: Optional[float] = None
+        self.due = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f'WatchedUser(screen_name={self.screen_name!r}, '
+            f'user_id={self.user_id!r}, since_id={self.since_id}, '
+            f'interval={self.interval:.1f})'
+        )
+
+
+class TimelineWatcher:
+    """Polls the timelines of many users for new tweets.
+
+    Each poll only asks for the tweets after the newest tweet seen for the
+    user. If the page is full, the older pages are read back to that tweet,
+    so no tweets are missed. The posting rate of each user is estimated from the tweets found,
+    and the user is polled often enough to expect `target_per_poll` new
+    tweets, within the minimum and maximum intervals. Quiet users are
+    therefore polled rarely and busy users often.
+
+    Polls are limited to `concurrency` at a time, and may share a token
+    bucket to keep within a global request budget. For example:
+
+    ```python
+    watcher = TimelineWatcher(
+        tweeter.statuses,
+        budget=TokenBucket(900 / 900, capacity=10)
+    )
+    for name in ('jack', 'paulg'):
+        watcher.watch(screen_name=name)
+    async for update in watcher.updates():
+        print(update.user, len(update.tweets))
+    ```
+    """
+
+    def __init__(
+            self,
+            statuses: Statuses,
+            *,
+            budget: Optional[TokenBucket] = None,
+            concurrency: int = 8,
+            min_interval: float = 60.0,
+            max_interval: float = 3600.0,
+            target_per_poll: float = 5.0,
+            smoothing: float = 0.3,
+            count: int = 200,
+            **kwargs: Any
+    ) -> None:
+        """Initialise the timeline watcher.
+
+        Args:
+            statuses (Statuses): The statuses end point.
+            budget (Optional[TokenBucket], optional): A token bucket taken
+                from for each poll. Defaults to None.
+            concurrency (int, optional): The maximum number of polls in
+                flight. Defaults to 8.
+            min_interval (float, optional): The minimum number of seconds
+                between polls of a user. Defaults to 60.0.
+            max_interval (float, optional): The maximum number of seconds
+                between polls of a user. Defaults to 3600.0.
+            target_per_poll (float, optional): The number of new tweets a
+                poll should expect to find. Defaults to 5.0.
+            smoothing (float, optional): The weight given to the latest poll
+                when updating the posting rate. Defaults to 0.3.
+            count (int, optional): The number of tweets to request in each
+                poll, which the endpoint limits to 200. Defaults to 200.
+            **kwargs (Any): Other keyword arguments to
+                `Statuses.user_timeline`.
+        """
+        self.budget = budget
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_per_poll = target_per_poll
+        self.smoothing = smoothing
+        self.count = count
+        self._statuses = statuses
+        self._kwargs = kwargs
+        self._users: Dict[str, WatchedUser] = {}
+        self._schedule: List[Tuple[float, str]] = []
+        # Created when polling starts, to bind to the running loop.
+        self._changed: Optional[asyncio.Event] = None
+
+    @property
+    def users(self) -> Mapping[str, WatchedUser]:
+        """The watched users by key.
+
+        Returns:
+            Mapping[str, WatchedUser]: The watched users, whose since ids can
+                be saved to resume watching.
+        """
+        return self._users
+
+    def watch(
+            self,
+            *,
+            screen_name: Optional[str] = None,
+            user_id: Optional[str] = None,
+            since_id: Optional[int] = None
+    ) -> str:
+        """Start watching a user. The first poll is made immediately.
+
+        Args:
+            screen_name (Optional[str], optional): The screen name of the
+                user. Defaults to None.
+            user_id (Optional[str], optional): The id of the user. Defaults to
+                None.
+            since_id (Optional[int], optional): The id of the newest tweet
+                already seen. Defaults to None.
+
+        Returns:
+            str: The key of the user, which is the user id if given, or
+                the screen name in lower case.
+        """
+        if user_id is not None:
+            key = user_id
+        elif screen_name is not None:
+            key = screen_name.lower()
+        else:
+            raise ValueError('a screen name or user id is required')
+        user = WatchedUser(screen_name, user_id, since_id, self.min_interval)
+        self._users[key] = user
+        self._reschedule(key, user, time.monotonic())
+        return key
+
+    def unwatch(self, key: str) -> None:
+        """Stop watching a user.
+
+        Args:
+            key (str): The key returned by `watch`.
+        """
+        self._users.pop(key, None)
+
+    def _reschedule(self, key: str, user: WatchedUser, due: float) -> None:
+        user.due = due
+        heapq.heappush(self._schedule, (due, key))
+        if self._changed is not None:
+            self._changed.set()
+
+    def _adapt(
+            self,
+            user: WatchedUser,
+            tweets: List[Mapping[str, Any]],
+            now: float
+    ) -> None:
+        if user.last_polled is None:
+            # Estimate the rate from the age of the tweets on the first poll.
+            if len(tweets) > 1:
+                oldest = snowflake_to_datetime(tweets[-1]['id'])
+                age = time.time() - oldest.timestamp()
+                user.rate = len(tweets) / max(age, 1.0)
+            else:
+                user.rate = 0.0
+        else:
+            rate = len(tweets) / max(now - user.last_polled, 1.0)
+            user.rate = (
+                rate if user.rate is None
+                else self.smoothing * rate + (1 - self.smoothing) * user.rate
+            )
+        user.last_polled = now
+
+        if len(tweets) >= self.count:
+            # The page was full, so tweets may have been missed.
+            user.interval = self.min_interval
+        elif user.rate:
+            user.interval = self.target_per_poll / user.rate
+        else:
+            user.interval = user.interval * 2
+        user.interval = min(
+            self.max_interval,
+            max(self.min_interval, user.interval)
+        )
+
+    async def _fetch_older(self, **kwargs: Any) -> Any:
+        if self.budget is not None:
+            await self.budget.acquire()
+        return await self._statuses.user_timeline(**kwargs)
+
+    async def _poll(
+            self,
+            key: str,
+            user: WatchedUser,
+            updates: 'asyncio.Queue[TimelineUpdate]'
+    ) -> None:
+        try:
+            tweets = cast(
+                List[Mapping[str, Any]],
+                await self._statuses.user_timeline(
+                    screen_name=user.screen_name,
+                    user_id=user.user_id,
+                    since_id=user.since_id,
+                    count=self.count,
+                    **self._kwargs
+                )
+            )
+            if user.since_id is not None and len(tweets) >= self.count:
+                # The page was full, so walk back to the newest tweet seen
+                # for the tweets which did not fit.
+                tweets = tweets + [
+                    tweet
+                    async for tweet in MaxIdCursor(
+                        self._fetch_older,
+                        screen_name=user.screen_name,
+                        user_id=user.user_id,
+                        max_id=min(tweet['id'] for tweet in tweets) - 1,
+                        since_id=user.since_id,
+                        count=self.count,
+                        **self._kwargs
+                    )
+                ]
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.debug('Failed to poll %s: %s', key, error)
+            user.interval = min(self.max_interval, user.interval * 2)
+            if self._users.get(key) is user:
+                self._reschedule(key, user, time.monotonic() + user.interval)
+            updates.put_nowait(TimelineUpdate(key, [], error))
+            return
+
+        now = time.monotonic()
+        self._adapt(user, tweets, now)
+        if tweets:
+            user.since_id = max(tweet['id'] for tweet in tweets)
+            updates.put_nowait(TimelineUpdate(key, tweets))
+        if self._users.get(key) is user:
+            self._reschedule(key, user, now + user.interval)
+
+    async def _run_schedule(
+            self,
+            updates: 'asyncio.Queue[TimelineUpdate]'
+    ) -> None:
+        changed = self._changed = asyncio.Event()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: Set['asyncio.Task[None]'] = set()
+        try:
+            while True:
+                changed.clear()
+                if not self._schedule:
+                    await changed.wait()
+                    continue
+                due, key = self._schedule[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(changed.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                heapq.heappop(self._schedule)
+                user = self._users.get(key)
+                if user is None or user.due != due:
+                    # The user was unwatched or rescheduled.
+                    continue
+                await semaphore.acquire()
+                if self.budget is not None:
+                    await self.budget.acquire()
+                task = asyncio.ensure_future(self._poll(key, user, updates))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _task: semaphore.release())
+        finally:
+            self._changed = None
+            for task in tasks:
+                task.cancel()
+
+    async def updates(self) -> AsyncIterator[TimelineUpdate]:
+        """Poll the watched users, yielding their new tweets.
+
+        Yields:
+            TimelineUpdate: The new tweets of a user, newest first, or the
+                error from polling them.
+        """
+        updates: 'asyncio.Queue[TimelineUpdate]' = asyncio.Queue()
+        task = asyncio.ensure_future(self._run_schedule(updates))
+        try:
+            while True:
+                get = asyncio.ensure_future(updates.get())
+                await asyncio.wait(
+                    (get, task),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not get.done():
+                    # The scheduler failed.
+                    get.cancel()
+                    task.result()
+                yield get.result()
+        finally:
+            task.cancel()
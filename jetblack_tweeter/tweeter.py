@@ -3,13 +3,34 @@
 from __future__ import annotations
 
 from types import TracebackType
-from typing import Optional, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Type,
+    TypeVar,
+    Union
+)
 
 from .auth_client import AuthenticatedHttpClient
+from .base_client import BaseHttpClient
+from .bearer_client import BearerHttpClient
+from .bulk import FanOutResult, fan_out
+from .cache import ResponseCache
+from .codecs import AbstractJsonCodec
+from .hydration import HydrationStore
+from .pacing import TokenBucket
+from .rate_limits import RateLimitTracker
+from .retry import RetryPolicy
 from .api import Account, Search, Stream, Statuses, Tweets, Users
 from .types import AbstractTweeterSession
 
 TException = TypeVar('TException', bound=BaseException)
+T = TypeVar('T')
 
 
 class Tweeter:
@@ -23,7 +44,17 @@ class Tweeter:
             app_key_secret: str,
             *,
             access_token: Optional[str] = None,
-            access_token_secret: Optional[str] = None
+            access_token_secret: Optional[str] = None,
+            fast_signing: bool = False,
+            app_only: bool = False,
+            bearer_token: Optional[str] = None,
+            codec: Optional[AbstractJsonCodec] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limits: Optional[RateLimitTracker] = None,
+            coalesce_gets: bool = False,
+            cache: Optional[ResponseCache] = None,
+            hydration_store: Optional[HydrationStore] = None,
+            batch_window: Optional[float] = None
     ):
         """Initialise the Twitter client.
 
@@ -35,6 +66,39 @@ class Tweeter:
                 token. Defaults to None.
             access_token_secret (Optional[str], optional): An optional access
                 token secret. Defaults to None.
+            fast_signing (bool, optional): If true requests are signed with a
+                cached HMAC-SHA1 signer instead of oauthlib. Defaults to False.
+            app_only (bool, optional): If true use OAuth2 app-only
+                authentication with a bearer token rather than OAuth1. Only
+                endpoints which support app-only authentication will work.
+                Defaults to False.
+            bearer_token (Optional[str], optional): A previously issued bearer
+                token for app-only authentication. If not given, and
+                `app_only` is true, a token will be requested. Defaults to
+                None.
+            codec (Optional[AbstractJsonCodec], optional): The codec used to
+                encode request bodies. Responses are decoded by the session,
+                which takes its own codec. Defaults to None.
+            retry_policy (Optional[RetryPolicy], optional): The policy for
+                retrying requests which failed with transient errors. If not
+                given requests are not retried. Defaults to None.
+            rate_limits (Optional[RateLimitTracker], optional): The tracker
+                for the rate limits of each endpoint, which may be shared
+                between clients. If not given a tracker which paces requests
+                is created. Defaults to None.
+            coalesce_gets (bool, optional): If true concurrent GET requests
+                with the same url and parameters share one request, and the
+                callers receive the same decoded result. Defaults to False.
+            cache (Optional[ResponseCache], optional): A cache for GET
+                responses, with a time to live for each endpoint. Defaults
+                to None.
+            hydration_store (Optional[HydrationStore], optional): A persistent
+                store of users and tweets, used by the lookup methods to avoid
+                fetching objects which have been fetched before. Defaults to
+                None.
+            batch_window (Optional[float], optional): If given, single
+                lookups made within this number of seconds are combined into
+                bulk lookups of up to 100 ids. Defaults to None.
 
         Attributes:
             account (Account): Access to the account end point.
@@ -43,20 +107,95 @@ class Tweeter:
             stream (Stream): Access to the stream end point.
             tweets (Tweets): Access to the tweets end point.
             users (Statuses): Access to the users end point.
+            rate_limits (RateLimitTracker): The rate limits of the endpoints
+                which have been called.
+            cache (Optional[ResponseCache]): The response cache, if any.
         """
-        self._client = AuthenticatedHttpClient(
-            session,
-            consumer_key=app_key,
-            consumer_secret=app_key_secret,
-            access_token=access_token,
-            access_token_secret=access_token_secret
-        )
+        self.rate_limits = rate_limits or RateLimitTracker()
+        self.cache = cache
+        if app_only or bearer_token is not None:
+            if access_token is not None or access_token_secret is not None:
+                raise ValueError(
+                    'access tokens cannot be used with app-only authentication'
+                )
+            self._client: BaseHttpClient = BearerHttpClient(
+                session,
+                consumer_key=app_key,
+                consumer_secret=app_key_secret,
+                bearer_token=bearer_token,
+                codec=codec,
+                retry_policy=retry_policy,
+                rate_limits=self.rate_limits,
+                coalesce_gets=coalesce_gets,
+                cache=cache
+            )
+        else:
+            self._client = AuthenticatedHttpClient(
+                session,
+                consumer_key=app_key,
+                consumer_secret=app_key_secret,
+                access_token=access_token,
+                access_token_secret=access_token_secret,
+                fast_signing=fast_signing,
+                codec=codec,
+                retry_policy=retry_policy,
+                rate_limits=self.rate_limits,
+                coalesce_gets=coalesce_gets,
+                cache=cache
+            )
         self.account = Account(self._client)
         self.search = Search(self._client)
-        self.statuses = Statuses(self._client)
+        self.statuses = Statuses(self._client, hydration_store, batch_window)
         self.stream = Stream(self._client)
-        self.tweets = Tweets(self._client)
-        self.users = Users(self._client)
+        self.tweets = Tweets(self._client, hydration_store)
+        self.users = Users(self._client, hydration_store, batch_window)
+
+    def fan_out(
+            self,
+            call: Callable[[T], Awaitable[Any]],
+            arguments: Union[Iterable[T], AsyncIterable[T]],
+            *,
+            concurrency: int = 8,
+            pacing: Optional[TokenBucket] = None,
+            ordered: bool = False
+    ) -> AsyncIterator[FanOutResult]:
+        """Call an endpoint method for each argument concurrently.
+
+        Requests are also paced by the rate limits of the endpoint. For
+        example:
+
+        ```python
+        async for item in tweeter.fan_out(
+                lambda name: tweeter.statuses.user_timeline(screen_name=name),
+                ['jack', 'paulg', 'evhead']
+        ):
+            if item.error is None:
+                print(item.argument, len(item.result))
+        ```
+
+        Args:
+            call (Callable[[T], Awaitable[Any]]): The function to call with
+                each argument.
+            arguments (Union[Iterable[T], AsyncIterable[T]]): The arguments.
+            concurrency (int, optional): The maximum number of calls in
+                flight. Defaults to 8.
+            pacing (Optional[TokenBucket], optional): A token bucket taken
+                from before each call. Defaults to None.
+            ordered (bool, optional): If true the results are yielded in the
+                order of the arguments, otherwise as they complete. Defaults
+                to False.
+
+        Returns:
+            AsyncIterator[FanOutResult]: The result or error for each
+                argument.
+        """
+        return fan_out(
+            call,
+            arguments,
+            concurrency=concurrency,
+            pacing=pacing,
+            ordered=ordered
+        )
 
     async def __aenter__(self) -> Tweeter:
         return self
@@ -5,6 +5,7 @@ from enum import Enum
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
     List,
     Literal,
     Mapping,
@@ -18,6 +19,7 @@ from typing import (
 Number = Union[float, int]
 Location = Tuple[Number, Number]
 BoundingBox = Tuple[Location, Location]
+ResponseCallback = Callable[[int, Mapping[str, str]], None]
 
 
 class AbstractTweeterSession(metaclass=ABCMeta):
@@ -32,7 +34,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             url: str,
             method: str,
             headers: Mapping[str, str],
-            body: Optional[str]
+            body: Optional[str],
+            *,
+            length_delimited: bool = False
     ) -> AsyncIterator[Union[List[Any], Mapping[str, Any]]]:
         """Stream data
 
@@ -41,6 +45,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             method (str): The HTTP method
             headers (Mapping[str, str]): The HTTP headers
             body (Optional[str]): The body (if any)
+            length_delimited (bool, optional): If true each message is
+                preceded by a line containing its length in bytes, rather
+                than being terminated by a new line. Defaults to False.
 
         Returns:
             AsyncIterator[Union[List[Any], Mapping[str, Any]]]: An async
@@ -52,7 +59,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             self,
             url: str,
             headers: Mapping[str, str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Union[List[Any], Mapping[str, Any]]:
         """Get data from Twitter
 
@@ -60,6 +69,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             url (str): The url
             headers (Mapping[str, str]): The HTTP headers.
             timeout (Optional[float]): An optional timeout.
+            on_response (Optional[ResponseCallback], optional): A callback
+                called with the status and headers of the response, where
+                the header names are lower case. Defaults to None.
 
         Returns:
             Union[List[Any], Mapping[str, Any]]: The unpacked JSON response.
@@ -71,7 +83,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
         """Post data to Twitter
 
@@ -80,6 +94,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             headers (Mapping[str, str]): The HTTP headers.
             body (Optional[str]): The body (if any).
             timeout (Optional[float]): An optional timeout.
+            on_response (Optional[ResponseCallback], optional): A callback
+                called with the status and headers of the response, where
+                the header names are lower case. Defaults to None.
 
         Returns:
             Optional[Union[List[Any], Mapping[str, Any]]]: The unpacked JSON
@@ -92,7 +109,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
         """Put data to Twitter
 
@@ -101,6 +120,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             headers (Mapping[str, str]): The HTTP headers
             body (Optional[str]): The body (if any)
             timeout (Optional[float]): An optional timeout.
+            on_response (Optional[ResponseCallback], optional): A callback
+                called with the status and headers of the response, where
+                the header names are lower case. Defaults to None.
 
         Returns:
             Optional[Union[List[Any], Mapping[str, Any]]]: The unpacked JSON
@@ -113,7 +135,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             url: str,
             headers: Mapping[str, str],
             body: Optional[str],
-            timeout: Optional[float]
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
     ) -> Optional[Union[List[Any], Mapping[str, Any]]]:
         """Delete data in Twitter
 
@@ -122,6 +146,9 @@ class AbstractTweeterSession(metaclass=ABCMeta):
             headers (Mapping[str, str]): The HTTP headers
             body (Optional[str]): The body (if any),
             timeout (Optional[float]): An optional timeout.
+            on_response (Optional[ResponseCallback], optional): A callback
+                called with the status and headers of the response, where
+                the header names are lower case. Defaults to None.
 
         Returns:
             Optional[Union[List[Any], Mapping[str, Any]]]: The unpacked JSON
@@ -143,7 +170,9 @@ class AbstractHttpClient(metaclass=ABCMeta):
             self,
             url: str,
             data: Optional[Mapping[str, Any]] = None,
-            method: str = 'post'
+            method: str = 'post',
+            *,
+            length_delimited: bool = False
     ) -> AsyncIterator[Union[List[Any], Mapping[str, Any]]]:
         """Stream data from Twitter
 
@@ -152,6 +181,8 @@ class AbstractHttpClient(metaclass=ABCMeta):
             data (Optional[Mapping[str, Any]], optional): The data. Defaults to
                 None.
             method (str, optional): The HTTP method. Defaults to 'post'.
+            length_delimited (bool, optional): If true the messages are length
+                delimited. Defaults to False.
 
         Returns:
             Coroutine[Any, Any, AsyncIterator[Union[List[Any], Mapping[str, Any]]]]: An async
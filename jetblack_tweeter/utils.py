@@ -101,3 +101,36 @@ def optional_datetime_to_str(
         default: Optional[str] = None
 ) -> Optional[str]:
     return datetime_to_str(value) if value is not None else default
+
+
+# The time in milliseconds from which tweet ids count.
+TWITTER_EPOCH_MS = 1288834974657
+
+
+def datetime_to_snowflake(value: datetime) -> int:
+    """Make the smallest tweet id generated at a time.
+
+    Tweet ids are "snowflakes", whose high bits are the number of
+    milliseconds since the Twitter epoch.
+
+    Args:
+        value (datetime): The time.
+
+    Returns:
+        int: The smallest id.
+    """
+    milliseconds = int(value.timestamp() * 1000) - TWITTER_EPOCH_MS
+    return max(milliseconds, 0) << 22
+
+
+def snowflake_to_datetime(value: int) -> datetime:
+    """Get the time a tweet id was generated.
+
+    Args:
+        value (int): The tweet id.
+
+    Returns:
+        datetime: The time in UTC.
+    """
+    milliseconds = (value >> 22) + TWITTER_EPOCH_MS
+    return datetime.fromtimestamp(milliseconds / 1000, timezone.utc)
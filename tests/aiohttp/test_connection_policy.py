@@ -0,0 +1,47 @@
+"""Tests for the aiohttp connection policy"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from jetblack_tweeter.clients.aiohttp import ConnectionPolicy
+from jetblack_tweeter.clients.aiohttp import connection_policy
+
+
+def test_make_connector() -> None:
+    """The connector should be created with the policy limits"""
+
+    async def run() -> None:
+        policy = ConnectionPolicy(
+            limit=500,
+            limit_per_host=50,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            happy_eyeballs=False
+        )
+        connector = policy.make_connector()
+        assert connector.limit == 500
+        assert connector.limit_per_host == 50
+        await connector.close()
+
+    asyncio.run(run())
+
+
+def test_make_connector_before_happy_eyeballs(
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The happy eyeballs settings should not be passed to an aiohttp which
+    does not support them.
+    """
+    created: Dict[str, Any] = {}
+
+    def make_connector(**kwargs: Any) -> Dict[str, Any]:
+        created.update(kwargs)
+        return kwargs
+
+    monkeypatch.setattr(connection_policy, 'HAS_HAPPY_EYEBALLS', False)
+    monkeypatch.setattr(connection_policy, 'TCPConnector', make_connector)
+    ConnectionPolicy(happy_eyeballs=False).make_connector()
+    ConnectionPolicy(happy_eyeballs_delay=1.0).make_connector()
+    assert created and 'happy_eyeballs_delay' not in created
@@ -0,0 +1,221 @@
+"""Tests for the aiohttp session"""
+
+import asyncio
+import json
+import zlib
+from typing import List, Mapping, Tuple
+
+from aiohttp import web
+import pytest
+
+from jetblack_tweeter.clients.aiohttp import AiohttpTweeterSession
+from jetblack_tweeter.errors import ApiError, StreamError
+
+MESSAGES = [{'id': i, 'text': f'tweet {i}'} for i in range(100)]
+
+
+async def _stream_handler(request: web.Request) -> web.StreamResponse:
+    assert request.headers['Accept-Encoding'] == 'gzip'
+    response = web.StreamResponse(headers={'Content-Encoding': 'gzip'})
+    await response.prepare(request)
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for message in MESSAGES:
+        line = json.dumps(message).encode() + b'\r\n\r\n'
+        data = compressor.compress(line) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        # Split the compressed data so chunks end mid line.
+        for start in range(0, len(data), 7):
+            await response.write(data[start:start + 7])
+    await response.write(compressor.flush())
+    await response.write_eof()
+    return response
+
+
+async def _length_delimited_handler(
+        request: web.Request
+) -> web.StreamResponse:
+    response = web.StreamResponse()
+    await response.prepare(request)
+    for message in MESSAGES:
+        data = json.dumps(message).encode() + b'\r\n'
+        await response.write(b'%d\r\n%s\r\n' % (len(data), data))
+    await response.write_eof()
+    return response
+
+
+def test_compressed_stream() -> None:
+    """A gzip compressed stream should be decompressed as it is read"""
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get('/1.1/statuses/sample.json', _stream_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        session = AiohttpTweeterSession()
+        messages = [
+            message
+            async for message in session.stream(
+                f'http://127.0.0.1:{port}/1.1/statuses/sample.json',
+                'GET',
+                {},
+                None
+            )
+        ]
+        assert messages == MESSAGES
+
+        await session.close()
+        await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_length_delimited_stream() -> None:
+    """Length delimited messages should be read by their length"""
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_post('/1.1/statuses/filter.json', _length_delimited_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        session = AiohttpTweeterSession()
+        messages = [
+            message
+            async for message in session.stream(
+                f'http://127.0.0.1:{port}/1.1/statuses/filter.json',
+                'POST',
+                {},
+                None,
+                length_delimited=True
+            )
+        ]
+        assert messages == MESSAGES
+
+        await session.close()
+        await runner.cleanup()
+
+    asyncio.run(run())
+
+
+async def _rate_limited_handler(_request: web.Request) -> web.Response:
+    return web.Response(
+        status=429,
+        headers={
+            'X-Rate-Limit-Limit': '900',
+            'X-Rate-Limit-Remaining': '0',
+            'X-Rate-Limit-Reset': '1700000000'
+        }
+    )
+
+
+def test_response_headers() -> None:
+    """The response headers should be passed to the callback and error"""
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get('/2/users/12', _rate_limited_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        responses: List[Tuple[int, Mapping[str, str]]] = []
+        session = AiohttpTweeterSession()
+        with pytest.raises(ApiError) as error:
+            await session.get(
+                f'http://127.0.0.1:{port}/2/users/12',
+                {},
+                None,
+                on_response=lambda status, headers: responses.append(
+                    (status, headers)
+                )
+            )
+        assert error.value.code == 429
+        assert error.value.headers['x-rate-limit-remaining'] == '0'
+        assert responses[0][0] == 429
+        assert responses[0][1]['x-rate-limit-reset'] == '1700000000'
+
+        await session.close()
+        await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_stream_errors() -> None:
+    """Stream failures should raise StreamError or ConnectionError"""
+
+    async def rate_limited(request: web.Request) -> web.Response:
+        return web.Response(status=420, headers={'Retry-After': '60'})
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get('/1.1/statuses/sample.json', rate_limited)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        session = AiohttpTweeterSession()
+        with pytest.raises(StreamError) as error:
+            async for _message in session.stream(
+                    f'http://127.0.0.1:{port}/1.1/statuses/sample.json',
+                    'GET',
+                    {},
+                    None
+            ):
+                pass
+        assert error.value.code == 420
+        assert error.value.headers['retry-after'] == '60'
+
+        await runner.cleanup()
+
+        with pytest.raises(ConnectionError):
+            async for _message in session.stream(
+                    f'http://127.0.0.1:{port}/1.1/statuses/sample.json',
+                    'GET',
+                    {},
+                    None
+            ):
+                pass
+        await session.close()
+
+    asyncio.run(run())
+
+
+def test_truncated_response() -> None:
+    """A truncated response body should raise ConnectionError"""
+
+    async def truncated(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        response.content_length = 100
+        await response.prepare(request)
+        await response.write(b'{"data": ')
+        assert request.transport is not None
+        request.transport.close()
+        return response
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get('/2/users/12', truncated)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        session = AiohttpTweeterSession()
+        with pytest.raises(ConnectionError):
+            await session.get(f'http://127.0.0.1:{port}/2/users/12', {}, None)
+
+        await session.close()
+        await runner.cleanup()
+
+    asyncio.run(run())
@@ -0,0 +1,189 @@
+"""Tests for the HTTP/2 connection"""
+
+import asyncio
+
+import h2.config
+import h2.connection
+import h2.errors
+import h2.events
+import pytest
+
+from jetblack_tweeter.clients.bareclient.h2_connection import (
+    H2Connection,
+    RefusedStreamError,
+    StreamResetError
+)
+from jetblack_tweeter.clients.bareclient.pool import (
+    Connection,
+    ConnectionPool,
+    HostKey
+)
+
+
+class Server:
+    """An HTTP/2 server which echoes the request path after a short delay,
+    and resets the streams of paths starting with "/reset".
+    """
+
+    def __init__(
+            self,
+            reset_code: h2.errors.ErrorCodes = h2.errors.ErrorCodes.CANCEL
+    ) -> None:
+        self.connections = 0
+        self.max_open_streams = 0
+        self.reset_code = reset_code
+        self.resets = 0
+
+    async def handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle a connection"""
+        self.connections += 1
+        connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(
+                client_side=False,
+                header_encoding=None
+            )
+        )
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+        paths = {}
+
+        async def respond(stream_id: int, path: bytes) -> None:
+            await asyncio.sleep(0.01)
+            if path.startswith(b'/reset'):
+                self.resets += 1
+                connection.reset_stream(stream_id, self.reset_code)
+                writer.write(connection.data_to_send())
+                return
+            body = b'{"path": "%s"}' % path
+            connection.send_headers(
+                stream_id,
+                [(b':status', b'200'), (b'content-length', str(len(body)).encode())]
+            )
+            connection.send_data(stream_id, body, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    paths[event.stream_id] = dict(event.headers)[b':path']
+                elif isinstance(event, h2.events.StreamEnded):
+                    self.max_open_streams = max(
+                        self.max_open_streams,
+                        len(connection.streams)
+                    )
+                    asyncio.create_task(
+                        respond(event.stream_id, paths.pop(event.stream_id))
+                    )
+            writer.write(connection.data_to_send())
+        writer.close()
+
+
+def test_requests_are_multiplexed() -> None:
+    """Concurrent requests should share a single connection"""
+
+    async def run() -> None:
+        handler = Server()
+        server = await asyncio.start_server(handler.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        connection = H2Connection(reader, writer, 'http', f'127.0.0.1:{port}')
+        responses = await asyncio.gather(*(
+            connection.request('GET', f'/users/{i}', [], None)
+            for i in range(50)
+        ))
+        for i, response in enumerate(responses):
+            assert response.status == 200
+            assert response.body == b'{"path": "/users/%d"}' % i
+        assert handler.connections == 1
+        assert handler.max_open_streams > 1
+
+        await connection.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+
+class PlainH2Pool(ConnectionPool):
+    """A pool which speaks HTTP/2 without TLS"""
+
+    def __init__(self) -> None:
+        super().__init__(http2=True)
+        self.connections = 0
+
+    async def _connect(self, key: HostKey, authority: str) -> Connection:
+        _scheme, hostname, port = key
+        reader, writer = await asyncio.open_connection(hostname, port)
+        self.connections += 1
+        return H2Connection(reader, writer, 'http', authority)
+
+
+def _serve(handler: Server) -> 'asyncio.Future[asyncio.AbstractServer]':
+    return asyncio.ensure_future(
+        asyncio.start_server(handler.handle, '127.0.0.1', 0)
+    )
+
+
+def test_stream_reset_keeps_connection() -> None:
+    """A reset stream should only fail its own request"""
+
+    async def run() -> None:
+        handler = Server(h2.errors.ErrorCodes.INTERNAL_ERROR)
+        server = await _serve(handler)
+        port = server.sockets[0].getsockname()[1]
+        url = f'http://127.0.0.1:{port}'
+
+        pool = PlainH2Pool()
+        results = await asyncio.gather(
+            *(pool.request('GET', f'{url}/users/{i}', [], None)
+              for i in range(10)),
+            pool.request('GET', f'{url}/reset', [], None),
+            return_exceptions=True
+        )
+        assert isinstance(results[-1], StreamResetError)
+        assert all(
+            getattr(response, 'status', None) == 200
+            for response in results[:-1]
+        )
+        response = await pool.request('GET', f'{url}/users/0', [], None)
+        assert response.status == 200
+        assert pool.connections == 1 and handler.connections == 1
+
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_refused_streams_are_retried_a_few_times() -> None:
+    """A request whose stream is always refused should not retry forever"""
+
+    async def run() -> None:
+        handler = Server(h2.errors.ErrorCodes.REFUSED_STREAM)
+        server = await _serve(handler)
+        port = server.sockets[0].getsockname()[1]
+
+        pool = PlainH2Pool()
+        with pytest.raises(RefusedStreamError):
+            await pool.request(
+                'GET',
+                f'http://127.0.0.1:{port}/reset',
+                [],
+                None
+            )
+        assert handler.resets == ConnectionPool.MAX_REFUSED_ATTEMPTS
+
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
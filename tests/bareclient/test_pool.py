@@ -0,0 +1,137 @@
+"""Tests for the connection pool"""
+
+import asyncio
+from typing import List, Optional
+
+import h11
+import pytest
+
+from jetblack_tweeter.clients.bareclient.pool import ConnectionPool
+
+
+class Server:
+    """A keep-alive HTTP/1.1 server which echoes the request target"""
+
+    def __init__(self, drop_request: Optional[int] = None) -> None:
+        self.connections = 0
+        self.targets: List[bytes] = []
+        # The number of the request after which the connection is dropped
+        # without a response.
+        self.drop_request = drop_request
+
+    async def handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle a connection"""
+        self.connections += 1
+        connection = h11.Connection(our_role=h11.SERVER)
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.Request):
+                self.targets.append(event.target)
+            elif isinstance(event, h11.EndOfMessage):
+                if len(self.targets) == self.drop_request:
+                    break
+                body = b'{"target": "%s"}' % self.targets[-1]
+                writer.write(connection.send(h11.Response(
+                    status_code=200,
+                    headers=[('content-length', str(len(body)))]
+                )))
+                writer.write(connection.send(h11.Data(data=body)))
+                writer.write(connection.send(h11.EndOfMessage()))
+                await writer.drain()
+                connection.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                break
+        writer.close()
+
+
+def test_connections_are_reused() -> None:
+    """Sequential requests should share a connection"""
+
+    async def run() -> None:
+        handler = Server()
+        server = await asyncio.start_server(handler.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        pool = ConnectionPool(max_per_host=2)
+        for i in range(5):
+            response = await pool.request(
+                'GET',
+                f'http://127.0.0.1:{port}/users?id={i}',
+                [],
+                None
+            )
+            assert response.status == 200
+            assert response.body == b'{"target": "/users?id=%d"}' % i
+        assert handler.connections == 1
+
+        responses = await asyncio.gather(*(
+            pool.request('GET', f'http://127.0.0.1:{port}/', [], None)
+            for _ in range(10)
+        ))
+        assert all(response.status == 200 for response in responses)
+        assert handler.connections == 2
+
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_idle_connections_expire() -> None:
+    """Connections idle for longer than the timeout should not be reused"""
+
+    async def run() -> None:
+        handler = Server()
+        server = await asyncio.start_server(handler.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        pool = ConnectionPool(idle_timeout=0.01)
+        await pool.request('GET', f'http://127.0.0.1:{port}/', [], None)
+        await asyncio.sleep(0.05)
+        await pool.request('GET', f'http://127.0.0.1:{port}/', [], None)
+        assert handler.connections == 2
+
+        await pool.close()
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run(run())
+
+
+def test_dropped_requests_are_retried_if_idempotent() -> None:
+    """Only idempotent requests should be resent when a reused connection
+    is dropped without a response.
+    """
+
+    async def run() -> None:
+        for method, retried in (('GET', True), ('POST', False)):
+            handler = Server(drop_request=2)
+            server = await asyncio.start_server(
+                handler.handle,
+                '127.0.0.1',
+                0
+            )
+            url = f'http://127.0.0.1:{server.sockets[0].getsockname()[1]}/'
+
+            pool = ConnectionPool()
+            await pool.request('GET', url, [], None)
+            if retried:
+                response = await pool.request(method, url, [], None)
+                assert response.status == 200
+            else:
+                with pytest.raises((ConnectionError, h11.RemoteProtocolError)):
+                    await pool.request(method, url, [], None)
+            assert len(handler.targets) == (3 if retried else 2)
+
+            await pool.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
@@ -1,6 +1,10 @@
 """Test for barclient utils"""
 
-from jetblack_tweeter.bareclient.utils import to_lines
+from jetblack_tweeter.clients.bareclient.utils import (
+    LengthFramer,
+    LineFramer,
+    to_lines
+)
 
 
 def test_to_lines() -> None:
@@ -16,3 +20,45 @@ def test_to_lines() -> None:
 
     lines, rest = to_lines(b'first\r\nsecond\r\nincomplete')
     assert lines == [b'first', b'second'] and rest == b'incomplete'
+
+
+def test_line_framer() -> None:
+    """Test for LineFramer"""
+    framer = LineFramer()
+    assert framer.feed(b'no line ending') == []
+    assert framer.feed(b' yet\r\nfirst\r\n\r\nincomplete') == [
+        b'no line ending yet', b'first', b''
+    ]
+    assert framer.feed(b'\r') == []
+    assert framer.feed(b'\nlast\r\n') == [b'incomplete', b'last']
+
+
+def test_line_framer_splits() -> None:
+    """Lines should be found wherever the chunks are split"""
+    data = b'{"id": 1}\r\n\r\n{"id": 22}\r\n{"id": 333}\r\n'
+    expected = data.split(b'\r\n')[:-1]
+    for size in range(1, len(data) + 1):
+        framer = LineFramer()
+        lines = [
+            line.tobytes()
+            for start in range(0, len(data), size)
+            for line in framer.feed(data[start:start + size])
+        ]
+        assert lines == expected
+
+
+def test_length_framer_splits() -> None:
+    """Messages should be found wherever the chunks are split"""
+    messages = [b'{"id": 1}\r\n', b'{"text": "line\\nbreak"}\r\n', b'[]\r\n']
+    data = b'\r\n'.join(
+        str(len(message)).encode() + b'\r\n' + message
+        for message in messages
+    )
+    for size in range(1, len(data) + 1):
+        framer = LengthFramer()
+        framed = [
+            message.tobytes()
+            for start in range(0, len(data), size)
+            for message in framer.feed(data[start:start + size])
+        ]
+        assert framed == messages
@@ -0,0 +1,123 @@
+"""A fake session for testing the clients"""
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional
+)
+
+from jetblack_tweeter.types import AbstractTweeterSession, ResponseCallback
+
+
+class FakeRequest(NamedTuple):
+    """A request made to the fake session"""
+    method: str
+    url: str
+    headers: Mapping[str, str]
+    body: Optional[str]
+    on_response: Optional[ResponseCallback]
+
+
+Handler = Callable[[FakeRequest], Awaitable[Any]]
+
+
+class FakeSession(AbstractTweeterSession):
+    """A session which records the requests and passes them to handlers"""
+
+    def __init__(
+            self,
+            *,
+            get: Optional[Handler] = None,
+            post: Optional[Handler] = None,
+            put: Optional[Handler] = None,
+            delete: Optional[Handler] = None
+    ) -> None:
+        self.requests: List[FakeRequest] = []
+        self._handlers = {
+            'GET': get,
+            'POST': post,
+            'PUT': put,
+            'DELETE': delete
+        }
+
+    @property
+    def urls(self) -> List[str]:
+        """The urls of the requests"""
+        return [request.url for request in self.requests]
+
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            headers: Mapping[str, str],
+            body: Optional[str],
+            on_response: Optional[ResponseCallback]
+    ) -> Any:
+        handler = self._handlers[method]
+        if handler is None:
+            raise NotImplementedError(method)
+        request = FakeRequest(method, url, headers, body, on_response)
+        self.requests.append(request)
+        return await handler(request)
+
+    async def stream(  # type: ignore
+            self,
+            url: str,
+            method: str,
+            headers: Mapping[str, str],
+            body: Optional[str],
+            *,
+            length_delimited: bool = False
+    ) -> AsyncIterator[Any]:
+        yield {}
+
+    async def get(
+            self,
+            url: str,
+            headers: Mapping[str, str],
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
+    ) -> Any:
+        return await self._request('GET', url, headers, None, on_response)
+
+    async def post(
+            self,
+            url: str,
+            headers: Mapping[str, str],
+            body: Optional[str],
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
+    ) -> Any:
+        return await self._request('POST', url, headers, body, on_response)
+
+    async def put(
+            self,
+            url: str,
+            headers: Mapping[str, str],
+            body: Optional[str],
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
+    ) -> Any:
+        return await self._request('PUT', url, headers, body, on_response)
+
+    async def delete(
+            self,
+            url: str,
+            headers: Mapping[str, str],
+            body: Optional[str],
+            timeout: Optional[float],
+            *,
+            on_response: Optional[ResponseCallback] = None
+    ) -> Any:
+        return await self._request('DELETE', url, headers, body, on_response)
+
+    async def close(self) -> None:
+        pass
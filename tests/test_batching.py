@@ -0,0 +1,116 @@
+"""Tests for batching single lookups"""
+
+import asyncio
+from typing import Any, List, Mapping, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from jetblack_tweeter.api import Statuses, Users
+from jetblack_tweeter.batching import BatchLoader
+from jetblack_tweeter.bearer_client import BearerHttpClient
+from jetblack_tweeter.errors import ApiError
+
+from fake_session import FakeRequest, FakeSession
+
+
+async def _lookup(request: FakeRequest) -> Any:
+    """Answer user and status lookups"""
+    parts = urlsplit(request.url)
+    query = parse_qs(parts.query)
+    if parts.path.endswith('/lookup.json'):
+        return [
+            {'id_str': status_id, 'text': status_id}
+            for status_id in query['id'][0].split(',')
+            if status_id != '404'
+        ]
+    if parts.path.endswith('/show.json'):
+        return {'id_str': query['id'][0]}
+    ids = query['ids'][0].split(',')
+    return {
+        'data': [
+            {'id': user_id, 'pinned_tweet_id': f'9{user_id}'}
+            for user_id in ids
+            if user_id != '404'
+        ],
+        'includes': {
+            'tweets': [
+                {'id': f'9{user_id}', 'text': 'pinned'}
+                for user_id in ids
+                if user_id != '404'
+            ]
+        },
+        'errors': [
+            {'value': '404', 'resource_type': 'user', 'title': 'Not Found'}
+        ] if '404' in ids else []
+    }
+
+
+def test_batch_loader() -> None:
+    """Keys should be batched by window and size, sharing duplicates"""
+
+    async def run() -> None:
+        batches: List[Sequence[int]] = []
+
+        async def load(keys: Sequence[int]) -> Mapping[int, int]:
+            batches.append(keys)
+            return {key: key * 10 for key in keys if key != 3}
+
+        loader: BatchLoader[int, int] = BatchLoader(load, max_batch_size=4)
+        results = await asyncio.gather(
+            *(loader.load(key) for key in [1, 2, 2, 1, 4, 5, 6]),
+        )
+        assert results == [10, 20, 20, 10, 40, 50, 60]
+        assert batches == [[1, 2, 4, 5], [6]]
+
+        with pytest.raises(KeyError):
+            await loader.load(3)
+
+    asyncio.run(run())
+
+
+def test_users_lookup_by_id_is_batched() -> None:
+    """Concurrent single lookups should share one bulk request"""
+
+    async def run() -> None:
+        session = FakeSession(get=_lookup)
+        client = BearerHttpClient(session, 'key', 'secret', bearer_token='token')
+        users = Users(client, batch_window=0.01)
+        one, two, missing = await asyncio.gather(
+            users.lookup_by_id('1', expansions=['pinned_tweet_id']),
+            users.lookup_by_id('2', expansions=['pinned_tweet_id']),
+            users.lookup_by_id('404', expansions=['pinned_tweet_id']),
+        )
+        assert len(session.urls) == 1
+        assert one['data']['id'] == '1'
+        assert one['includes']['tweets'] == [{'id': '91', 'text': 'pinned'}]
+        assert two['includes']['tweets'][0]['id'] == '92'
+        assert 'data' not in missing
+        assert missing['errors'][0]['title'] == 'Not Found'
+
+    asyncio.run(run())
+
+
+def test_statuses_show_is_batched() -> None:
+    """Concurrent shows should share one lookup, reporting missing ids"""
+
+    async def run() -> None:
+        session = FakeSession(get=_lookup)
+        client = BearerHttpClient(session, 'key', 'secret', bearer_token='token')
+        statuses = Statuses(client, batch_window=0.01)
+        one, two, missing = await asyncio.gather(
+            statuses.show(1),
+            statuses.show(2),
+            statuses.show(404),
+            return_exceptions=True
+        )
+        assert len(session.urls) == 1
+        assert '/lookup.json' in session.urls[0]
+        assert one == {'id_str': '1', 'text': '1'}
+        assert two == {'id_str': '2', 'text': '2'}
+        assert isinstance(missing, ApiError) and missing.code == 404
+
+        await statuses.show(3, include_my_retweet=True)
+        assert '/show.json' in session.urls[-1]
+
+    asyncio.run(run())
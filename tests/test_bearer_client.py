@@ -0,0 +1,54 @@
+"""Tests for the bearer token client"""
+
+import asyncio
+from typing import Any
+
+from jetblack_tweeter.bearer_client import BearerHttpClient
+from jetblack_tweeter.constants import URL_OAUTH2_TOKEN
+
+from fake_session import FakeRequest, FakeSession
+
+
+async def _respond(request: FakeRequest) -> Any:
+    await asyncio.sleep(0)
+    return {'data': []}
+
+
+async def _respond_with_token(request: FakeRequest) -> Any:
+    await asyncio.sleep(0)
+    assert request.body == 'grant_type=client_credentials'
+    return {'token_type': 'bearer', 'access_token': 'AAAA%2FAAA'}
+
+
+def test_token_is_fetched_once() -> None:
+    """The token should be requested once and sent as a bearer token"""
+
+    async def run() -> None:
+        session = FakeSession(get=_respond, post=_respond_with_token)
+        client = BearerHttpClient(session, 'key', 'secret')
+        await asyncio.gather(*(
+            client.get('https://api.twitter.com/2/users/by', {'usernames': name})
+            for name in ('jack', 'paulg', 'evhead')
+        ))
+
+        token_requests = [
+            request
+            for request in session.requests
+            if request.url == URL_OAUTH2_TOKEN
+        ]
+        assert len(token_requests) == 1
+        assert token_requests[0].headers['Authorization'] == 'Basic a2V5OnNlY3JldA=='
+
+        get_requests = [
+            request
+            for request in session.requests
+            if request.method == 'GET'
+        ]
+        assert len(get_requests) == 3
+        for request in get_requests:
+            assert request.url.startswith(
+                'https://api.twitter.com/2/users/by?usernames='
+            )
+            assert request.headers['Authorization'] == 'Bearer AAAA%2FAAA'
+
+    asyncio.run(run())
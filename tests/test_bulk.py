@@ -0,0 +1,87 @@
+"""Tests for chunked dispatch"""
+
+import asyncio
+from typing import AsyncIterator, List
+
+from jetblack_tweeter.bulk import dispatch_chunks, fan_out
+
+
+def test_dispatch_chunks_bounds_concurrency() -> None:
+    """Chunks should be dispatched with bounded concurrency, in order"""
+
+    async def run() -> None:
+        in_flight = 0
+        peak = 0
+
+        async def call(chunk: List[int]) -> List[int]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later chunks complete first.
+            await asyncio.sleep(0.01 * (4 - chunk[0] // 10))
+            in_flight -= 1
+            return chunk
+
+        results = [
+            chunk
+            async for chunk in dispatch_chunks(
+                range(25),
+                call,
+                size=10,
+                concurrency=2
+            )
+        ]
+        assert results == [
+            list(range(10)), list(range(10, 20)), list(range(20, 25))
+        ]
+        assert peak == 2
+
+        async def items() -> AsyncIterator[int]:
+            for item in range(40):
+                yield item
+
+        results = [
+            chunk
+            async for chunk in dispatch_chunks(
+                items(),
+                call,
+                size=10,
+                concurrency=4,
+                ordered=False
+            )
+        ]
+        assert [chunk[0] for chunk in results] == [30, 20, 10, 0]
+
+    asyncio.run(run())
+
+
+def test_fan_out_reports_errors() -> None:
+    """Calls should run concurrently, returning errors with their argument"""
+
+    async def run() -> None:
+        in_flight = 0
+        peak = 0
+
+        async def call(argument: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            if argument == 3:
+                raise ValueError('bad argument')
+            return argument * 2
+
+        results = [
+            item
+            async for item in fan_out(call, range(10), concurrency=3)
+        ]
+        assert peak == 3
+        assert sorted(
+            item.argument for item in results if item.error is None
+        ) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        failed = [item for item in results if item.error is not None]
+        assert failed[0].argument == 3
+        assert isinstance(failed[0].error, ValueError)
+
+    asyncio.run(run())
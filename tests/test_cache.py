@@ -0,0 +1,68 @@
+"""Tests for the response cache"""
+
+import asyncio
+import time
+from typing import Any
+
+from jetblack_tweeter.bearer_client import BearerHttpClient
+from jetblack_tweeter.cache import ResponseCache
+
+from fake_session import FakeRequest, FakeSession
+
+
+async def _respond(request: FakeRequest) -> Any:
+    return {'data': {'url': request.url}}
+
+
+def test_cache_lru_and_ttl() -> None:
+    """Responses should be evicted least recently used first and expire"""
+    cache = ResponseCache(
+        max_size=2,
+        ttls={'/2/users/:id': 60, '/1.1/statuses/home_timeline.json': 0.01}
+    )
+    cache.put('a', 'https://api.twitter.com/2/users/1', {'id': 1})
+    cache.put('b', 'https://api.twitter.com/2/users/2', {'id': 2})
+    assert cache.get('a') == {'id': 1}
+    cache.put('c', 'https://api.twitter.com/2/users/3', {'id': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'id': 1}
+    assert cache.stats.evictions == 1
+
+    cache.put(
+        'd',
+        'https://api.twitter.com/1.1/statuses/home_timeline.json',
+        []
+    )
+    time.sleep(0.02)
+    assert cache.get('d') is None
+    assert cache.stats.expirations == 1
+
+    assert cache.invalidate(endpoint='/2/users/:id') == 1
+    assert len(cache) == 0
+
+
+def test_client_uses_cache() -> None:
+    """Repeated gets should be served from the cache until invalidated"""
+
+    async def run() -> None:
+        session = FakeSession(get=_respond)
+        cache = ResponseCache()
+        client = BearerHttpClient(
+            session,
+            'key',
+            'secret',
+            bearer_token='token',
+            cache=cache
+        )
+        url = 'https://api.twitter.com/2/users/by/username/jack'
+        for _ in range(3):
+            await client.get(url, {'user.fields': 'created_at'})
+        await client.get(url, {'user.fields': 'location'})
+        assert len(session.urls) == 2
+        assert cache.stats.hits == 2
+
+        cache.invalidate(url=url)
+        await client.get(url, {'user.fields': 'created_at'})
+        assert len(session.urls) == 3
+
+    asyncio.run(run())
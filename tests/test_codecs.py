@@ -0,0 +1,30 @@
+"""Tests for the JSON codecs"""
+
+from typing import Type
+
+import pytest
+
+from jetblack_tweeter.codecs import (
+    AbstractJsonCodec,
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec
+)
+
+VALUE = {'data': {'id': '12', 'text': 'café \U0001F600', 'count': 3}}
+
+
+@pytest.mark.parametrize('codec_class', [JsonCodec, OrjsonCodec, MsgspecCodec])
+def test_codec(codec_class: Type[AbstractJsonCodec]) -> None:
+    """Codecs should decode bytes, memoryviews and strings"""
+    try:
+        codec = codec_class()
+    except ImportError:
+        pytest.skip(f'{codec_class.__name__} is not installed')
+
+    text = codec.dumps(VALUE)
+    assert isinstance(text, str)
+    data = text.encode()
+    assert codec.loads(data) == VALUE
+    assert codec.loads(memoryview(b'[' + data + b']')[1:-1]) == VALUE
+    assert codec.loads(text) == VALUE
@@ -0,0 +1,94 @@
+"""Tests for the hydration store"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, List
+from urllib.parse import parse_qs, urlsplit
+
+from jetblack_tweeter.api import Statuses, Users
+from jetblack_tweeter.bearer_client import BearerHttpClient
+from jetblack_tweeter.hydration import HydrationStore
+
+from fake_session import FakeRequest, FakeSession
+
+
+async def _lookup(request: FakeRequest) -> Any:
+    """Return an object for each requested id"""
+    parts = urlsplit(request.url)
+    query = parse_qs(parts.query)
+    if parts.path.endswith('/lookup.json'):
+        ids = query['id'][0].split(',')
+        return [{'id_str': id_str, 'text': id_str} for id_str in ids]
+    ids = query['ids'][0].split(',')
+    return {
+        'data': [
+            {'id': user_id, 'name': f'user {user_id}'}
+            for user_id in ids
+            if user_id != '404'
+        ],
+        'errors': [
+            {'value': user_id, 'title': 'Not Found Error'}
+            for user_id in ids
+            if user_id == '404'
+        ]
+    }
+
+
+def _requested(session: FakeSession) -> List[List[str]]:
+    """The ids of each request"""
+    queries = [parse_qs(urlsplit(url).query) for url in session.urls]
+    return [
+        (query.get('ids') or query['id'])[0].split(',')
+        for query in queries
+    ]
+
+
+def test_users_survive_restart(tmp_path: Path) -> None:
+    """Users fetched before a restart should not be fetched again"""
+
+    async def run() -> None:
+        path = str(tmp_path / 'hydration.db')
+        session = FakeSession(get=_lookup)
+        client = BearerHttpClient(session, 'key', 'secret', bearer_token='token')
+
+        store = HydrationStore(path)
+        users = Users(client, store)
+        response = await users.lookup_by_ids(['1', '2', '404'])
+        assert [user['id'] for user in response['data']] == ['1', '2']
+        assert response['errors'][0]['value'] == '404'
+        store.close()
+
+        store = HydrationStore(path)
+        users = Users(client, store)
+        response = await users.lookup_by_ids(['3', '2', '1'])
+        assert [user['id'] for user in response['data']] == ['3', '2', '1']
+        assert _requested(session) == [['1', '2', '404'], ['3']]
+
+        # Requesting other fields is a different variant.
+        await users.lookup_by_ids(['1'], user_fields=['location'])
+        assert _requested(session)[-1] == ['1']
+        store.close()
+
+    asyncio.run(run())
+
+
+def test_stale_statuses_are_refetched(tmp_path: Path) -> None:
+    """Statuses older than the maximum age should be fetched again"""
+
+    async def run() -> None:
+        session = FakeSession(get=_lookup)
+        client = BearerHttpClient(session, 'key', 'secret', bearer_token='token')
+        store = HydrationStore(str(tmp_path / 'hydration.db'))
+        statuses = Statuses(client, store)
+
+        tweets = await statuses.lookup([2, 1])
+        assert [tweet['id_str'] for tweet in tweets] == ['2', '1']
+        await statuses.lookup([1, 3])
+        assert _requested(session) == [['2', '1'], ['3']]
+
+        store.max_age = 0
+        await statuses.lookup([1])
+        assert _requested(session)[-1] == ['1']
+        store.close()
+
+    asyncio.run(run())
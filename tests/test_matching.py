@@ -0,0 +1,116 @@
+"""Tests for track matching"""
+
+import asyncio
+from typing import Any, AsyncIterator, List
+
+from jetblack_tweeter.api import Stream
+from jetblack_tweeter.matching import TrackMatcher
+
+
+def test_match_words() -> None:
+    """Terms should match whole words, ignoring case"""
+    matcher = TrackMatcher(['python', 'java'])
+    assert matcher.match('I like Python') == ['python']
+    assert matcher.match('JAVA and python') == ['python', 'java']
+    assert matcher.match('pythonic javascript python_3') == []
+    assert matcher.match('python, java.') == ['python', 'java']
+    assert matcher.match('') == []
+
+
+def test_match_phrases() -> None:
+    """Every word of a phrase should match, in any order"""
+    matcher = TrackMatcher(['rust lang', 'lang'])
+    assert matcher.match('the lang of rust') == ['rust lang', 'lang']
+    assert matcher.match('rust never sleeps') == []
+    assert matcher.match('a lang') == ['lang']
+
+
+def test_match_hashtags() -> None:
+    """Plain words should match hashtags, but not the reverse"""
+    matcher = TrackMatcher(['python', '#java', '$twtr'])
+    assert matcher.match('#python') == ['python']
+    assert matcher.match('@python') == ['python']
+    assert matcher.match('java') == []
+    assert matcher.match('#Java') == ['#java']
+    assert matcher.match('buy $TWTR') == ['$twtr']
+
+
+def test_match_overlapping_words() -> None:
+    """Words which share prefixes and suffixes should all be found"""
+    matcher = TrackMatcher(['he', 'she', 'hers', 'his'])
+    assert matcher.match('ushers') == []
+    assert matcher.match('she said hers not his') == ['she', 'hers', 'his']
+
+
+def test_match_message() -> None:
+    """The full text and urls of a tweet should be matched"""
+    matcher = TrackMatcher(['python', 'example'])
+    message = {
+        'id': 1,
+        'text': 'truncated…',
+        'extended_tweet': {
+            'full_text': 'truncated text about Python',
+            'entities': {
+                'urls': [{'expanded_url': 'https://example.com/page'}]
+            }
+        }
+    }
+    assert matcher.match_message(message) == ['python', 'example']
+
+
+
+def test_match_retweets_and_quotes() -> None:
+    """Retweets and quotes should match on the tweets they contain"""
+    matcher = TrackMatcher(['rust lang'])
+    original = {
+        'id': 1,
+        'text': 'truncated…',
+        'extended_tweet': {'full_text': 'Learning the Rust lang today'}
+    }
+    retweet = {
+        'id': 2,
+        'text': 'RT @someone: Learning the…',
+        'retweeted_status': original
+    }
+    quote = {'id': 3, 'text': 'So true', 'quoted_status': original}
+    assert matcher.match_message(retweet) == ['rust lang']
+    assert matcher.match_message(quote) == ['rust lang']
+    assert matcher.match_message({'id': 4, 'text': 'rust'}) == []
+
+
+class FakeClient:
+    """A client which streams fixed messages"""
+
+    def __init__(self, messages: List[Any]) -> None:
+        self.messages = messages
+
+    async def stream(
+            self,
+            url: str,
+            *args: Any,
+            **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        for message in self.messages:
+            yield message
+
+
+def test_stream_tag_matches() -> None:
+    """Filter streams should tag tweets with their matching terms"""
+    messages = [
+        {'id': 1, 'text': 'Python and rust'},
+        {'limit': {'track': 10}}
+    ]
+    stream = Stream(FakeClient(messages))  # type: ignore
+
+    async def follow() -> List[Any]:
+        return [
+            message
+            async for message in stream.filter(
+                track=['rust', 'python', 'java'],
+                tag_matches=True
+            )
+        ]
+
+    tagged = asyncio.run(follow())
+    assert tagged[0]['matching_terms'] == ['rust', 'python']
+    assert 'matching_terms' not in tagged[1]
@@ -0,0 +1,241 @@
+"""Tests for the stream multiplexer"""
+
+import asyncio
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+
+from jetblack_tweeter.errors import StreamError
+from jetblack_tweeter.multiplexer import (
+    MAX_FOLLOW,
+    MAX_LOCATIONS,
+    MAX_TRACK,
+    StreamMultiplexer
+)
+
+
+class FakeStream:
+    """A filter stream fed from a queue"""
+
+    def __init__(self) -> None:
+        self.opened: List[Any] = []
+        self.messages: 'asyncio.Queue[Any]' = asyncio.Queue()
+
+    async def filter(
+            self,
+            *,
+            track: Optional[List[str]],
+            follow: Optional[List[int]],
+            locations: Optional[List[Any]],
+            reconnect: Any
+    ) -> AsyncIterator[Any]:
+        self.opened.append((track, follow, locations))
+        while True:
+            message = await self.messages.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+
+def test_multiplexer_routes_messages() -> None:
+    """Subscriptions should share one debounced stream"""
+
+    async def run() -> None:
+        stream = FakeStream()
+        async with StreamMultiplexer(
+                stream,  # type: ignore
+                debounce=0.01
+        ) as multiplexer:
+            python = multiplexer.subscribe(track=['#Python', 'rust lang'])
+            java = multiplexer.subscribe(track=['java'], follow=[42])
+            await asyncio.sleep(0.05)
+            assert stream.opened == [
+                (['#python', 'java', 'rust lang'], [42], None)
+            ]
+
+            for message in (
+                    {'id': 1, 'text': 'I like #python'},
+                    {'id': 2, 'text': 'Java, not #java?'},
+                    {'id': 3, 'text': 'lang of rust', 'user': {'id': 42}},
+                    {'id': 4, 'text': 'python without a hash'},
+                    {'limit': {'track': 10}},
+            ):
+                stream.messages.put_nowait(message)
+            await asyncio.sleep(0.01)
+
+            java.close()
+            python_messages = []
+            async for message in python:
+                python_messages.append(message)
+                if len(python_messages) == 3:
+                    break
+            java_messages = [message async for message in java]
+
+            assert [message.get('id') for message in python_messages] == [
+                1, 3, None
+            ]
+            assert [message.get('id') for message in java_messages] == [
+                2, 3, None
+            ]
+
+            await asyncio.sleep(0.05)
+            assert stream.opened[-1] == (['#python', 'rust lang'], None, None)
+
+    asyncio.run(run())
+
+
+def test_max_queue_is_validated() -> None:
+    """A queue size below one should be rejected, not replaced"""
+
+    async def run() -> None:
+        with pytest.raises(ValueError):
+            StreamMultiplexer(FakeStream(), max_queue=0)  # type: ignore
+        multiplexer = StreamMultiplexer(FakeStream())  # type: ignore
+        with pytest.raises(ValueError):
+            multiplexer.subscribe(track=['python'], max_queue=0)
+        python = multiplexer.subscribe(track=['python'], max_queue=1)
+        assert python.max_queue == 1
+        assert multiplexer.subscribe(track=['java']).max_queue == 10000
+        await multiplexer.close()
+
+    asyncio.run(run())
+
+
+def test_upstream_failure_ends_its_subscriptions() -> None:
+    """A failed stream should end the subscriptions it was opened for, and
+    reopen for those added since.
+    """
+
+    async def run() -> None:
+        stream = FakeStream()
+        async with StreamMultiplexer(
+                stream,  # type: ignore
+                debounce=0.01
+        ) as multiplexer:
+            python = multiplexer.subscribe(track=['python'])
+            java = multiplexer.subscribe(track=['java'])
+            await asyncio.sleep(0.05)
+            rust = multiplexer.subscribe(track=['rust'])
+            stream.messages.put_nowait(StreamError('url', 401, {}))
+            await asyncio.sleep(0.05)
+
+            for subscription in (python, java):
+                with pytest.raises(StreamError):
+                    async for _message in subscription:
+                        pass
+            assert multiplexer.subscriptions == [rust]
+            assert stream.opened[-1] == (['rust'], None, None)
+
+    asyncio.run(run())
+
+
+def test_subscription_changes_are_debounced() -> None:
+    """A burst of changes should reopen the stream once"""
+
+    async def run() -> None:
+        stream = FakeStream()
+        async with StreamMultiplexer(
+                stream,  # type: ignore
+                debounce=0.02
+        ) as multiplexer:
+            subscriptions = [
+                multiplexer.subscribe(track=[f'term{index}'])
+                for index in range(10)
+            ]
+            for subscription in subscriptions[5:]:
+                await asyncio.sleep(0.001)
+                subscription.close()
+            await asyncio.sleep(0.1)
+            assert stream.opened == [
+                ([f'term{index}' for index in range(5)], None, None)
+            ]
+
+    asyncio.run(run())
+
+
+def test_filter_limits() -> None:
+    """Subscriptions beyond the limits of a filter stream should fail"""
+
+    async def run() -> None:
+        multiplexer = StreamMultiplexer(FakeStream())  # type: ignore
+        multiplexer.subscribe(track=[f'term{i}' for i in range(MAX_TRACK)])
+        with pytest.raises(ValueError):
+            multiplexer.subscribe(track=['one too many'])
+        # Duplicate terms are merged, so do not count.
+        multiplexer.subscribe(track=['TERM0'])
+
+        multiplexer.subscribe(follow=list(range(MAX_FOLLOW)))
+        with pytest.raises(ValueError):
+            multiplexer.subscribe(follow=[MAX_FOLLOW])
+
+        boxes = [
+            ((float(i), 0.0), (float(i) + 0.5, 1.0))
+            for i in range(MAX_LOCATIONS)
+        ]
+        multiplexer.subscribe(locations=boxes)
+        with pytest.raises(ValueError):
+            multiplexer.subscribe(locations=[((90.0, 0.0), (91.0, 1.0))])
+        assert len(multiplexer.subscriptions) == 4
+        await multiplexer.close()
+
+    asyncio.run(run())
+
+
+def test_locations_are_routed() -> None:
+    """Tweets should be routed by their coordinates, or else their place"""
+
+    async def run() -> None:
+        multiplexer = StreamMultiplexer(FakeStream())  # type: ignore
+        london = multiplexer.subscribe(
+            locations=[((-0.5, 51.3), (0.3, 51.7))]
+        )
+        paris = multiplexer.subscribe(locations=[((2.2, 48.8), (2.5, 48.9))])
+        place = {
+            'bounding_box': {
+                'coordinates': [[
+                    [2.0, 48.5], [2.0, 49.0], [3.0, 49.0], [3.0, 48.5]
+                ]]
+            }
+        }
+        for message in (
+                {'id': 1, 'coordinates': {'coordinates': [-0.1, 51.5]}},
+                {'id': 2, 'place': place},
+                # The coordinates take precedence over the place.
+                {
+                    'id': 3,
+                    'coordinates': {'coordinates': [-0.1, 51.5]},
+                    'place': place
+                },
+                {'id': 4, 'coordinates': {'coordinates': [10.0, 10.0]}},
+        ):
+            multiplexer.route(message)
+        await multiplexer.close()
+
+        assert [message['id'] async for message in london] == [1, 3]
+        assert [message['id'] async for message in paris] == [2]
+
+    asyncio.run(run())
+
+
+def test_slow_subscribers_drop_messages() -> None:
+    """Messages beyond the queue size should be dropped and counted"""
+
+    async def run() -> None:
+        multiplexer = StreamMultiplexer(
+            FakeStream(),  # type: ignore
+            debounce=0.01
+        )
+        slow = multiplexer.subscribe(track=['python'], max_queue=2)
+        fast = multiplexer.subscribe(track=['python'])
+        # Wait for the track terms to be compiled.
+        await asyncio.sleep(0.05)
+        for tweet_id in range(5):
+            multiplexer.route({'id': tweet_id, 'text': 'python'})
+        await multiplexer.close()
+
+        assert [message['id'] async for message in slow] == [0, 1]
+        assert slow.dropped == 3
+        assert [message['id'] async for message in fast] == [0, 1, 2, 3, 4]
+        assert fast.dropped == 0
+
+    asyncio.run(run())
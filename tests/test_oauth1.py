@@ -0,0 +1,112 @@
+"""Tests for the HMAC-SHA1 signer"""
+
+from urllib.parse import urlencode
+
+from oauthlib.oauth1 import Client as OAuth1Client
+
+from jetblack_tweeter.oauth1 import HmacSha1Signer
+
+CONSUMER_KEY = 'xvz1evFS4wEEPTGEFPHBog'
+CONSUMER_SECRET = 'kAcSOqF21Fu85e7zjz7ZN2U4ZRhfV3WpwPAoE3Z7kBw'
+ACCESS_TOKEN = '370773112-GmHxMAgYyLbNEtIKZeRNFsMKPR9EyMZeS9weJAEb'
+ACCESS_TOKEN_SECRET = 'LswwdoUaIvS8ltyTt5jkRh4J50vUPVVHtR2YPi5kE'
+NONCE = 'kYjzVBB8Y0ZFabxSWbWovY3uYSQ2pTgmZeNu2VS4cg'
+TIMESTAMP = '1318622958'
+
+
+def _oauthlib_sign(url, http_method, params, form, access_token, access_token_secret):
+    client = OAuth1Client(
+        CONSUMER_KEY,
+        client_secret=CONSUMER_SECRET,
+        resource_owner_key=access_token,
+        resource_owner_secret=access_token_secret,
+        nonce=NONCE,
+        timestamp=TIMESTAMP
+    )
+    return client.sign(
+        url + (f'?{urlencode(params)}' if params else ''),
+        http_method=http_method,
+        body=urlencode(form) if form else None,
+        headers={} if form is None else {
+            'content-type': 'application/x-www-form-urlencoded'
+        }
+    )
+
+
+def test_signatures_match_oauthlib() -> None:
+    """The fast signer should produce byte-identical results to oauthlib"""
+    cases = [
+        ('https://api.twitter.com/1.1/account/settings.json', 'GET', None, None),
+        (
+            'https://api.twitter.com/1.1/statuses/user_timeline.json',
+            'GET',
+            {'screen_name': 'jack', 'count': 200, 'trim_user': 'true'},
+            None
+        ),
+        (
+            'https://api.twitter.com/1.1/statuses/update.json',
+            'POST',
+            {
+                'status': 'Hello Ladies + Gentlemen, a signed OAuth request!',
+                'include_entities': True
+            },
+            None
+        ),
+        (
+            'https://api.twitter.com/2/users/by',
+            'GET',
+            {'usernames': 'jack,paulg', 'user.fields': 'id,name~x'},
+            None
+        ),
+        (
+            'https://stream.twitter.com/1.1/statuses/filter.json',
+            'POST',
+            None,
+            {
+                'track': '#python,café au lait',
+                'locations': '-122.75,36.8,-121.75,37.8',
+                'stall_warnings': 'true'
+            }
+        ),
+        ('HTTPS://API.Twitter.com:443/2/users/12/following', 'DELETE', {'a': ''}, None),
+    ]
+    for access_token, access_token_secret in [
+            (ACCESS_TOKEN, ACCESS_TOKEN_SECRET),
+            (None, None)
+    ]:
+        signer = HmacSha1Signer(
+            CONSUMER_KEY,
+            CONSUMER_SECRET,
+            access_token=access_token,
+            access_token_secret=access_token_secret
+        )
+        for url, http_method, params, form in cases:
+            expected = _oauthlib_sign(
+                url,
+                http_method,
+                params,
+                form,
+                access_token,
+                access_token_secret
+            )
+            actual = signer.sign(
+                url,
+                http_method,
+                params,
+                form,
+                {} if form is None else {
+                    'content-type': 'application/x-www-form-urlencoded'
+                },
+                nonce=NONCE,
+                timestamp=TIMESTAMP
+            )
+            assert actual == expected
+
+
+def test_nonces_are_unique() -> None:
+    """Each request should get a fresh nonce"""
+    signer = HmacSha1Signer(CONSUMER_KEY, CONSUMER_SECRET)
+    url = 'https://api.twitter.com/1.1/account/settings.json'
+    _, first, _ = signer.sign(url, 'GET')
+    _, second, _ = signer.sign(url, 'GET')
+    assert first['Authorization'] != second['Authorization']
@@ -0,0 +1,194 @@
+"""Tests for pagination"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, List, Mapping, Optional
+
+from jetblack_tweeter.pagination import MaxIdCursor, Paginator
+from jetblack_tweeter.utils import datetime_to_snowflake, snowflake_to_datetime
+
+PAGES: Mapping[Optional[str], Any] = {
+    None: {'data': [1, 2, 3], 'meta': {'next_token': 'b'}},
+    'b': {'data': [4, 5, 6], 'meta': {'next_token': 'c'}},
+    'c': {'data': [7], 'meta': {}},
+}
+
+
+def test_paginator() -> None:
+    """Tokens should be followed within the limits, and be resumable"""
+
+    async def run() -> None:
+        tokens: List[Optional[str]] = []
+
+        async def followers(
+                user_id: str,
+                *,
+                max_results: int,
+                pagination_token: Optional[str] = None
+        ) -> Any:
+            assert user_id == '42' and max_results == 3
+            tokens.append(pagination_token)
+            return PAGES[pagination_token]
+
+        paginator = Paginator(followers, '42', max_results=3)
+        assert [item async for item in paginator] == [1, 2, 3, 4, 5, 6, 7]
+        assert paginator.exhausted and paginator.page_count == 3
+
+        tokens.clear()
+        paginator = Paginator(followers, '42', max_results=3, max_items=5)
+        assert [item async for item in paginator] == [1, 2, 3, 4, 5]
+        assert tokens == [None, 'b']
+
+        paginator = Paginator(followers, '42', max_results=3, max_pages=1)
+        assert len([page async for page in paginator.pages()]) == 1
+        assert paginator.next_token == 'b'
+
+        resumed = Paginator(
+            followers,
+            '42',
+            max_results=3,
+            pagination_token=paginator.next_token
+        )
+        assert [item async for item in resumed] == [4, 5, 6, 7]
+
+    asyncio.run(run())
+
+
+def test_paginator_resume_within_page() -> None:
+    """Stopping part way through a page should not skip its other items"""
+
+    async def run() -> None:
+
+        async def followers(
+                user_id: str,
+                *,
+                pagination_token: Optional[str] = None
+        ) -> Any:
+            return PAGES[pagination_token]
+
+        paginator = Paginator(followers, '42', max_items=5)
+        assert [item async for item in paginator] == [1, 2, 3, 4, 5]
+        assert paginator.next_token == 'b' and paginator.page_offset == 2
+        assert not paginator.exhausted
+
+        resumed = Paginator(
+            followers,
+            '42',
+            pagination_token=paginator.next_token,
+            page_offset=paginator.page_offset
+        )
+        assert [item async for item in resumed] == [6, 7]
+
+        paginator = Paginator(followers, '42', prefetch_depth=2)
+        items = paginator.items()
+        assert await items.__anext__() == 1
+        await items.aclose()  # type: ignore
+        assert paginator.next_token is None and paginator.page_offset == 1
+        assert [item async for item in Paginator(
+            followers,
+            '42',
+            pagination_token=paginator.next_token,
+            page_offset=paginator.page_offset
+        )] == [2, 3, 4, 5, 6, 7]
+
+    asyncio.run(run())
+
+
+def test_paginator_prefetch() -> None:
+    """Pages should be requested while the previous page is processed"""
+
+    async def run() -> None:
+        tokens: List[Optional[str]] = []
+
+        async def timeline(
+                user_id: str,
+                *,
+                pagination_token: Optional[str] = None
+        ) -> Any:
+            tokens.append(pagination_token)
+            await asyncio.sleep(0.01)
+            return PAGES[pagination_token]
+
+        paginator = Paginator(timeline, '42', prefetch_depth=1)
+        pages = paginator.pages()
+        page = await pages.__anext__()
+        assert page['data'] == [1, 2, 3]
+        await asyncio.sleep(0.015)
+        # The next page was requested, but the checkpoint is unchanged.
+        assert tokens == [None, 'b']
+        assert paginator.next_token == 'b'
+        assert [page['data'] async for page in pages] == [[4, 5, 6], [7]]
+        assert paginator.exhausted
+
+    asyncio.run(run())
+
+
+def test_max_id_cursor() -> None:
+    """Timelines should be walked backwards to the floor without duplicates"""
+
+    async def run() -> None:
+        timeline = [{'id': tweet_id} for tweet_id in range(100, 0, -1)]
+        requests: List[Any] = []
+
+        async def user_timeline(
+                *,
+                screen_name: str,
+                count: int,
+                max_id: Optional[int] = None,
+                since_id: Optional[int] = None
+        ) -> Any:
+            requests.append((max_id, since_id))
+            tweets = [
+                tweet
+                for tweet in timeline
+                if (since_id is None or tweet['id'] > since_id) and
+                # Include the edge, as a misbehaving endpoint might.
+                (max_id is None or tweet['id'] <= max_id + 1)
+            ]
+            return tweets[:count]
+
+        cursor = MaxIdCursor(user_timeline, screen_name='jack', count=30)
+        ids = [tweet['id'] async for tweet in cursor]
+        assert ids == list(range(100, 0, -1))
+        assert cursor.exhausted
+
+        requests.clear()
+        cursor = MaxIdCursor(
+            user_timeline,
+            screen_name='jack',
+            count=30,
+            since_id=50,
+            prefetch_depth=2
+        )
+        ids = [tweet['id'] async for tweet in cursor]
+        assert ids == list(range(100, 50, -1))
+        assert all(since_id == 50 for _max_id, since_id in requests)
+
+        cursor = MaxIdCursor(
+            user_timeline,
+            screen_name='jack',
+            count=30,
+            max_items=40
+        )
+        ids = [tweet['id'] async for tweet in cursor]
+        assert ids == list(range(100, 60, -1))
+        assert cursor.max_id == 60
+
+        resumed = MaxIdCursor(
+            user_timeline,
+            screen_name='jack',
+            count=30,
+            max_id=cursor.max_id
+        )
+        ids = [tweet['id'] async for tweet in resumed]
+        assert ids == list(range(60, 0, -1))
+
+    asyncio.run(run())
+
+
+def test_snowflake_dates() -> None:
+    """Tweet ids should be converted to and from times"""
+    created_at = datetime(2022, 10, 27, 12, 0, tzinfo=timezone.utc)
+    tweet_id = datetime_to_snowflake(created_at)
+    assert snowflake_to_datetime(tweet_id) == created_at
+    assert snowflake_to_datetime(tweet_id - 1) < created_at
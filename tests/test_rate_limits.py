@@ -0,0 +1,104 @@
+"""Tests for rate limit tracking"""
+
+import asyncio
+import time
+from typing import Any, List
+
+from jetblack_tweeter.bearer_client import BearerHttpClient
+from jetblack_tweeter.rate_limits import RateLimitTracker, endpoint_template
+
+from fake_session import FakeRequest, FakeSession
+
+
+def test_endpoint_template() -> None:
+    """Ids and usernames should be replaced by placeholders"""
+    assert endpoint_template(
+        'https://api.twitter.com/2/users/12/tweets?max_results=5'
+    ) == '/2/users/:id/tweets'
+    assert endpoint_template(
+        'https://api.twitter.com/2/users/by/username/jack'
+    ) == '/2/users/by/username/:username'
+    assert endpoint_template(
+        'https://api.twitter.com/1.1/statuses/destroy/1234.json'
+    ) == '/1.1/statuses/destroy/:id.json'
+    assert endpoint_template(
+        'https://api.twitter.com/1.1/statuses/user_timeline.json'
+    ) == '/1.1/statuses/user_timeline.json'
+
+
+class LimitedWindow:
+    """A rate limit which allows two requests in a window"""
+
+    def __init__(self, reset: float) -> None:
+        self.reset = reset
+        self.remaining = 2
+        self.request_times: List[float] = []
+
+    async def respond(self, request: FakeRequest) -> Any:
+        """Respond to a request within the limit"""
+        self.request_times.append(time.time())
+        if time.time() >= self.reset:
+            self.remaining = 2
+        self.remaining -= 1
+        assert self.remaining >= 0, 'rate limit exceeded'
+        assert request.on_response is not None
+        request.on_response(200, {
+            'x-rate-limit-limit': '2',
+            'x-rate-limit-remaining': str(self.remaining),
+            'x-rate-limit-reset': str(self.reset)
+        })
+        return {'data': []}
+
+
+def test_requests_are_paced() -> None:
+    """Requests should wait for an exhausted limit to reset"""
+
+    async def run() -> None:
+        window = LimitedWindow(time.time() + 0.2)
+        session = FakeSession(get=window.respond)
+        tracker = RateLimitTracker(reset_margin=0)
+        client = BearerHttpClient(
+            session,
+            'key',
+            'secret',
+            bearer_token='token',
+            rate_limits=tracker
+        )
+        for user_id in range(3):
+            await client.get(f'https://api.twitter.com/2/users/{user_id}')
+
+        assert window.request_times[2] >= window.reset
+        rate_limit = tracker.get('app:key', '/2/users/:id')
+        assert rate_limit is not None and rate_limit.limit == 2
+
+    asyncio.run(run())
+
+
+def test_reset_lets_one_request_probe() -> None:
+    """After a reset only one request should go until the limit is known"""
+
+    async def run() -> None:
+        tracker = RateLimitTracker(reset_margin=0)
+        reset = str(time.time() - 1)
+        tracker.update('app:key', '/2/users/:id', {
+            'x-rate-limit-limit': '10',
+            'x-rate-limit-remaining': '0',
+            'x-rate-limit-reset': reset
+        })
+        tasks = [
+            asyncio.ensure_future(tracker.acquire('app:key', '/2/users/:id'))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        assert sum(task.done() for task in tasks) == 1
+
+        tracker.update('app:key', '/2/users/:id', {
+            'x-rate-limit-limit': '10',
+            'x-rate-limit-remaining': '9',
+            'x-rate-limit-reset': str(time.time() + 900)
+        })
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        rate_limit = tracker.get('app:key', '/2/users/:id')
+        assert rate_limit is not None and rate_limit.remaining == 5
+
+    asyncio.run(run())
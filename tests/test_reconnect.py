@@ -0,0 +1,123 @@
+"""Tests for reconnecting streams"""
+
+import asyncio
+import socket
+import ssl
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from jetblack_tweeter.errors import StreamError
+from jetblack_tweeter.reconnect import ReconnectEvent, ReconnectPolicy
+
+
+def test_reconnect_delays() -> None:
+    """The backoff should depend on the type of failure"""
+    policy = ReconnectPolicy()
+    assert policy.delay(ConnectionError(), 1) == 0.25
+    assert policy.delay(None, 3) == 0.75
+    assert policy.delay(ConnectionError(), 100) == 16
+    assert policy.delay(OSError('server disconnected'), 1) == 0.25
+    assert policy.delay(socket.gaierror(), 2) == 0.5
+    assert policy.delay(ssl.SSLError(), 1) == 0.25
+    assert policy.delay(ssl.SSLCertVerificationError(), 1) is None
+    assert policy.delay(StreamError('url', 503, {}), 1) == 5
+    assert policy.delay(StreamError('url', 503, {}), 3) == 20
+    assert policy.delay(StreamError('url', 503, {}), 10) == 320
+    assert policy.delay(StreamError('url', 420, {}), 1) == 60
+    assert policy.delay(StreamError('url', 429, {}), 2) == 120
+    assert policy.delay(StreamError('url', 401, {}), 1) is None
+    assert policy.delay(ValueError(), 1) is None
+
+
+def test_reconnect_run() -> None:
+    """Streams should be reconnected until a fatal error"""
+
+    async def run() -> None:
+        failures: List[BaseException] = [
+            ConnectionError('reset'),
+            StreamError('url', 503, {}),
+            StreamError('url', 401, {}),
+        ]
+        connections = 0
+
+        async def connect() -> AsyncIterator[Any]:
+            nonlocal connections
+            connections += 1
+            yield connections
+            raise failures.pop(0)
+
+        events: List[ReconnectEvent] = []
+        policy = ReconnectPolicy(network_step=0.001, http_base=0.002)
+        messages: List[Any] = []
+        with pytest.raises(StreamError) as error:
+            async for message in policy.run(connect, events.append):
+                messages.append(message)
+        assert error.value.code == 401
+        assert messages == [1, 2, 3]
+        # The backoff is reset by each message.
+        assert [(event.attempt, event.delay) for event in events] == [
+            (1, 0.001),
+            (1, 0.002)
+        ]
+
+    asyncio.run(run())
+
+
+def test_reconnect_run_os_error() -> None:
+    """A stream dropped mid-read, as bareclient reports it, is reconnected"""
+
+    async def run() -> None:
+        connections = 0
+
+        async def connect() -> AsyncIterator[Any]:
+            nonlocal connections
+            connections += 1
+            yield connections
+            if connections < 3:
+                raise OSError('server disconnected')
+            raise StreamError('url', 401, {})
+
+        events: List[ReconnectEvent] = []
+        policy = ReconnectPolicy(network_step=0.001)
+        messages: List[Any] = []
+        with pytest.raises(StreamError):
+            async for message in policy.run(connect, events.append):
+                messages.append(message)
+        assert messages == [1, 2, 3]
+        assert [type(event.error) for event in events] == [OSError, OSError]
+
+    asyncio.run(run())
+
+
+def test_reconnect_backoff_by_failure_type() -> None:
+    """Each type of failure should back off from its own floor"""
+
+    async def run() -> None:
+        failures: List[BaseException] = [
+            ConnectionError('reset'),
+            ConnectionError('reset'),
+            ConnectionError('reset'),
+            StreamError('url', 503, {}),
+            StreamError('url', 503, {}),
+            StreamError('url', 401, {}),
+        ]
+
+        async def connect() -> AsyncIterator[Any]:
+            raise failures.pop(0)
+            yield  # pylint: disable=unreachable
+
+        events: List[ReconnectEvent] = []
+        policy = ReconnectPolicy(network_step=0.001, http_base=0.002)
+        with pytest.raises(StreamError):
+            async for _message in policy.run(connect, events.append):
+                pass
+        assert [(event.attempt, event.delay) for event in events] == [
+            (1, 0.001),
+            (2, 0.002),
+            (3, 0.003),
+            (1, 0.002),
+            (2, 0.004)
+        ]
+
+    asyncio.run(run())
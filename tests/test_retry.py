@@ -0,0 +1,88 @@
+"""Tests for retrying requests"""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from jetblack_tweeter.auth_client import AuthenticatedHttpClient
+from jetblack_tweeter.errors import ApiError
+from jetblack_tweeter.retry import RetryPolicy, RetryRule
+
+from fake_session import FakeRequest, FakeSession
+
+FAST_RULES = [
+    RetryRule(exceptions=(ConnectionError,), base_delay=0.001),
+    RetryRule(status_codes=(503,), max_attempts=3, base_delay=0.001),
+]
+
+
+def _failing_session(errors: List[Exception]) -> FakeSession:
+    """Make a session which fails a number of times before succeeding"""
+
+    async def respond(request: FakeRequest) -> Any:
+        await asyncio.sleep(0)
+        if errors:
+            raise errors.pop(0)
+        return {'data': []}
+
+    return FakeSession(get=respond, post=respond)
+
+
+def _authorizations(session: FakeSession) -> List[str]:
+    return [request.headers['Authorization'] for request in session.requests]
+
+
+def _make_client(session: FakeSession) -> AuthenticatedHttpClient:
+    return AuthenticatedHttpClient(
+        session,
+        'key',
+        'secret',
+        access_token='token',
+        access_token_secret='token-secret',
+        fast_signing=True,
+        retry_policy=RetryPolicy(rules=FAST_RULES)
+    )
+
+
+def test_retries_are_signed_again() -> None:
+    """Transient errors should be retried with a fresh signature"""
+
+    async def run() -> None:
+        session = _failing_session([
+            ConnectionError('reset'),
+            ApiError('url', 503, {}),
+        ])
+        client = _make_client(session)
+        assert await client.get('https://api.twitter.com/2/users/12') == {
+            'data': []
+        }
+        assert len(_authorizations(session)) == 3
+        assert len(set(_authorizations(session))) == 3
+
+    asyncio.run(run())
+
+
+def test_retries_are_limited() -> None:
+    """Errors should be raised when the attempts are exhausted, or when
+    there is no matching rule, or the method is not idempotent"""
+
+    async def run() -> None:
+        session = _failing_session([ApiError('url', 503, {})] * 3)
+        with pytest.raises(ApiError):
+            await _make_client(session).get('https://api.twitter.com/2/users/12')
+        assert len(_authorizations(session)) == 3
+
+        session = _failing_session([ApiError('url', 404, {})])
+        with pytest.raises(ApiError):
+            await _make_client(session).get('https://api.twitter.com/2/users/12')
+        assert len(_authorizations(session)) == 1
+
+        session = _failing_session([ConnectionError('reset')])
+        with pytest.raises(ConnectionError):
+            await _make_client(session).post(
+                'https://api.twitter.com/1.1/statuses/update.json'
+            )
+        assert len(_authorizations(session)) == 1
+
+    asyncio.run(run())
@@ -0,0 +1,66 @@
+"""Tests for coalescing requests"""
+
+import asyncio
+from typing import Any
+
+from jetblack_tweeter.bearer_client import BearerHttpClient
+from jetblack_tweeter.single_flight import SingleFlight
+
+from fake_session import FakeRequest, FakeSession
+
+
+async def _respond_slowly(request: FakeRequest) -> Any:
+    await asyncio.sleep(0.01)
+    return {'data': {'url': request.url}}
+
+
+def test_identical_gets_are_coalesced() -> None:
+    """Concurrent gets with the same url and params should share a request"""
+
+    async def run() -> None:
+        session = FakeSession(get=_respond_slowly)
+        client = BearerHttpClient(
+            session,
+            'key',
+            'secret',
+            bearer_token='token',
+            coalesce_gets=True
+        )
+        url = 'https://api.twitter.com/2/users/12'
+        responses = await asyncio.gather(
+            *(client.get(url, {'user.fields': 'created_at'}) for _ in range(10)),
+            client.get(url, {'user.fields': 'location'})
+        )
+        assert len(session.urls) == 2
+        assert all(response is responses[0] for response in responses[:10])
+        assert responses[10] is not responses[0]
+
+        # Completed requests are not reused.
+        await client.get(url, {'user.fields': 'created_at'})
+        assert len(session.urls) == 3
+
+    asyncio.run(run())
+
+
+def test_cancelled_caller() -> None:
+    """Cancelling one caller should not cancel the shared call"""
+
+    async def run() -> None:
+        group: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        first = asyncio.create_task(group.run('key', call))
+        second = asyncio.create_task(group.run('key', call))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 42
+        assert calls == 1
+        assert len(group) == 0
+
+    asyncio.run(run())
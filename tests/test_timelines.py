@@ -0,0 +1,129 @@
+"""Tests for the timeline watcher"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Any, Dict, List, Optional
+
+from jetblack_tweeter.pacing import TokenBucket
+from jetblack_tweeter.timelines import TimelineUpdate, TimelineWatcher
+from jetblack_tweeter.utils import datetime_to_snowflake
+
+
+class FakeStatuses:
+    """A user timeline where one user tweets on every poll"""
+
+    def __init__(self) -> None:
+        self.since_ids: Dict[str, List[Optional[int]]] = {
+            'busy': [],
+            'quiet': []
+        }
+        self._next_id = datetime_to_snowflake(
+            datetime.now(timezone.utc) - timedelta(seconds=10)
+        )
+
+    async def user_timeline(
+            self,
+            *,
+            screen_name: str,
+            user_id: Optional[str],
+            since_id: Optional[int],
+            count: int
+    ) -> Any:
+        self.since_ids[screen_name].append(since_id)
+        if screen_name == 'quiet':
+            return []
+        self._next_id += 3
+        return [{'id': self._next_id - offset} for offset in range(3)]
+
+
+def test_token_bucket() -> None:
+    """Tokens should be taken at the rate after the initial burst"""
+
+    async def run() -> None:
+        bucket = TokenBucket(100, capacity=2)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert 0.025 <= time.monotonic() - start < 0.1
+
+    asyncio.run(run())
+
+
+def test_timeline_watcher_adapts() -> None:
+    """Busy users should be polled more often, from their newest tweet"""
+
+    async def run() -> None:
+        statuses = FakeStatuses()
+        watcher = TimelineWatcher(
+            statuses,  # type: ignore
+            min_interval=0.01,
+            max_interval=0.1,
+            target_per_poll=0.001
+        )
+        watcher.watch(screen_name='busy')
+        watcher.watch(screen_name='quiet', since_id=42)
+
+        updates: List[TimelineUpdate] = []
+
+        async def consume() -> None:
+            async for update in watcher.updates():
+                updates.append(update)
+
+        try:
+            await asyncio.wait_for(consume(), 0.2)
+        except asyncio.TimeoutError:
+            pass
+
+        busy, quiet = statuses.since_ids['busy'], statuses.since_ids['quiet']
+        assert len(busy) > 2 * len(quiet)
+        assert busy[0] is None
+        assert busy[1] == updates[0].tweets[0]['id']
+        assert set(quiet) == {42}
+        assert all(update.user == 'busy' for update in updates)
+        assert watcher.users['quiet'].interval > watcher.users['busy'].interval
+
+    asyncio.run(run())
+
+
+def test_timeline_watcher_reads_back_full_pages() -> None:
+    """When a poll returns a full page the missed tweets should be read"""
+
+    async def run() -> None:
+        requests: List[Any] = []
+
+        async def user_timeline(
+                *,
+                screen_name: str,
+                user_id: Optional[str],
+                since_id: Optional[int],
+                count: int,
+                max_id: Optional[int] = None
+        ) -> Any:
+            requests.append((since_id, max_id))
+            return [
+                {'id': tweet_id}
+                for tweet_id in range(110, 100, -1)
+                if tweet_id > since_id and (
+                    max_id is None or tweet_id <= max_id
+                )
+            ][:count]
+
+        statuses = FakeStatuses()
+        statuses.user_timeline = user_timeline  # type: ignore
+        watcher = TimelineWatcher(
+            statuses,  # type: ignore
+            count=3,
+            min_interval=10
+        )
+        watcher.watch(screen_name='busy', since_id=100)
+        updates = watcher.updates()
+        update = await updates.__anext__()
+        await updates.aclose()  # type: ignore
+
+        assert [tweet['id'] for tweet in update.tweets] == list(
+            range(110, 100, -1)
+        )
+        assert requests[:2] == [(100, None), (100, 107)]
+
+    asyncio.run(run())